@@ -0,0 +1,99 @@
+"""
+Benchmark resolving the $refs of a large specification.
+
+Generates a specification whose operations reference schemas in an external file, where each
+schema references the next one, and reports the time and memory it takes to resolve it.
+
+Usage: python benchmarks/resolve_refs.py [--operations 500] [--schemas 60] [--repeat 5]
+"""
+
+import argparse
+import pathlib
+import tempfile
+import time
+import tracemalloc
+
+import yaml
+
+from connexion.json_schema import document_cache, resolve_refs
+
+
+def build_components(schemas: int) -> dict:
+    components = {}
+    for i in range(schemas):
+        properties = {"name": {"type": "string"}, "count": {"type": "integer"}}
+        if i + 1 < schemas:
+            properties["next"] = {"$ref": f"#/Schema{i + 1}"}
+        components[f"Schema{i}"] = {"type": "object", "properties": properties}
+    # A recursive schema
+    components["Node"] = {
+        "type": "object",
+        "properties": {"children": {"type": "array", "items": {"$ref": "#/Node"}}},
+    }
+    return components
+
+
+def build_spec(operations: int, schemas: int) -> dict:
+    paths = {}
+    for i in range(operations):
+        schema = {"$ref": f"components.yaml#/Schema{i % schemas}"}
+        paths[f"/op{i}"] = {
+            "post": {
+                "operationId": f"api.op{i}",
+                "requestBody": {"content": {"application/json": {"schema": schema}}},
+                "responses": {
+                    "200": {
+                        "description": "OK",
+                        "content": {
+                            "application/json": {
+                                "schema": {"$ref": "components.yaml#/Node"}
+                            }
+                        },
+                    }
+                },
+            }
+        }
+    return {
+        "openapi": "3.0.0",
+        "info": {"title": "Benchmark", "version": "1"},
+        "paths": paths,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--operations", type=int, default=500)
+    parser.add_argument("--schemas", type=int, default=60)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = pathlib.Path(directory)
+        (path / "components.yaml").write_text(
+            yaml.safe_dump(build_components(args.schemas))
+        )
+        spec = build_spec(args.operations, args.schemas)
+        base_uri = f"{path.as_uri()}/"
+
+        timings = []
+        for _ in range(args.repeat):
+            # Measure the resolution, not the loading of the external document
+            resolve_refs(spec, base_uri=base_uri)
+            start = time.perf_counter()
+            resolve_refs(spec, base_uri=base_uri)
+            timings.append(time.perf_counter() - start)
+
+        tracemalloc.start()
+        resolved = resolve_refs(spec, base_uri=base_uri)
+        retained, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        document_cache.clear()
+
+    print(f"operations: {args.operations}, schemas: {args.schemas}")
+    print(f"resolve: best {min(timings) * 1000:.1f}ms of {args.repeat}")
+    print(f"memory: retained {retained / 2**20:.1f}MiB, peak {peak / 2**20:.1f}MiB")
+    assert len(resolved["paths"]) == args.operations
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,8 @@ REST API in as much detail as you want; then Connexion guarantees that it will w
 specified.
 """
 
+import typing as t
+
 from .apps import AbstractApp  # NOQA
 from .apps.asynchronous import AsyncApp
 from .datastructures import NoContent  # NOQA
@@ -15,18 +17,37 @@ from .problem import problem  # NOQA
 from .resolver import Resolution, Resolver, RestyResolver  # NOQA
 from .utils import not_installed_error  # NOQA
 
-try:
+if t.TYPE_CHECKING:
     from connexion.apps.flask import FlaskApi, FlaskApp
-except ImportError as e:  # pragma: no cover
-    _flask_not_installed_error = not_installed_error(
-        e, msg="Please install connexion using the 'flask' extra"
-    )
-    FlaskApi = _flask_not_installed_error  # type: ignore
-    FlaskApp = _flask_not_installed_error  # type: ignore
+
+    App = FlaskApp
+    Api = FlaskApi
 
 from connexion.apps.asynchronous import AsyncApi, AsyncApp
 from connexion.context import request
 from connexion.middleware import ConnexionMiddleware
 
-App = FlaskApp
-Api = FlaskApi
+# Flask is imported on first access of these attributes, so it's only loaded when it's used
+_FLASK_ATTRIBUTES = {
+    "FlaskApp": "FlaskApp",
+    "FlaskApi": "FlaskApi",
+    "App": "FlaskApp",
+    "Api": "FlaskApi",
+}
+
+
+def __getattr__(name: str) -> t.Any:
+    if name not in _FLASK_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    try:
+        from connexion.apps import flask
+    except ImportError as e:  # pragma: no cover
+        value = not_installed_error(
+            e, msg="Please install connexion using the 'flask' extra"
+        )
+    else:
+        value = getattr(flask, _FLASK_ATTRIBUTES[name])
+
+    globals()[name] = value
+    return value
@@ -6,15 +6,15 @@ import abc
 import pathlib
 import typing as t
 
-from starlette.testclient import TestClient
 from starlette.types import ASGIApp, Receive, Scope, Send
 
 from connexion.jsonifier import Jsonifier
 from connexion.lifecycle import ConnexionRequest, ConnexionResponse
 from connexion.middleware import ConnexionMiddleware, MiddlewarePosition, SpecMiddleware
 from connexion.middleware.lifespan import Lifespan
-from connexion.options import SwaggerUIOptions
+from connexion.options import HTTPClientOptions, SwaggerUIOptions, ThreadPoolOptions
 from connexion.resolver import Resolver
+from connexion.security import SecurityHook
 from connexion.types import MaybeAwaitable
 from connexion.uri_parsing import AbstractURIParser
 
@@ -39,6 +39,12 @@ class AbstractApp:
         lifespan: t.Optional[Lifespan] = None,
         middlewares: t.Optional[list] = None,
         specification_dir: t.Union[pathlib.Path, str] = "",
+        spec_cache_dir: t.Optional[t.Union[pathlib.Path, str]] = None,
+        profile_startup: t.Optional[bool] = None,
+        reload_interval: t.Optional[float] = None,
+        http_client_options: t.Optional[HTTPClientOptions] = None,
+        security_thread_pool_options: t.Optional[ThreadPoolOptions] = None,
+        security_hooks: t.Optional[t.List[SecurityHook]] = None,
         arguments: t.Optional[dict] = None,
         auth_all_paths: t.Optional[bool] = None,
         jsonifier: t.Optional[Jsonifier] = None,
@@ -62,6 +68,22 @@ class AbstractApp:
         :param specification_dir: The directory holding the specification(s). The provided path
             should either be absolute or relative to the root path of the application. Defaults to
             the root path.
+        :param spec_cache_dir: Directory to cache loaded specifications in, so later starts can
+            skip parsing, validating and resolving them. The provided path should either be
+            absolute or relative to the root path of the application. Disabled by default.
+        :param profile_startup: Whether to profile the startup of the application. The report is
+            available via :attr:`middleware.startup_profiler`. Defaults to the
+            ``CONNEXION_PROFILE_STARTUP`` environment variable.
+        :param reload_interval: Interval in seconds at which to check the specification files for
+            changes while the application is running. Changed specifications are reloaded, and
+            only the operations that changed are rebuilt. See :meth:`reload`. Disabled by default.
+        :param http_client_options: Instance of :class:`options.HTTPClientOptions` to configure
+            the HTTP client shared by the security handlers, for instance to call token info
+            urls.
+        :param security_thread_pool_options: Instance of :class:`options.ThreadPoolOptions` to
+            configure the thread pool in which synchronous security functions are run.
+        :param security_hooks: Callables which are called with a :class:`security.SecurityEvent`
+            after each verification of a security scheme, for instance to record metrics.
         :param arguments: Arguments to substitute the specification using Jinja.
         :param auth_all_paths: whether to authenticate not paths not defined in the specification.
             Defaults to False.
@@ -91,6 +113,12 @@ class AbstractApp:
             lifespan=lifespan,
             middlewares=middlewares,
             specification_dir=specification_dir,
+            spec_cache_dir=spec_cache_dir,
+            profile_startup=profile_startup,
+            reload_interval=reload_interval,
+            http_client_options=http_client_options,
+            security_thread_pool_options=security_thread_pool_options,
+            security_hooks=security_hooks,
             arguments=arguments,
             auth_all_paths=auth_all_paths,
             jsonifier=jsonifier,
@@ -273,8 +301,28 @@ class AbstractApp:
     def test_client(self, **kwargs):
         """Creates a test client for this application. The keywords arguments passed in are
         passed to the ``StarletteClient``."""
+        from starlette.testclient import TestClient
+
         return TestClient(self, **kwargs)
 
+    def warm_up(self, *, freeze: bool = True) -> None:
+        """Prepare the application to handle requests, so this isn't done on the first request.
+        Call this before forking worker processes, so the work is done once and the memory is
+        shared between the workers. See :meth:`ConnexionMiddleware.warm_up`.
+
+        :param freeze: Whether to freeze all objects tracked by the garbage collector using
+            :func:`gc.freeze`.
+        """
+        self.middleware.warm_up(freeze=freeze)
+
+    def reload(self) -> t.List[str]:
+        """Reload the APIs of which the specification changed, rebuilding only the operations
+        that changed. See :meth:`ConnexionMiddleware.reload`.
+
+        :return: The labels of the reloaded APIs.
+        """
+        return self.middleware.reload()
+
     def run(self, import_string: t.Optional[str] = None, **kwargs):
         """Run the application using uvicorn.
 
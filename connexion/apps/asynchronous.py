@@ -15,13 +15,20 @@ from connexion.apps.abstract import AbstractApp
 from connexion.decorators import StarletteDecorator
 from connexion.jsonifier import Jsonifier
 from connexion.lifecycle import ConnexionRequest, ConnexionResponse
-from connexion.middleware.abstract import RoutedAPI, RoutedMiddleware
+from connexion.middleware.abstract import (
+    RoutedAPI,
+    RoutedMiddleware,
+    check_base_path,
+    replace_mount,
+)
 from connexion.middleware.lifespan import Lifespan
 from connexion.operations import AbstractOperation
-from connexion.options import SwaggerUIOptions
-from connexion.resolver import Resolver
+from connexion.options import HTTPClientOptions, SwaggerUIOptions, ThreadPoolOptions
+from connexion.resolver import LazyResolution, Resolver
+from connexion.security import SecurityHook
 from connexion.types import MaybeAwaitable
 from connexion.uri_parsing import AbstractURIParser
+from connexion.utils import ThreadPool
 
 logger = logging.getLogger(__name__)
 
@@ -29,16 +36,26 @@ logger = logging.getLogger(__name__)
 class AsyncOperation:
     def __init__(
         self,
-        fn: t.Callable,
+        fn: t.Union[t.Callable, LazyResolution],
         jsonifier: Jsonifier,
         operation_id: str,
         pythonic_params: bool,
+        thread_pool: t.Optional[ThreadPool] = None,
     ) -> None:
+        """
+        :param fn: The endpoint function, or a lazy resolution which resolves it on the first
+            request.
+        :param thread_pool: Thread pool to run the endpoint function in if it is synchronous.
+        """
         self._fn = fn
         self.jsonifier = jsonifier
         self.operation_id = operation_id
         self.pythonic_params = pythonic_params
-        functools.update_wrapper(self, fn)
+        self.thread_pool = thread_pool
+        self._decorated_fn: t.Optional[t.Callable] = None
+        if not isinstance(fn, LazyResolution):
+            functools.update_wrapper(self, fn)
+            self._decorated_fn = self._decorate(fn)
 
     @classmethod
     def from_operation(
@@ -47,21 +64,44 @@ class AsyncOperation:
         *,
         pythonic_params: bool,
         jsonifier: Jsonifier,
+        thread_pool: t.Optional[ThreadPool] = None,
     ) -> "AsyncOperation":
+        # Keep lazy resolutions unresolved until the first request
+        resolution = operation.resolution
+        fn = (
+            resolution
+            if isinstance(resolution, LazyResolution)
+            else resolution.function
+        )
         return cls(
-            operation.function,
+            fn,
             jsonifier=jsonifier,
             operation_id=operation.operation_id,
             pythonic_params=pythonic_params,
+            thread_pool=thread_pool,
         )
 
-    @property
-    def fn(self) -> t.Callable:
+    def _decorate(self, fn: t.Callable) -> t.Callable:
         decorator = StarletteDecorator(
             pythonic_params=self.pythonic_params,
             jsonifier=self.jsonifier,
+            thread_pool=self.thread_pool,
         )
-        return decorator(self._fn)
+        return decorator(fn)
+
+    @property
+    def fn(self) -> t.Callable:
+        """The decorated endpoint function. It is built once, when the operation is created, or
+        on first access for lazily resolved endpoint functions."""
+        fn = self._decorated_fn
+        if fn is None:
+            fn = self._decorate(t.cast(LazyResolution, self._fn).function)
+            self._decorated_fn = fn
+        return fn
+
+    def warm_up(self) -> None:
+        """Resolve and decorate a lazily resolved endpoint function."""
+        self.fn
 
     async def __call__(
         self, scope: Scope, receive: Receive, send: Send
@@ -76,32 +116,93 @@ class AsyncApi(RoutedAPI[AsyncOperation]):
         *args,
         pythonic_params: bool,
         jsonifier: t.Optional[Jsonifier] = None,
+        get_thread_pool: t.Optional[t.Callable[..., ThreadPool]] = None,
         **kwargs,
     ) -> None:
+        """
+        :param get_thread_pool: Callable which returns the thread pool with a name and maximum
+            number of threads, to run synchronous endpoint functions in.
+        """
         super().__init__(*args, **kwargs)
         self.pythonic_params = pythonic_params
         self.jsonifier = jsonifier or Jsonifier()
+        self.get_thread_pool = get_thread_pool
+        self.tag_max_threads = {
+            tag["name"]: tag["x-maxThreads"]
+            for tag in self.specification.get("tags", [])
+            if "x-maxThreads" in tag
+        }
         self.router = Router()
         self.add_paths()
 
     def make_operation(self, operation: AbstractOperation) -> AsyncOperation:
         return AsyncOperation.from_operation(
-            operation, pythonic_params=self.pythonic_params, jsonifier=self.jsonifier
+            operation,
+            pythonic_params=self.pythonic_params,
+            jsonifier=self.jsonifier,
+            thread_pool=self._get_thread_pool(operation),
         )
 
+    def _get_thread_pool(self, operation: AbstractOperation) -> t.Optional[ThreadPool]:
+        """The thread pool to run the endpoint function of an operation in. Operations and tags
+        with an ``x-maxThreads`` extension get a dedicated pool."""
+        if self.get_thread_pool is None:
+            return None
+        spec_operation = self.specification.get_operation(
+            operation.path, operation.method
+        )
+        max_threads = spec_operation.get("x-maxThreads")
+        if max_threads is not None:
+            name = f"operation:{operation.operation_id}"
+            return self.get_thread_pool(name, max_threads)
+        for tag in spec_operation.get("tags", []):
+            if tag in self.tag_max_threads:
+                return self.get_thread_pool(f"tag:{tag}", self.tag_max_threads[tag])
+        return self.get_thread_pool("default")
+
 
 class AsyncASGIApp(RoutedMiddleware[AsyncApi]):
 
     api_cls = AsyncApi
 
-    def __init__(self) -> None:
+    def __init__(
+        self, thread_pool_options: t.Optional[ThreadPoolOptions] = None
+    ) -> None:
+        """
+        :param thread_pool_options: Options for the thread pools to run synchronous endpoint
+            functions in.
+        """
         self.apis: t.Dict[str, t.List[AsyncApi]] = {}
         self.operations: t.Dict[str, AsyncOperation] = {}
+        self.thread_pool_options = thread_pool_options or ThreadPoolOptions()
+        # The thread pools by name and maximum number of threads
+        self.thread_pools: t.Dict[t.Tuple[str, t.Optional[int]], ThreadPool] = {}
         self.router = Router()
         super().__init__(self.router)
 
+    def get_thread_pool(
+        self, name: str, max_threads: t.Optional[int] = None
+    ) -> ThreadPool:
+        """
+        Get the thread pool with a name and maximum number of threads to run synchronous endpoint
+        functions in. Pools are shared between APIs, and kept when an API is reloaded unless their
+        maximum number of threads changed. APIs which configure another maximum for the same
+        name get their own pool.
+
+        :param name: Name of the pool.
+        :param max_threads: Maximum number of threads of the pool. Defaults to the thread pool
+            options.
+        """
+        key = (name, max_threads)
+        pool = self.thread_pools.get(key)
+        if pool is None:
+            pool = self.thread_pools[key] = self.thread_pool_options.create_pool(
+                name, max_threads
+            )
+        return pool
+
     def add_api(self, *args, name: t.Optional[str] = None, **kwargs):
-        api = super().add_api(*args, **kwargs)
+        api = super().add_api(*args, get_thread_pool=self.get_thread_pool, **kwargs)
 
         if name is not None:
             self.router.mount(api.base_path, api.router, name=name)
@@ -109,6 +210,17 @@ class AsyncASGIApp(RoutedMiddleware[AsyncApi]):
             self.router.mount(api.base_path, api.router)
         return api
 
+    def reload_api(self, api: AsyncApi, *args, **kwargs) -> AsyncApi:
+        new_api = super().reload_api(
+            api, *args, get_thread_pool=self.get_thread_pool, **kwargs
+        )
+        check_base_path(api, new_api)
+        return new_api
+
+    def swap_api(self, api: AsyncApi, new_api: AsyncApi) -> None:
+        super().swap_api(api, new_api)
+        replace_mount(self.router, api.router, new_api.router, api.base_path)
+
     def add_url_rule(
         self,
         rule,
@@ -131,6 +243,13 @@ class AsyncApp(AbstractApp):
         lifespan: t.Optional[Lifespan] = None,
         middlewares: t.Optional[list] = None,
         specification_dir: t.Union[pathlib.Path, str] = "",
+        spec_cache_dir: t.Optional[t.Union[pathlib.Path, str]] = None,
+        profile_startup: t.Optional[bool] = None,
+        reload_interval: t.Optional[float] = None,
+        http_client_options: t.Optional[HTTPClientOptions] = None,
+        security_thread_pool_options: t.Optional[ThreadPoolOptions] = None,
+        security_hooks: t.Optional[t.List[SecurityHook]] = None,
+        thread_pool_options: t.Optional[ThreadPoolOptions] = None,
         arguments: t.Optional[dict] = None,
         auth_all_paths: t.Optional[bool] = None,
         jsonifier: t.Optional[Jsonifier] = None,
@@ -155,6 +274,25 @@ class AsyncApp(AbstractApp):
         :param specification_dir: The directory holding the specification(s). The provided path
             should either be absolute or relative to the root path of the application. Defaults to
             the root path.
+        :param spec_cache_dir: Directory to cache loaded specifications in, so later starts can
+            skip parsing, validating and resolving them. The provided path should either be
+            absolute or relative to the root path of the application. Disabled by default.
+        :param profile_startup: Whether to profile the startup of the application. The report is
+            available via :attr:`middleware.startup_profiler`. Defaults to the
+            ``CONNEXION_PROFILE_STARTUP`` environment variable.
+        :param reload_interval: Interval in seconds at which to check the specification files for
+            changes while the application is running. Changed specifications are reloaded, and
+            only the operations that changed are rebuilt. See :meth:`reload`. Disabled by default.
+        :param http_client_options: Instance of :class:`options.HTTPClientOptions` to configure
+            the HTTP client shared by the security handlers, for instance to call token info
+            urls.
+        :param security_thread_pool_options: Instance of :class:`options.ThreadPoolOptions` to
+            configure the thread pool in which synchronous security functions are run.
+        :param security_hooks: Callables which are called with a :class:`security.SecurityEvent`
+            after each verification of a security scheme, for instance to record metrics.
+        :param thread_pool_options: Instance of :class:`options.ThreadPoolOptions` to configure
+            the thread pool in which synchronous endpoint functions are run. Operations and tags
+            with an ``x-maxThreads`` extension are run in a dedicated thread pool instead.
         :param arguments: Arguments to substitute the specification using Jinja.
         :param auth_all_paths: whether to authenticate not paths not defined in the specification.
             Defaults to False.
@@ -178,13 +316,21 @@ class AsyncApp(AbstractApp):
         :param security_map: A dictionary of security handlers to use. Defaults to
             :obj:`security.SECURITY_HANDLERS`
         """
-        self._middleware_app: AsyncASGIApp = AsyncASGIApp()
+        self._middleware_app: AsyncASGIApp = AsyncASGIApp(
+            thread_pool_options=thread_pool_options
+        )
 
         super().__init__(
             import_name,
             lifespan=lifespan,
             middlewares=middlewares,
             specification_dir=specification_dir,
+            spec_cache_dir=spec_cache_dir,
+            profile_startup=profile_startup,
+            reload_interval=reload_interval,
+            http_client_options=http_client_options,
+            security_thread_pool_options=security_thread_pool_options,
+            security_hooks=security_hooks,
             arguments=arguments,
             auth_all_paths=auth_all_paths,
             jsonifier=jsonifier,
@@ -14,15 +14,21 @@ from starlette.types import Receive, Scope, Send
 
 from connexion.apps.abstract import AbstractApp
 from connexion.decorators import FlaskDecorator
-from connexion.exceptions import ResolverError
+from connexion.exceptions import ReloadError, ResolverError
 from connexion.frameworks import flask as flask_utils
 from connexion.jsonifier import Jsonifier
 from connexion.lifecycle import ConnexionRequest, ConnexionResponse
-from connexion.middleware.abstract import AbstractRoutingAPI, SpecMiddleware
+from connexion.middleware.abstract import (
+    AbstractRoutingAPI,
+    RouteKey,
+    SpecMiddleware,
+    reusable_routes,
+)
 from connexion.middleware.lifespan import Lifespan
 from connexion.operations import AbstractOperation
-from connexion.options import SwaggerUIOptions
-from connexion.resolver import Resolver
+from connexion.options import HTTPClientOptions, SwaggerUIOptions, ThreadPoolOptions
+from connexion.resolver import LazyResolution, Resolver
+from connexion.security import SecurityHook
 from connexion.types import MaybeAwaitable, WSGIApp
 from connexion.uri_parsing import AbstractURIParser
 
@@ -30,16 +36,23 @@ from connexion.uri_parsing import AbstractURIParser
 class FlaskOperation:
     def __init__(
         self,
-        fn: t.Callable,
+        fn: t.Union[t.Callable, LazyResolution],
         jsonifier: Jsonifier,
         operation_id: str,
         pythonic_params: bool,
     ) -> None:
+        """
+        :param fn: The endpoint function, or a lazy resolution which resolves it on the first
+            request.
+        """
         self._fn = fn
         self.jsonifier = jsonifier
         self.operation_id = operation_id
         self.pythonic_params = pythonic_params
-        functools.update_wrapper(self, fn)
+        self._decorated_fn: t.Optional[t.Callable] = None
+        if not isinstance(fn, LazyResolution):
+            functools.update_wrapper(self, fn)
+            self._decorated_fn = self._decorate(fn)
 
     @classmethod
     def from_operation(
@@ -49,20 +62,40 @@ class FlaskOperation:
         pythonic_params: bool,
         jsonifier: Jsonifier,
     ) -> "FlaskOperation":
+        # Keep lazy resolutions unresolved until the first request
+        resolution = operation.resolution
+        fn = (
+            resolution
+            if isinstance(resolution, LazyResolution)
+            else resolution.function
+        )
         return cls(
-            fn=operation.function,
+            fn=fn,
             jsonifier=jsonifier,
             operation_id=operation.operation_id,
             pythonic_params=pythonic_params,
         )
 
-    @property
-    def fn(self) -> t.Callable:
+    def _decorate(self, fn: t.Callable) -> t.Callable:
         decorator = FlaskDecorator(
             pythonic_params=self.pythonic_params,
             jsonifier=self.jsonifier,
         )
-        return decorator(self._fn)
+        return decorator(fn)
+
+    @property
+    def fn(self) -> t.Callable:
+        """The decorated endpoint function. It is built once, when the operation is created, or
+        on first access for lazily resolved endpoint functions."""
+        fn = self._decorated_fn
+        if fn is None:
+            fn = self._decorate(t.cast(LazyResolution, self._fn).function)
+            self._decorated_fn = fn
+        return fn
+
+    def warm_up(self) -> None:
+        """Resolve and decorate a lazily resolved endpoint function."""
+        self.fn
 
     def __call__(self, *args, **kwargs) -> FlaskResponse:
         return self.fn(*args, **kwargs)
@@ -150,6 +183,42 @@ class FlaskASGIApp(SpecMiddleware):
 
         return api
 
+    def reload_api(
+        self,
+        api: FlaskApi,
+        specification,
+        *,
+        unchanged: t.Collection[RouteKey],
+        name: t.Optional[str] = None,
+        **kwargs,
+    ) -> FlaskApi:
+        new_api = FlaskApi(
+            specification, reusable_routes=reusable_routes(api, unchanged), **kwargs
+        )
+
+        # Flask does not allow adding rules once it handled its first request, so only the
+        # view functions of the existing rules can be replaced.
+        def rules(api_):
+            return {key: route[:2] for key, route in api_.routes.items()}
+
+        if new_api.base_path != api.base_path or rules(new_api) != rules(api):
+            raise ReloadError(
+                "Flask applications can only reload operations of which the path and "
+                "operationId did not change. Restart the application instead."
+            )
+        return new_api
+
+    def swap_api(self, api: FlaskApi, new_api: FlaskApi) -> None:
+        blueprint_name = next(
+            name
+            for name, blueprint in self.app.blueprints.items()
+            if blueprint is api.blueprint
+        )
+        for _, name, operation in new_api.routes.values():
+            self.app.view_functions[f"{blueprint_name}.{name}"] = operation
+        # The blueprint of the new API is never registered, keep track of the one that is
+        new_api.blueprint = api.blueprint
+
     def add_url_rule(
         self,
         rule,
@@ -159,6 +228,11 @@ class FlaskASGIApp(SpecMiddleware):
     ):
         return self.app.add_url_rule(rule, endpoint, view_func, **options)
 
+    def warm_up(self) -> None:
+        for view_function in self.app.view_functions.values():
+            if isinstance(view_function, FlaskOperation):
+                view_function.warm_up()
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         return await self.asgi_app(scope, receive, send)
 
@@ -176,6 +250,12 @@ class FlaskApp(AbstractApp):
         middlewares: t.Optional[list] = None,
         server_args: t.Optional[dict] = None,
         specification_dir: t.Union[pathlib.Path, str] = "",
+        spec_cache_dir: t.Optional[t.Union[pathlib.Path, str]] = None,
+        profile_startup: t.Optional[bool] = None,
+        reload_interval: t.Optional[float] = None,
+        http_client_options: t.Optional[HTTPClientOptions] = None,
+        security_thread_pool_options: t.Optional[ThreadPoolOptions] = None,
+        security_hooks: t.Optional[t.List[SecurityHook]] = None,
         arguments: t.Optional[dict] = None,
         auth_all_paths: t.Optional[bool] = None,
         jsonifier: t.Optional[Jsonifier] = None,
@@ -201,6 +281,22 @@ class FlaskApp(AbstractApp):
         :param specification_dir: The directory holding the specification(s). The provided path
             should either be absolute or relative to the root path of the application. Defaults to
             the root path.
+        :param spec_cache_dir: Directory to cache loaded specifications in, so later starts can
+            skip parsing, validating and resolving them. The provided path should either be
+            absolute or relative to the root path of the application. Disabled by default.
+        :param profile_startup: Whether to profile the startup of the application. The report is
+            available via :attr:`middleware.startup_profiler`. Defaults to the
+            ``CONNEXION_PROFILE_STARTUP`` environment variable.
+        :param reload_interval: Interval in seconds at which to check the specification files for
+            changes while the application is running. Changed specifications are reloaded, and
+            only the operations that changed are rebuilt. See :meth:`reload`. Disabled by default.
+        :param http_client_options: Instance of :class:`options.HTTPClientOptions` to configure
+            the HTTP client shared by the security handlers, for instance to call token info
+            urls.
+        :param security_thread_pool_options: Instance of :class:`options.ThreadPoolOptions` to
+            configure the thread pool in which synchronous security functions are run.
+        :param security_hooks: Callables which are called with a :class:`security.SecurityEvent`
+            after each verification of a security scheme, for instance to record metrics.
         :param arguments: Arguments to substitute the specification using Jinja.
         :param auth_all_paths: whether to authenticate all paths not defined in the specification.
             Defaults to False.
@@ -231,6 +327,12 @@ class FlaskApp(AbstractApp):
             lifespan=lifespan,
             middlewares=middlewares,
             specification_dir=specification_dir,
+            spec_cache_dir=spec_cache_dir,
+            profile_startup=profile_startup,
+            reload_interval=reload_interval,
+            http_client_options=http_client_options,
+            security_thread_pool_options=security_thread_pool_options,
+            security_hooks=security_hooks,
             arguments=arguments,
             auth_all_paths=auth_all_paths,
             jsonifier=jsonifier,
@@ -5,6 +5,7 @@ starting point for developing your API with Connexion.
 
 import argparse
 import importlib.metadata
+import json
 import logging
 import os
 import sys
@@ -14,6 +15,7 @@ import connexion
 from connexion.apps import AbstractApp
 from connexion.mock import MockResolver
 from connexion.options import SwaggerUIOptions
+from connexion.profiling import StartupProfiler
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +31,15 @@ def run(app: AbstractApp, args: argparse.Namespace):
     app.run("connexion.cli:create_app", port=args.port, host=args.host, factory=True)
 
 
+def profile(app: AbstractApp, args: argparse.Namespace):
+    app.middleware._build_middleware_stack()
+    profiler = t.cast(StartupProfiler, app.middleware.startup_profiler)
+    if args.json:
+        print(json.dumps(profiler.report(), indent=2))
+    else:
+        print(profiler.format_report())
+
+
 parser = argparse.ArgumentParser()
 
 parser.add_argument(
@@ -37,64 +48,57 @@ parser.add_argument(
     version=f"Connexion {importlib.metadata.version('connexion')}",
 )
 
-subparsers = parser.add_subparsers()
-run_parser = subparsers.add_parser("run")
-run_parser.set_defaults(func=run)
+# Arguments to create the app, shared by the subcommands
+app_parser = argparse.ArgumentParser(add_help=False)
 
-run_parser.add_argument("spec_file", help="Path to OpenAPI specification.")
-run_parser.add_argument(
+app_parser.add_argument("spec_file", help="Path to OpenAPI specification.")
+app_parser.add_argument(
     "base_module_path", nargs="?", help="Root directory of handler code."
 )
-run_parser.add_argument(
-    "-p", "--port", default=5000, type=int, help="Port to listen on."
-)
-run_parser.add_argument(
-    "-H", "--host", default="127.0.0.1", type=str, help="Host interface to bind on."
-)
-run_parser.add_argument(
+app_parser.add_argument(
     "--stub",
     action="store_true",
     help="Returns status code 501, and `Not Implemented Yet` payload, for the endpoints which "
     "handlers are not found.",
 )
-run_parser.add_argument(
+app_parser.add_argument(
     "--mock",
     choices=["all", "notimplemented"],
     help="Returns example data for all endpoints or for which handlers are not found.",
 )
-run_parser.add_argument(
+app_parser.add_argument(
     "--swagger-ui-path",
     help="Personalize what URL path the API console UI will be mounted.",
     default="/ui",
 )
-run_parser.add_argument(
+app_parser.add_argument(
     "--swagger-ui-template-dir",
     help="Path to a customized API console UI dashboard.",
 )
-run_parser.add_argument(
+app_parser.add_argument(
     "--auth-all-paths",
     help="Enable authentication to paths not defined in the spec.",
     action="store_true",
 )
-run_parser.add_argument(
+app_parser.add_argument(
     "--validate-responses",
     help="Enable validation of response values from operation handlers.",
     action="store_true",
 )
-run_parser.add_argument(
+app_parser.add_argument(
     "--strict-validation",
     help="Enable strict validation of request payloads.",
     action="store_true",
 )
-run_parser.add_argument(
+app_parser.add_argument(
     "-v",
     "--verbose",
     help="Show verbose information.",
     action="count",
     default=0,
 )
-run_parser.add_argument("--base-path", help="Override the basePath in the API spec.")
-run_parser.add_argument(
+app_parser.add_argument("--base-path", help="Override the basePath in the API spec.")
+app_parser.add_argument(
     "--app-framework",
     "-f",
     choices=list(AVAILABLE_APPS),
@@ -103,6 +107,31 @@ run_parser.add_argument(
 )
 
 
+subparsers = parser.add_subparsers()
+run_parser = subparsers.add_parser("run", parents=[app_parser])
+run_parser.set_defaults(func=run)
+
+run_parser.add_argument(
+    "-p", "--port", default=5000, type=int, help="Port to listen on."
+)
+run_parser.add_argument(
+    "-H", "--host", default="127.0.0.1", type=str, help="Host interface to bind on."
+)
+
+profile_parser = subparsers.add_parser(
+    "profile",
+    parents=[app_parser],
+    help="Profile the startup of the application and print a report.",
+)
+profile_parser.set_defaults(func=profile)
+
+profile_parser.add_argument(
+    "--json",
+    help="Print the report as json.",
+    action="store_true",
+)
+
+
 def create_app(args: t.Optional[argparse.Namespace] = None) -> AbstractApp:
     """Runs a server compliant with a OpenAPI/Swagger Specification file."""
     if args is None:
@@ -141,10 +170,15 @@ def create_app(args: t.Optional[argparse.Namespace] = None) -> AbstractApp:
         swagger_ui_template_dir=args.swagger_ui_template_dir,
     )
 
+    app_extra_args = {}
+    if args.func is profile:
+        app_extra_args["profile_startup"] = True
+
     app = app_cls(
         __name__,
         auth_all_paths=args.auth_all_paths,
         swagger_ui_options=swagger_ui_options,
+        **app_extra_args,
     )
 
     app.add_api(
@@ -22,15 +22,20 @@ from connexion.decorators.response import (
 from connexion.frameworks.abstract import Framework
 from connexion.frameworks.starlette import Starlette as StarletteFramework
 from connexion.uri_parsing import AbstractURIParser
-from connexion.utils import not_installed_error
+from connexion.utils import ThreadPool, not_installed_error
 
-try:
-    from connexion.frameworks.flask import Flask as FlaskFramework
-except ImportError as e:
-    _flask_not_installed_error = not_installed_error(
-        e, msg="Please install connexion using the 'flask' extra"
-    )
-    FlaskFramework = _flask_not_installed_error  # type: ignore
+
+@functools.lru_cache(maxsize=None)
+def _flask_framework() -> t.Type[Framework]:
+    """Import the Flask framework on first use, so Flask is only loaded by apps using it."""
+    try:
+        from connexion.frameworks.flask import Flask as FlaskFramework
+    except ImportError as e:
+        _flask_not_installed_error = not_installed_error(
+            e, msg="Please install connexion using the 'flask' extra"
+        )
+        FlaskFramework = _flask_not_installed_error  # type: ignore
+    return FlaskFramework
 
 
 class BaseDecorator:
@@ -102,7 +107,9 @@ class WSGIDecorator(BaseDecorator):
 
     This decorator does not parse responses, but passes them directly to the WSGI App."""
 
-    framework = FlaskFramework
+    @property
+    def framework(self) -> t.Type[Framework]:  # type: ignore[override]
+        return _flask_framework()
 
     @property
     def _parameter_decorator_cls(self) -> t.Type[SyncParameterDecorator]:
@@ -115,22 +122,26 @@ class WSGIDecorator(BaseDecorator):
     @property
     def _sync_async_decorator(self) -> t.Callable[[t.Callable], t.Callable]:
         def decorator(function: t.Callable) -> t.Callable:
+            if not asyncio.iscoroutinefunction(function):
+                return function
+
+            sync_function = async_to_sync(function)
+
             @functools.wraps(function)
             def wrapper(*args, **kwargs) -> t.Callable:
-                if asyncio.iscoroutinefunction(function):
-                    return async_to_sync(function)(*args, **kwargs)
-                else:
-                    return function(*args, **kwargs)
+                return sync_function(*args, **kwargs)
 
             return wrapper
 
         return decorator
 
     def __call__(self, function: t.Callable) -> t.Callable:
+        # Decorate once, the decorators only depend on the request when they are called
+        decorated_function = self.decorate(function)
+
         @functools.wraps(function)
         def wrapper(*args, **kwargs):
             request = self.framework.get_request(uri_parser=self.uri_parser)
-            decorated_function = self.decorate(function)
             return decorated_function(request)
 
         return wrapper
@@ -156,6 +167,25 @@ class ASGIDecorator(BaseDecorator):
 
     framework = StarletteFramework
 
+    def __init__(
+        self,
+        *,
+        pythonic_params: bool = False,
+        uri_parser_class: AbstractURIParser = None,
+        jsonifier=json,
+        thread_pool: t.Optional[ThreadPool] = None,
+    ) -> None:
+        """
+        :param thread_pool: Thread pool to run synchronous view functions in. Defaults to the
+            thread pool of starlette.
+        """
+        super().__init__(
+            pythonic_params=pythonic_params,
+            uri_parser_class=uri_parser_class,
+            jsonifier=jsonifier,
+        )
+        self.thread_pool = thread_pool
+
     @property
     def _parameter_decorator_cls(self) -> t.Type[AsyncParameterDecorator]:
         return AsyncParameterDecorator
@@ -167,24 +197,29 @@ class ASGIDecorator(BaseDecorator):
     @property
     def _sync_async_decorator(self) -> t.Callable[[t.Callable], t.Callable]:
         def decorator(function: t.Callable) -> t.Callable:
+            if asyncio.iscoroutinefunction(function):
+                return function
+
+            thread_pool = self.thread_pool
+            run = run_in_threadpool if thread_pool is None else thread_pool.run
+
             @functools.wraps(function)
             async def wrapper(*args, **kwargs):
-                if asyncio.iscoroutinefunction(function):
-                    return await function(*args, **kwargs)
-                else:
-                    return await run_in_threadpool(function, *args, **kwargs)
+                return await run(function, *args, **kwargs)
 
             return wrapper
 
         return decorator
 
     def __call__(self, function: t.Callable) -> t.Callable:
+        # Decorate once, the decorators only depend on the request when they are called
+        decorated_function = self.decorate(function)
+
         @functools.wraps(function)
         async def wrapper(*args, **kwargs):
             request = self.framework.get_request(
                 uri_parser=self.uri_parser, scope=scope, receive=receive
             )
-            decorated_function = self.decorate(function)
             return await decorated_function(request)
 
         return wrapper
@@ -9,10 +9,9 @@ import keyword
 import logging
 import re
 import typing as t
+import weakref
 from copy import copy, deepcopy
 
-import inflection
-
 from connexion.context import context, operation
 from connexion.frameworks.abstract import Framework
 from connexion.http_facts import FORM_CONTENT_TYPES
@@ -41,20 +40,40 @@ class BaseParameterDecorator:
         self.framework = framework
         self.sanitize_fn = pythonic if pythonic_params else sanitized
 
+    def _binding_plans(
+        self, arguments: t.List[str], has_kwargs: bool
+    ) -> t.Callable[[], "BindingPlan"]:
+        """
+        Return a function which returns the binding plan of a view function for the operation of
+        the current request. The plan is built on the first request for each operation.
+
+        :param arguments: The arguments of the view function.
+        :param has_kwargs: Whether the view function accepts arbitrary keyword arguments.
+        """
+        plans: "weakref.WeakKeyDictionary[AbstractOperation, BindingPlan]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+        def get_binding_plan() -> BindingPlan:
+            current_operation = operation._get_current_object()
+            plan = plans.get(current_operation)
+            if plan is None:
+                plan = BindingPlan(
+                    current_operation,
+                    arguments=arguments,
+                    has_kwargs=has_kwargs,
+                    sanitize=self.sanitize_fn,
+                )
+                plans[current_operation] = plan
+            return plan
+
+        return get_binding_plan
+
+    @staticmethod
     def _maybe_get_body(
-        self,
-        request: t.Union[WSGIRequest, ConnexionRequest],
-        *,
-        arguments: t.List[str],
-        has_kwargs: bool,
+        request: t.Union[WSGIRequest, ConnexionRequest], *, plan: "BindingPlan"
     ) -> t.Any:
-        body_name = self.sanitize_fn(operation.body_name(request.content_type))
-        # Pass form contents separately for Swagger2 for backward compatibility with
-        # Connexion 2 Checking for body_name is not enough
-        if (body_name in arguments or has_kwargs) or (
-            request.mimetype in FORM_CONTENT_TYPES
-            and isinstance(operation, Swagger2Operation)
-        ):
+        if plan.body_binding(request.mimetype).wants_body:
             return request.get_body()
         else:
             return None
@@ -68,20 +87,18 @@ class SyncParameterDecorator(BaseParameterDecorator):
     def __call__(self, function: t.Callable) -> t.Callable:
         unwrapped_function = unwrap_decorators(function)
         arguments, has_kwargs = inspect_function_arguments(unwrapped_function)
+        get_binding_plan = self._binding_plans(arguments, has_kwargs)
 
         @functools.wraps(function)
         def wrapper(request: WSGIRequest) -> t.Any:
-            request_body = self._maybe_get_body(
-                request, arguments=arguments, has_kwargs=has_kwargs
-            )
+            plan = get_binding_plan()
+            request_body = self._maybe_get_body(request, plan=plan)
 
             kwargs = prep_kwargs(
                 request,
+                plan=plan,
                 request_body=request_body,
                 files=request.files(),
-                arguments=arguments,
-                has_kwargs=has_kwargs,
-                sanitize=self.sanitize_fn,
             )
 
             return function(**kwargs)
@@ -93,23 +110,21 @@ class AsyncParameterDecorator(BaseParameterDecorator):
     def __call__(self, function: t.Callable) -> t.Callable:
         unwrapped_function = unwrap_decorators(function)
         arguments, has_kwargs = inspect_function_arguments(unwrapped_function)
+        get_binding_plan = self._binding_plans(arguments, has_kwargs)
 
         @functools.wraps(function)
         async def wrapper(request: ConnexionRequest) -> t.Any:
-            request_body = self._maybe_get_body(
-                request, arguments=arguments, has_kwargs=has_kwargs
-            )
+            plan = get_binding_plan()
+            request_body = self._maybe_get_body(request, plan=plan)
 
             while asyncio.iscoroutine(request_body):
                 request_body = await request_body
 
             kwargs = prep_kwargs(
                 request,
+                plan=plan,
                 request_body=request_body,
                 files=await request.files(),
-                arguments=arguments,
-                has_kwargs=has_kwargs,
-                sanitize=self.sanitize_fn,
             )
 
             return await function(**kwargs)
@@ -120,27 +135,20 @@ class AsyncParameterDecorator(BaseParameterDecorator):
 def prep_kwargs(
     request: t.Union[WSGIRequest, ConnexionRequest],
     *,
+    plan: "BindingPlan",
     request_body: t.Any,
     files: t.Dict[str, t.Any],
-    arguments: t.List[str],
-    has_kwargs: bool,
-    sanitize: t.Callable,
 ) -> dict:
-    kwargs = get_arguments(
-        operation,
+    arguments, has_kwargs = plan.arguments, plan.has_kwargs
+    # The plan translates the parameter names, optionally to un-shadowed, snake_case form
+    kwargs = plan.bind(
         path_params=request.path_params,
         query_params=request.query_params,
         body=request_body,
         files=files,
-        arguments=arguments,
-        has_kwargs=has_kwargs,
-        sanitize=sanitize,
         content_type=request.mimetype,
     )
 
-    # optionally convert parameter variable names to un-shadowed, snake_case form
-    kwargs = {sanitize(k): v for k, v in kwargs.items()}
-
     # add context info (e.g. from security decorator)
     for key, value in context.items():
         if has_kwargs or key in arguments:
@@ -167,23 +175,63 @@ def snake_and_shadow(name: str) -> str:
     see if the name matches a known built-in and if it does it appends an underscore to the name.
     :param name: The parameter name
     """
+    import inflection
+
     snake = inflection.underscore(name)
     if snake in builtins.__dict__ or keyword.iskeyword(snake):
         return f"{snake}_"
     return snake
 
 
+# The names declared in the specification are translated once per operation by its binding plan.
+# The cache is bounded since dynamic names, such as form fields, are chosen by the client.
+@functools.lru_cache(maxsize=1024)
 def sanitized(name: str) -> str:
     return name and re.sub(
         "^[^a-zA-Z_]+", "", re.sub("[^0-9a-zA-Z_]", "", re.sub(r"\[(?!])", "_", name))
     )
 
 
+@functools.lru_cache(maxsize=1024)
 def pythonic(name: str) -> str:
     name = name and snake_and_shadow(name)
     return sanitized(name)
 
 
+def argument_names(
+    operation: AbstractOperation, *, pythonic_params: bool = False
+) -> t.Dict[str, str]:
+    """
+    The names of the view function arguments the parameters of an operation are passed as, by
+    their names in the specification. This includes the path and query parameters, the body and,
+    for Swagger 2 forms, the form parameters.
+
+    :param operation: The operation to translate the parameter names of.
+    :param pythonic_params: Whether the names are translated to Pythonic names, as with the
+        ``pythonic_params`` option of the application.
+    """
+    return _argument_names(operation, pythonic if pythonic_params else sanitized)
+
+
+def _argument_names(
+    operation: AbstractOperation, sanitize: t.Callable[[str], str]
+) -> t.Dict[str, str]:
+    names = [
+        parameter["name"]
+        for parameter in operation.parameters
+        if parameter["in"] in ("path", "query")
+    ]
+    if operation.is_request_body_defined:
+        for content_type in operation.consumes:
+            if content_type in FORM_CONTENT_TYPES and isinstance(
+                operation, Swagger2Operation
+            ):
+                names.extend(operation.body_schema(content_type).get("properties", {}))
+            else:
+                names.append(operation.body_name(content_type))
+    return {name: sanitize(name) for name in names}
+
+
 def get_arguments(
     operation: AbstractOperation,
     *,
@@ -199,58 +247,278 @@ def get_arguments(
     """
     get arguments for handler function
     """
-    ret = {}
-    ret.update(_get_path_arguments(path_params, operation=operation, sanitize=sanitize))
-    ret.update(
-        _get_query_arguments(
-            query_params,
-            operation=operation,
-            arguments=arguments,
-            has_kwargs=has_kwargs,
-            sanitize=sanitize,
-        )
+    plan = BindingPlan(
+        operation, arguments=arguments, has_kwargs=has_kwargs, sanitize=sanitize
     )
-
-    if operation.method.upper() == "TRACE":
-        # TRACE requests MUST NOT include a body (RFC7231 section 4.3.8)
-        return ret
-
-    ret.update(
-        _get_body_argument(
-            body,
-            operation=operation,
-            arguments=arguments,
-            has_kwargs=has_kwargs,
-            sanitize=sanitize,
-            content_type=content_type,
-        )
+    return plan.bind(
+        path_params=path_params,
+        query_params=query_params,
+        body=body,
+        files=files,
+        content_type=content_type,
     )
-    body_schema = operation.body_schema(content_type)
-    ret.update(_get_file_arguments(files, arguments, body_schema, has_kwargs))
-    return ret
 
 
-def _get_path_arguments(
-    path_params: dict, *, operation: AbstractOperation, sanitize: t.Callable
-) -> dict:
+_NO_DEFAULT = object()
+
+MAX_CACHED_CONTENT_TYPES = 16
+"""The maximum number of content types to cache the body binding for per operation. The content
+type is chosen by the client, so the cache is bounded."""
+
+
+class BindingPlan:
     """
-    Extract handler function arguments from path parameters
+    Plan to bind the parameters of a request to the arguments of a view function. Everything that
+    only depends on the operation and the view function, such as the parameter definitions, their
+    defaults, argument names and type converters, is computed once when the plan is built.
     """
-    kwargs = {}
 
-    path_definitions = {
-        parameter["name"]: parameter
-        for parameter in operation.parameters
-        if parameter["in"] == "path"
-    }
-
-    for name, value in path_params.items():
-        sanitized_key = sanitize(name)
-        if name in path_definitions:
-            kwargs[sanitized_key] = _get_val_from_param(value, path_definitions[name])
-        else:  # Assume path params mechanism used for injection
-            kwargs[sanitized_key] = value
-    return kwargs
+    def __init__(
+        self,
+        operation: AbstractOperation,
+        *,
+        arguments: t.List[str],
+        has_kwargs: bool,
+        sanitize: t.Callable,
+    ) -> None:
+        """
+        :param operation: The operation the view function handles.
+        :param arguments: The arguments of the view function.
+        :param has_kwargs: Whether the view function accepts arbitrary keyword arguments.
+        :param sanitize: Function to translate parameter names into argument names.
+        """
+        self.operation = operation
+        self.arguments = arguments
+        self.has_kwargs = has_kwargs
+        self.sanitize = sanitize
+
+        parameters = operation.parameters
+        self.argument_names = _argument_names(operation, sanitize)
+        self.path_bindings: t.Dict[str, t.Tuple[str, t.Callable]] = {
+            parameter["name"]: (
+                self.argument_names[parameter["name"]],
+                _get_converter(parameter),
+            )
+            for parameter in parameters
+            if parameter["in"] == "path"
+        }
+
+        query_definitions = {
+            parameter["name"]: parameter
+            for parameter in parameters
+            if parameter["in"] == "query"
+        }
+        query_defaults = _get_query_defaults(query_definitions)
+        self.query_bindings: t.List[t.Tuple[str, str, t.Any, t.Callable]] = []
+        for name, definition in query_definitions.items():
+            key = self.argument_names[name]
+            if has_kwargs or key in arguments:
+                default = query_defaults.get(name, _NO_DEFAULT)
+                self.query_bindings.append(
+                    (name, key, default, _get_converter(definition))
+                )
+            else:
+                logger.debug(
+                    "Query Parameter '%s' (sanitized: '%s') not in function arguments",
+                    name,
+                    key,
+                )
+
+        # TRACE requests MUST NOT include a body (RFC7231 section 4.3.8)
+        self.binds_body = operation.method.upper() != "TRACE"
+        self._body_bindings: t.Dict[str, BodyBinding] = {}
+        for content_type in operation.consumes:
+            self.body_binding(content_type)
+
+    def body_binding(self, content_type: str) -> "BodyBinding":
+        """The plan to bind the body of a request with the given content type."""
+        binding = self._body_bindings.get(content_type)
+        if binding is None:
+            binding = BodyBinding(self, content_type)
+            if len(self._body_bindings) < MAX_CACHED_CONTENT_TYPES:
+                self._body_bindings[content_type] = binding
+        return binding
+
+    def bind(
+        self,
+        *,
+        path_params: dict,
+        query_params: dict,
+        body: t.Any,
+        files: dict,
+        content_type: str,
+    ) -> t.Dict[str, t.Any]:
+        """Bind the parameters of a request to the arguments of the view function."""
+        kwargs = {}
+        for name, value in path_params.items():
+            path_binding = self.path_bindings.get(name)
+            if path_binding is None:
+                # Assume path params mechanism used for injection
+                kwargs[self.sanitize(name)] = value
+            else:
+                key, convert = path_binding
+                kwargs[key] = convert(value)
+
+        for name, key, default, convert in self.query_bindings:
+            if name in query_params:
+                value = query_params[name]
+                if isinstance(default, dict) and isinstance(value, dict):
+                    value = deep_merge(deepcopy(default), value)
+            elif default is not _NO_DEFAULT:
+                value = deepcopy(default)
+            else:
+                continue
+            kwargs[key] = convert(value)
+
+        if self.binds_body:
+            kwargs.update(self.body_binding(content_type).bind(body, files))
+        return kwargs
+
+
+class BodyBinding:
+    """Plan to bind the body and files of a request with a specific content type to the arguments
+    of a view function."""
+
+    def __init__(self, plan: BindingPlan, content_type: str) -> None:
+        operation = plan.operation
+        self.arguments = plan.arguments
+        self.has_kwargs = plan.has_kwargs
+        self.sanitize = plan.sanitize
+        self.body_name = plan.sanitize(operation.body_name(content_type))
+        self.is_form = content_type in FORM_CONTENT_TYPES
+        # Pass form contents separately for Swagger2 for backward compatibility with
+        # Connexion 2
+        self.unpack_form = self.is_form and isinstance(operation, Swagger2Operation)
+        self.wants_body = (
+            self.body_name in self.arguments or self.has_kwargs or self.unpack_form
+        )
+
+        self.binds_body = (len(self.arguments) > 0 or self.has_kwargs) and bool(
+            operation.is_request_body_defined
+        )
+        body_schema = operation.body_schema(content_type)
+        self.default_body = body_schema.get("default", {})
+        self.nullable = is_nullable(body_schema)
+        self.property_converters: t.Dict[str, t.Callable] = {}
+        self.additional_props: t.Union[bool, dict] = True
+        self.additional_props_converter: t.Optional[t.Callable] = None
+        if self.is_form and self.binds_body:
+            self.property_converters = {
+                name: _get_converter({"schema": schema})
+                for name, schema in body_schema.get("properties", {}).items()
+            }
+            # by OpenAPI specification `additionalProperties` defaults to `true`
+            # see: https://github.com/OAI/OpenAPI-Specification/blame/3.0.2/versions/3.0.2.md#L2305
+            self.additional_props = operation.body_schema().get(
+                "additionalProperties", True
+            )
+            if isinstance(self.additional_props, dict):
+                self.additional_props_converter = _get_converter(
+                    {"schema": self.additional_props}
+                )
+
+        self.array_files = {
+            name
+            for name, schema in body_schema.get("properties", {}).items()
+            if schema.get("type") == "array"
+        }
+
+    def bind(self, body: t.Any, files: dict) -> t.Dict[str, t.Any]:
+        """Bind the body and files of a request to the arguments of the view function."""
+        kwargs = self._bind_body(body) if self.binds_body else {}
+        for name, value in files.items():
+            if not (name in self.arguments or self.has_kwargs):
+                continue
+            if name not in self.array_files:
+                value = value[0]
+            kwargs[self.sanitize(name)] = value
+        return kwargs
+
+    def _bind_body(self, body: t.Any) -> t.Dict[str, t.Any]:
+        if self.unpack_form:
+            # Unpack form values for Swagger for compatibility with Connexion 2 behavior
+            result = self._get_form_body(body)
+            kwargs = {self.sanitize(name): value for name, value in result.items()}
+            if self.has_kwargs:
+                return kwargs
+            return {
+                name: value for name, value in kwargs.items() if name in self.arguments
+            }
+
+        if not (self.body_name in self.arguments or self.has_kwargs):
+            return {}
+
+        if self.is_form:
+            return {self.body_name: self._get_form_body(body)}
+        return {self.body_name: self._get_json_body(body)}
+
+    def _get_json_body(self, body: t.Any) -> t.Any:
+        # if the body came in null, and the schema says it can be null, we decide
+        # to include no value for the body argument, rather than the default body
+        if self.nullable and is_null(body):
+            return None
+
+        if body is None:
+            return deepcopy(self.default_body)
+
+        return body
+
+    def _get_form_body(self, body: t.Any) -> t.Dict[str, t.Any]:
+        # now determine the actual value for the body (whether it came in or is default)
+        body_arg = deepcopy(self.default_body)
+        body_arg.update(body or {})
+
+        if not (self.property_converters or self.additional_props):
+            return {}
+
+        result = {}
+        for key, value in body_arg.items():
+            convert = self.property_converters.get(key)
+            if convert is not None:
+                try:
+                    result[key] = convert(value)
+                    continue
+                except KeyError:  # pragma: no cover
+                    pass
+            if not self.additional_props:
+                logger.error(f"Body property '{key}' not defined in body schema")
+                continue
+            if self.additional_props_converter is not None:
+                value = self.additional_props_converter(value)
+            result[key] = value
+        return result
+
+
+def _get_converter(param_definition: dict) -> t.Callable[[t.Any], t.Any]:
+    """Build a function to cast a value according to its definition in the specification."""
+    param_schema = param_definition.get("schema", param_definition)
+    is_array = param_schema.get("type") == "array"
+    type_schema = param_schema.get("items", {}) if is_array else param_schema
+    if "type" not in type_schema:
+        # Raise the error when a value is cast
+        return functools.partial(
+            _get_val_from_param, param_definitions=param_definition
+        )
+
+    nullable = is_nullable(param_schema)
+    type_ = type_schema["type"]
+    format_ = type_schema.get("format")
+
+    if is_array:
+
+        def convert(value: t.Any) -> t.Any:
+            if nullable and is_null(value):
+                return None
+            return [make_type(part, type_, format_) for part in value]
+
+    else:
+
+        def convert(value: t.Any) -> t.Any:
+            if nullable and is_null(value):
+                return None
+            return make_type(value, type_, format_)
+
+    return convert
 
 
 def _get_val_from_param(value: t.Any, param_definitions: t.Dict[str, dict]) -> t.Any:
@@ -270,32 +538,6 @@ def _get_val_from_param(value: t.Any, param_definitions: t.Dict[str, dict]) -> t
         return make_type(value, type_, format_)
 
 
-def _get_query_arguments(
-    query_params: dict,
-    *,
-    operation: AbstractOperation,
-    arguments: t.List[str],
-    has_kwargs: bool,
-    sanitize: t.Callable,
-) -> dict:
-    """
-    extract handler function arguments from the query parameters
-    """
-    query_definitions = {
-        parameter["name"]: parameter
-        for parameter in operation.parameters
-        if parameter["in"] == "query"
-    }
-
-    default_query_params = _get_query_defaults(query_definitions)
-
-    query_arguments = deepcopy(default_query_params)
-    query_arguments = deep_merge(query_arguments, query_params)
-    return _query_args_helper(
-        query_definitions, query_arguments, arguments, has_kwargs, sanitize
-    )
-
-
 def _get_query_defaults(query_definitions: t.Dict[str, dict]) -> t.Dict[str, t.Any]:
     """Get the default values for the query parameter from the parameter definition."""
     defaults = {}
@@ -331,165 +573,3 @@ def _build_default_obj_recursive(properties: dict, default_object: dict) -> dict
                 property_["properties"], default_object[name]
             )
     return default_object
-
-
-def _query_args_helper(
-    query_definitions: dict,
-    query_arguments: dict,
-    function_arguments: t.List[str],
-    has_kwargs: bool,
-    sanitize: t.Callable,
-) -> dict:
-    result = {}
-    for key, value in query_arguments.items():
-        sanitized_key = sanitize(key)
-        if not has_kwargs and sanitized_key not in function_arguments:
-            logger.debug(
-                "Query Parameter '%s' (sanitized: '%s') not in function arguments",
-                key,
-                sanitized_key,
-            )
-        else:
-            logger.debug(
-                "Query Parameter '%s' (sanitized: '%s') in function arguments",
-                key,
-                sanitized_key,
-            )
-            try:
-                query_defn = query_definitions[key]
-            except KeyError:  # pragma: no cover
-                logger.error(
-                    "Function argument '%s' (non-sanitized: %s) not defined in specification",
-                    sanitized_key,
-                    key,
-                )
-            else:
-                logger.debug("%s is a %s", key, query_defn)
-                result.update({sanitized_key: _get_val_from_param(value, query_defn)})
-    return result
-
-
-def _get_body_argument(
-    body: t.Any,
-    *,
-    operation: AbstractOperation,
-    arguments: t.List[str],
-    has_kwargs: bool,
-    sanitize: t.Callable,
-    content_type: str,
-) -> dict:
-    if len(arguments) <= 0 and not has_kwargs:
-        return {}
-
-    if not operation.is_request_body_defined:
-        return {}
-
-    body_name = sanitize(operation.body_name(content_type))
-
-    if content_type in FORM_CONTENT_TYPES:
-        result = _get_body_argument_form(
-            body, operation=operation, content_type=content_type
-        )
-
-        # Unpack form values for Swagger for compatibility with Connexion 2 behavior
-        if content_type in FORM_CONTENT_TYPES and isinstance(
-            operation, Swagger2Operation
-        ):
-            if has_kwargs:
-                return result
-            else:
-                return {
-                    sanitize(name): value
-                    for name, value in result.items()
-                    if sanitize(name) in arguments
-                }
-    else:
-        result = _get_body_argument_json(
-            body, operation=operation, content_type=content_type
-        )
-
-    if body_name in arguments or has_kwargs:
-        return {body_name: result}
-
-    return {}
-
-
-def _get_body_argument_json(
-    body: t.Any, *, operation: AbstractOperation, content_type: str
-) -> t.Any:
-    # if the body came in null, and the schema says it can be null, we decide
-    # to include no value for the body argument, rather than the default body
-    if is_nullable(operation.body_schema(content_type)) and is_null(body):
-        return None
-
-    if body is None:
-        default_body = operation.body_schema(content_type).get("default", {})
-        return deepcopy(default_body)
-
-    return body
-
-
-def _get_body_argument_form(
-    body: dict, *, operation: AbstractOperation, content_type: str
-) -> dict:
-    # now determine the actual value for the body (whether it came in or is default)
-    default_body = operation.body_schema(content_type).get("default", {})
-    body_props = {
-        k: {"schema": v}
-        for k, v in operation.body_schema(content_type).get("properties", {}).items()
-    }
-
-    # by OpenAPI specification `additionalProperties` defaults to `true`
-    # see: https://github.com/OAI/OpenAPI-Specification/blame/3.0.2/versions/3.0.2.md#L2305
-    additional_props = operation.body_schema().get("additionalProperties", True)
-
-    body_arg = deepcopy(default_body)
-    body_arg.update(body or {})
-
-    if body_props or additional_props:
-        return _get_typed_body_values(body_arg, body_props, additional_props)
-
-    return {}
-
-
-def _get_typed_body_values(body_arg, body_props, additional_props):
-    """
-    Return a copy of the provided body_arg dictionary
-    whose values will have the appropriate types
-    as defined in the provided schemas.
-
-    :type body_arg: type dict
-    :type body_props: dict
-    :type additional_props: dict|bool
-    :rtype: dict
-    """
-    additional_props_defn = (
-        {"schema": additional_props} if isinstance(additional_props, dict) else None
-    )
-    res = {}
-
-    for key, value in body_arg.items():
-        try:
-            prop_defn = body_props[key]
-            res[key] = _get_val_from_param(value, prop_defn)
-        except KeyError:  # pragma: no cover
-            if not additional_props:
-                logger.error(f"Body property '{key}' not defined in body schema")
-                continue
-            if additional_props_defn is not None:
-                value = _get_val_from_param(value, additional_props_defn)
-            res[key] = value
-
-    return res
-
-
-def _get_file_arguments(files, arguments, body_schema: dict, has_kwargs=False):
-    results = {}
-    for k, v in files.items():
-        if not (k in arguments or has_kwargs):
-            continue
-        if body_schema.get("properties", {}).get(k, {}).get("type") != "array":
-            v = v[0]
-        results[k] = v
-
-    return results
@@ -31,6 +31,11 @@ class MissingMiddleware(ConnexionException):
 # HTTP ERRORS
 
 
+class ReloadError(ConnexionException):
+    """Error raised when a new version of an API can't replace the running one, e.g. because its
+    base path changed. The running version of the API is left untouched."""
+
+
 class ProblemException(HTTPException, ConnexionException):
     """
     This exception holds arguments that are going to be passed to the
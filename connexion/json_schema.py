@@ -2,16 +2,17 @@
 Module containing all code related to json schema validation.
 """
 
-import contextlib
-import io
+import json
 import os
+import pickle
+import re
+import threading
 import typing as t
 import urllib.parse
 import urllib.request
 from collections.abc import Mapping
 from copy import deepcopy
 
-import requests
 import yaml
 from jsonschema import Draft4Validator, RefResolver
 from jsonschema.exceptions import RefResolutionError, ValidationError  # noqa
@@ -19,27 +20,86 @@ from jsonschema.validators import extend
 
 from .utils import deep_get
 
+# Use the libyaml based loader if available, since it's an order of magnitude faster
+_SafeLoader: t.Type[yaml.SafeLoader] = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Documents starting with an object or array are probably json, which is faster to load as such
+_JSON_START = re.compile(r"\s*[{\[]")
 
-class ExtendedSafeLoader(yaml.SafeLoader):
-    """Extends the yaml SafeLoader to coerce all keys to string so the result is valid json."""
 
-    def __init__(self, stream):
-        self.original_construct_mapping = self.construct_mapping
-        self.construct_mapping = self.extended_construct_mapping
-        super().__init__(stream)
+class ExtendedSafeLoader(_SafeLoader):  # type: ignore
+    """Extends the yaml SafeLoader to coerce all keys to string so the result is valid json."""
 
-    def extended_construct_mapping(self, node, deep=False):
-        data = self.original_construct_mapping(node, deep)
+    def construct_mapping(self, node, deep=False):
+        data = super().construct_mapping(node, deep)
         return {str(key): data[key] for key in data}
 
 
+def load_document(document: t.Union[str, bytes]) -> t.Any:
+    """
+    Load a json or YAML document. Json documents are loaded with the json parser, others with the
+    :class:`ExtendedSafeLoader`.
+    """
+    if isinstance(document, bytes):
+        try:
+            document = document.decode()
+        except UnicodeDecodeError:
+            document = document.decode("utf-8", "replace")
+    document = document.lstrip("\ufeff")
+
+    if _JSON_START.match(document):
+        try:
+            return json.loads(document)
+        except ValueError:
+            # Could still be a YAML flow mapping or sequence
+            pass
+    return yaml.load(document, ExtendedSafeLoader)
+
+
+class DocumentCache:
+    """
+    Process wide cache of parsed external documents, keyed by absolute path. An entry is reused as
+    long as the modification time and size of the file are unchanged, so documents shared between
+    specifications are only parsed once.
+
+    Documents are stored pickled, and every lookup returns a fresh copy, since references are
+    resolved in place. Unpickling is an order of magnitude faster than parsing.
+    """
+
+    def __init__(self) -> None:
+        self._entries: t.Dict[str, t.Tuple[t.Tuple[int, int], bytes]] = {}
+        self._lock = threading.Lock()
+
+    def load_file(self, path: str) -> t.Any:
+        """Load the parsed document at the provided absolute path."""
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+
+        entry = self._entries.get(path)
+        if entry is None or entry[0] != version:
+            with open(path, "rb") as fh:
+                document = load_document(fh.read())
+            entry = (version, pickle.dumps(document, protocol=pickle.HIGHEST_PROTOCOL))
+            with self._lock:
+                self._entries[path] = entry
+            return document
+
+        return pickle.loads(entry[1])
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+document_cache = DocumentCache()
+
+
 class FileHandler:
-    """Handler to resolve file refs."""
+    """Handler to resolve file refs, using the process wide :data:`document_cache`."""
 
     def __call__(self, uri):
         filepath = self._uri_to_path(uri)
-        with open(filepath) as fh:
-            return yaml.load(fh, ExtendedSafeLoader)
+        return document_cache.load_file(filepath)
 
     @staticmethod
     def _uri_to_path(uri):
@@ -54,12 +114,13 @@ class URLHandler:
     """Handler to resolve url refs."""
 
     def __call__(self, uri):
+        # Imported lazily, since it's only needed for remote references
+        import requests
+
         response = requests.get(uri)
         response.raise_for_status()
 
-        data = io.StringIO(response.text)
-        with contextlib.closing(data) as fh:
-            return yaml.load(fh, ExtendedSafeLoader)
+        return load_document(response.text)
 
 
 handlers = {
@@ -70,43 +131,143 @@ handlers = {
 }
 
 
+def create_ref_resolver(document, base_uri=""):
+    """
+    Create a resolver for references into the provided document. The resolver can be shared
+    between validators, so their schemas don't need to embed the referenced definitions.
+    """
+    return RefResolver(base_uri, document, handlers=handlers)
+
+
+def resolve_pointer(document: t.Any, fragment: str) -> t.Any:
+    """
+    Resolve a JSON pointer, like the fragment of a reference, in a document.
+
+    :raises LookupError, TypeError, ValueError: if the pointer can't be resolved
+    """
+    fragment = fragment.lstrip("/")
+    parts = fragment.split("/") if fragment else []
+    parts = [
+        urllib.parse.unquote(part).replace("~1", "/").replace("~0", "~")
+        for part in parts
+    ]
+    return deep_get(document, parts)
+
+
 def resolve_refs(spec, store=None, base_uri=""):
     """
     Resolve JSON references like {"$ref": <some URI>} in a spec.
     Optionally takes a store, which is a mapping from reference URLs to a
     dereferenced objects. Prepopulating the store can avoid network calls.
+
+    References are replaced by the object they refer to, which is shared between all references
+    to it. The result is therefore a graph instead of a tree, and recursive references result in
+    cycles. References with sibling keywords are merged with the object they refer to instead.
     """
     spec = deepcopy(spec)
     store = store or {}
     resolver = RefResolver(base_uri, spec, store, handlers=handlers)
 
+    # Containers which have been (or are being) resolved, by id
+    seen: t.Dict[int, t.Any] = {}
+    # Reference nodes which have been resolved, by id, mapped to (node, result)
+    resolved: t.Dict[int, t.Tuple[t.Any, t.Any]] = {}
+    # Reference nodes which are being resolved, to detect reference cycles
+    resolving: t.Set[int] = set()
+
+    def _resolve_ref(node):
+        key = id(node)
+        if key in resolved:
+            return resolved[key][1]
+        if key in resolving:
+            raise RefResolutionError(f"Circular reference {node['$ref']}")
+        resolving.add(key)
+
+        ref = node["$ref"]
+        url, fragment = urllib.parse.urldefrag(
+            urllib.parse.urljoin(resolver.resolution_scope, ref)
+        )
+        try:
+            document = resolver.store[url]
+        except KeyError:
+            # resolve external references
+            try:
+                document = resolver.store[url] = resolver.resolve_remote(url)
+            except Exception as exc:
+                raise RefResolutionError(f"Unresolvable reference {ref!r}: {exc}")
+
+        # Follow the JSON pointer ourselves, since the referenced documents are resolved in place
+        # and can contain cycles, which the RefResolver would search for anchors.
+        try:
+            retrieved = resolve_pointer(document, fragment)
+        except (LookupError, TypeError, ValueError):
+            raise RefResolutionError(f"Unresolvable JSON pointer {ref!r}")
+
+        resolver.push_scope(url)
+        try:
+            retrieved = _do_resolve(retrieved)
+        finally:
+            resolver.pop_scope()
+
+        result = retrieved
+        if len(node) > 1 and isinstance(retrieved, Mapping):
+            # Keep sibling keywords by merging the node with the referenced object
+            node.update(retrieved)
+            node.pop("$ref", None)
+            result = _do_resolve(node)
+
+        resolving.discard(key)
+        resolved[key] = (node, result)
+        return result
+
     def _do_resolve(node):
         if isinstance(node, Mapping) and "$ref" in node:
-            path = node["$ref"][2:].split("/")
-            try:
-                # resolve known references
-                retrieved = deep_get(spec, path)
-                node.update(retrieved)
-                if isinstance(retrieved, Mapping) and "$ref" in retrieved:
-                    node = _do_resolve(node)
-                node.pop("$ref", None)
+            return _resolve_ref(node)
+        elif isinstance(node, (Mapping, list)):
+            if id(node) in seen:
                 return node
-            except KeyError:
-                # resolve external references
-                with resolver.resolving(node["$ref"]) as resolved:
-                    return _do_resolve(resolved)
-        elif isinstance(node, Mapping):
-            for k, v in node.items():
+            seen[id(node)] = node
+            items = node.items() if isinstance(node, Mapping) else enumerate(node)
+            for k, v in items:
                 node[k] = _do_resolve(v)
-        elif isinstance(node, (list, tuple)):
-            for i, _ in enumerate(node):
-                node[i] = _do_resolve(node[i])
         return node
 
     res = _do_resolve(spec)
     return res
 
 
+def break_cycles(spec):
+    """
+    Return a copy of a spec resolved by :func:`resolve_refs` as a tree, so it can be serialized.
+
+    Objects referenced from within themselves are replaced by a local {"$ref": <JSON pointer>}
+    to the location they were first reached from. Other shared objects are copied.
+    """
+    # Pointers of the containers on the current path, by id
+    ancestors: t.Dict[int, str] = {}
+
+    def _do_break(node, pointer):
+        if not isinstance(node, (Mapping, list)):
+            return node
+        key = id(node)
+        if key in ancestors:
+            return {"$ref": f"#{ancestors[key]}"}
+        ancestors[key] = pointer
+        try:
+            if isinstance(node, Mapping):
+                return {
+                    k: _do_break(v, f"{pointer}/{_escape(k)}") for k, v in node.items()
+                }
+            return [_do_break(v, f"{pointer}/{i}") for i, v in enumerate(node)]
+        finally:
+            del ancestors[key]
+
+    def _escape(token):
+        return str(token).replace("~", "~0").replace("/", "~1")
+
+    return _do_break(spec, "")
+
+
 def format_error_with_path(exception: ValidationError) -> str:
     """Format a `ValidationError` with path to error."""
     error_path = ".".join(str(item) for item in exception.path)
@@ -8,11 +8,40 @@ from collections import defaultdict
 from python_multipart.multipart import parse_options_header
 from starlette.datastructures import UploadFile
 from starlette.requests import Request as StarletteRequest
-from werkzeug import Request as WerkzeugRequest
+from starlette.requests import cookie_parser
+from starlette.types import Scope
 
 from connexion.http_facts import FORM_CONTENT_TYPES
 from connexion.utils import is_json_mimetype
 
+if t.TYPE_CHECKING:
+    from werkzeug import Request as WerkzeugRequest
+
+
+COOKIES_EXTENSION = "connexion_cookies"
+
+
+def get_cookies(scope: Scope) -> t.Dict[str, str]:
+    """
+    Return the cookies of a request. They are parsed once and cached on the scope of the request,
+    so the same mapping is shared by the security handlers, validators and request objects of the
+    request. It should not be modified.
+
+    :param scope: The ASGI scope of the request.
+    """
+    raw_cookies = b"; ".join(
+        value for name, value in scope.get("headers", ()) if name == b"cookie"
+    )
+    extensions = scope.setdefault("extensions", {})
+    cached = extensions.get(COOKIES_EXTENSION)
+    # Parse the cookies again if the headers were changed since they were cached
+    if cached is not None and cached[0] == raw_cookies:
+        return cached[1]
+
+    cookies = cookie_parser(raw_cookies.decode("latin-1")) if raw_cookies else {}
+    extensions[COOKIES_EXTENSION] = (raw_cookies, cookies)
+    return cookies
+
 
 class _RequestInterface:
     @property
@@ -62,7 +91,7 @@ class _RequestInterface:
 
 class WSGIRequest(_RequestInterface):
     def __init__(
-        self, werkzeug_request: WerkzeugRequest, uri_parser=None, view_args=None
+        self, werkzeug_request: "WerkzeugRequest", uri_parser=None, view_args=None
     ):
         self._werkzeug_request = werkzeug_request
         self.uri_parser = uri_parser
@@ -191,6 +220,10 @@ class ConnexionRequest(_RequestInterface):
             )
         return self._path_params
 
+    @property
+    def cookies(self) -> t.Dict[str, str]:
+        return get_cookies(self.scope)
+
     @property
     def query_params(self):
         if self._query_params is None:
@@ -3,9 +3,11 @@ import logging
 import typing as t
 from collections import defaultdict
 
+from starlette.routing import Mount, Router
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from connexion.exceptions import MissingMiddleware, ResolverError
+from connexion import profiling
+from connexion.exceptions import MissingMiddleware, ReloadError, ResolverError
 from connexion.http_facts import METHODS
 from connexion.operations import AbstractOperation
 from connexion.resolver import Resolver
@@ -15,6 +17,9 @@ logger = logging.getLogger(__name__)
 
 ROUTING_CONTEXT = "connexion_routing"
 
+RouteKey = t.Tuple[str, str]
+"""Key of an operation in a specification: its path and method."""
+
 
 class SpecMiddleware(abc.ABC):
     """Middlewares that need the specification(s) to be registered on them should inherit from this
@@ -27,11 +32,62 @@ class SpecMiddleware(abc.ABC):
         Multiple APIs can be registered on a single middleware.
         """
 
+    def reload_api(
+        self,
+        api: t.Any,
+        specification: Specification,
+        *,
+        unchanged: t.Collection[RouteKey],
+        **kwargs,
+    ) -> t.Any:
+        """
+        Build a new version of an API registered on this middleware for an updated specification.
+        The new version is only used after it is swapped in using :meth:`swap_api`, so all
+        middlewares can prepare their new version before any of them is swapped in.
+
+        :param api: The API to reload, as returned by :meth:`add_api`.
+        :param specification: The updated specification.
+        :param unchanged: The operations which did not change, and can be reused from the
+            current version of the API.
+        :param kwargs: The keyword arguments the API was added with.
+        :raises ReloadError: If the new version can't replace the current version.
+        """
+        raise ReloadError(f"{type(self).__name__} does not support reloading APIs")
+
+    def swap_api(self, api: t.Any, new_api: t.Any) -> None:
+        """Replace an API registered on this middleware by its new version, as returned by
+        :meth:`reload_api`. This must not raise, since the other middlewares might already have
+        swapped in their new version. Any check belongs in :meth:`reload_api`."""
+
     @abc.abstractmethod
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         pass
 
 
+def reusable_routes(api: "AbstractSpecAPI", unchanged: t.Collection[RouteKey]) -> dict:
+    """The routes of an API which can be reused by its new version."""
+    return {key: api.routes[key] for key in unchanged if key in api.routes}
+
+
+def replace_mount(router: Router, app: ASGIApp, new_app: ASGIApp, path: str) -> None:
+    """Replace the app mounted on a router by a new app, keeping its position and name."""
+    for i, route in enumerate(router.routes):
+        if isinstance(route, Mount) and route.app is app:
+            router.routes[i] = Mount(path, app=new_app, name=route.name)
+            return
+    router.mount(path, app=new_app)
+
+
+def check_base_path(api: t.Any, new_api: t.Any) -> None:
+    """Raise a ReloadError if the new version of a mounted API has another base path, since it
+    can't take over the mount of the current version."""
+    if new_api.base_path != api.base_path:
+        raise ReloadError(
+            f"The base path of an API can't be reloaded, it changed from {api.base_path!r} "
+            f"to {new_api.base_path!r}"
+        )
+
+
 class AbstractSpecAPI:
     """Base API class with only minimal behavior related to the specification."""
 
@@ -42,8 +98,13 @@ class AbstractSpecAPI:
         resolver: t.Optional[Resolver] = None,
         uri_parser_class=None,
         *args,
+        reusable_routes: t.Optional[t.Mapping[RouteKey, t.Any]] = None,
         **kwargs,
     ):
+        """
+        :param reusable_routes: Routes of a previous version of this API, by path and method,
+            which are reused instead of built again when this API is reloaded.
+        """
         self.specification = specification
         self.uri_parser_class = uri_parser_class
 
@@ -51,10 +112,14 @@ class AbstractSpecAPI:
 
         self.resolver = resolver or Resolver()
 
+        # What is registered for each operation, so it can be reused on reload
+        self.routes: t.Dict[RouteKey, t.Any] = {}
+        self._reusable_routes = dict(reusable_routes or {})
+
     def _set_base_path(self, base_path: t.Optional[str] = None) -> None:
         if base_path is not None:
             # update spec to include user-provided base_path
-            self.specification.base_path = base_path
+            self.specification = self.specification.with_base_path(base_path)
             self.base_path = base_path
         else:
             self.base_path = self.specification.base_path
@@ -104,6 +169,8 @@ class AbstractRoutingAPI(AbstractSpecAPI, t.Generic[OP]):
                     # All other relevant exceptions should be handled as well.
                     self._handle_add_operation_error(path, method, e)
 
+        self._reusable_routes = {}
+
     def add_operation(self, path: str, method: str) -> None:
         """
         Adds one operation to the api.
@@ -117,17 +184,29 @@ class AbstractRoutingAPI(AbstractSpecAPI, t.Generic[OP]):
         A friendly name for the operation. The id MUST be unique among all operations described in the API.
         Tools and libraries MAY use the operation id to uniquely identify an operation.
         """
-        spec_operation_cls = self.specification.operation_cls
-        spec_operation = spec_operation_cls.from_spec(
-            self.specification,
-            path=path,
-            method=method,
-            resolver=self.resolver,
-            uri_parser_class=self.uri_parser_class,
-        )
-        operation = self.make_operation(spec_operation)
-        path, name = self._framework_path_and_name(spec_operation, path)
-        self._add_operation_internal(method, path, operation, name=name)
+        with profiling.phase("add_operation", operation=f"{method.upper()} {path}"):
+            route = self._reusable_routes.get((path, method))
+            if route is None:
+                spec_operation_cls = self.specification.operation_cls
+                spec_operation = spec_operation_cls.from_spec(
+                    self.specification,
+                    path=path,
+                    method=method,
+                    resolver=self.resolver,
+                    uri_parser_class=self.uri_parser_class,
+                )
+                operation = self.make_operation(spec_operation)
+                framework_path, name = self._framework_path_and_name(
+                    spec_operation, path
+                )
+                route = (framework_path, name, operation)
+            self.routes[(path, method)] = route
+
+            framework_path, name, operation = route
+            with profiling.phase("register_route"):
+                self._add_operation_internal(
+                    method, framework_path, operation, name=name
+                )
 
     @abc.abstractmethod
     def make_operation(self, operation: AbstractOperation) -> OP:
@@ -193,17 +272,25 @@ class RoutedAPI(AbstractSpecAPI, t.Generic[OP]):
                     # ResolverErrors are either raised or handled in routing middleware.
                     pass
 
+        self._reusable_routes = {}
+
     def add_operation(self, path: str, method: str) -> None:
-        operation_spec_cls = self.specification.operation_cls
-        operation = operation_spec_cls.from_spec(
-            self.specification,
-            path=path,
-            method=method,
-            resolver=self.resolver,
-            uri_parser_class=self.uri_parser_class,
-        )
-        routed_operation = self.make_operation(operation)
-        self.operations[operation.operation_id] = routed_operation
+        with profiling.phase("add_operation", operation=f"{method.upper()} {path}"):
+            route = self._reusable_routes.get((path, method))
+            if route is None:
+                operation_spec_cls = self.specification.operation_cls
+                operation = operation_spec_cls.from_spec(
+                    self.specification,
+                    path=path,
+                    method=method,
+                    resolver=self.resolver,
+                    uri_parser_class=self.uri_parser_class,
+                )
+                route = (operation.operation_id, self.make_operation(operation))
+            self.routes[(path, method)] = route
+
+            operation_id, routed_operation = route
+            self.operations[operation_id] = routed_operation
 
     @abc.abstractmethod
     def make_operation(self, operation: AbstractOperation) -> OP:
@@ -236,6 +323,38 @@ class RoutedMiddleware(SpecMiddleware, t.Generic[API]):
         self.apis[api.base_path].append(api)
         return api
 
+    def reload_api(
+        self,
+        api: API,
+        specification: Specification,
+        *,
+        unchanged: t.Collection[RouteKey],
+        **kwargs,
+    ) -> API:
+        return self.api_cls(
+            specification,
+            next_app=self.app,
+            reusable_routes=reusable_routes(api, unchanged),
+            **kwargs,
+        )
+
+    def swap_api(self, api: API, new_api: API) -> None:
+        apis = self.apis[api.base_path]
+        if new_api.base_path == api.base_path:
+            apis[apis.index(api)] = new_api
+        else:
+            apis.remove(api)
+            self.apis[new_api.base_path].append(new_api)
+
+    def warm_up(self) -> None:
+        """Prepare the operations of this middleware to handle requests, if they support it."""
+        for apis in self.apis.values():
+            for api in apis:
+                for operation in api.operations.values():
+                    warm_up = getattr(operation, "warm_up", None)
+                    if warm_up is not None:
+                        warm_up()
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Fetches the operation related to the request and calls it."""
         if scope["type"] != "http":
@@ -1,7 +1,8 @@
+import contextlib
 import typing as t
 
 from starlette.routing import Router
-from starlette.types import ASGIApp, Receive, Scope, Send
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 Lifespan = t.Callable[[t.Any], t.AsyncContextManager]
 
@@ -17,10 +18,37 @@ class LifespanMiddleware:
         self._lifespan = lifespan
         # Leverage a Starlette Router for lifespan handling only
         self.router = Router(lifespan=lifespan)
+        # Lifespans of Connexion itself, wrapped around the lifespan of the application
+        self._lifespans: t.List[Lifespan] = []
+
+    def add_lifespan(self, lifespan: Lifespan) -> None:
+        """Add a lifespan which is entered when the application starts, before the lifespan of
+        the application, and exited after the application shut down."""
+        self._lifespans.append(lifespan)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
-        # If no lifespan is registered, pass to next app so it can be handled downstream.
-        if scope["type"] == "lifespan" and self._lifespan:
-            await self.router(scope, receive, send)
-        else:
+        if scope["type"] != "lifespan":
             await self.next_app(scope, receive, send)
+            return
+
+        # If no lifespan is registered, pass to next app so it can be handled downstream.
+        app = self.router if self._lifespan else self.next_app
+        if not self._lifespans:
+            await app(scope, receive, send)
+            return
+
+        async with contextlib.AsyncExitStack() as stack:
+
+            async def receive_() -> Message:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    for lifespan in self._lifespans:
+                        await stack.enter_async_context(lifespan(scope.get("app")))
+                return message
+
+            async def send_(message: Message) -> None:
+                if message["type"] == "lifespan.shutdown.complete":
+                    await stack.aclose()
+                await send(message)
+
+            await app(scope, receive_, send_)
@@ -1,15 +1,22 @@
+import asyncio
+import contextlib
 import copy
 import dataclasses
 import enum
+import gc
 import logging
+import os
 import pathlib
+import threading
 import typing as t
 from dataclasses import dataclass, field
 from functools import partial
 
+from starlette.concurrency import run_in_threadpool
 from starlette.types import ASGIApp, Receive, Scope, Send
 
-from connexion import utils
+from connexion import profiling, utils
+from connexion.exceptions import ReloadError
 from connexion.handlers import ResolverErrorHandler
 from connexion.jsonifier import Jsonifier
 from connexion.lifecycle import ConnexionRequest, ConnexionResponse
@@ -23,8 +30,9 @@ from connexion.middleware.routing import RoutingMiddleware
 from connexion.middleware.security import SecurityMiddleware
 from connexion.middleware.server_error import ServerErrorMiddleware
 from connexion.middleware.swagger_ui import SwaggerUIMiddleware
-from connexion.options import SwaggerUIOptions
+from connexion.options import HTTPClientOptions, SwaggerUIOptions, ThreadPoolOptions
 from connexion.resolver import Resolver
+from connexion.security import SecurityHook
 from connexion.spec import Specification
 from connexion.types import MaybeAwaitable
 from connexion.uri_parsing import AbstractURIParser
@@ -170,10 +178,74 @@ class MiddlewarePosition(enum.Enum):
 
 
 class API:
-    def __init__(self, specification, *, base_path, **kwargs) -> None:
+    def __init__(
+        self,
+        specification,
+        *,
+        base_path,
+        label=None,
+        source: t.Optional[pathlib.Path] = None,
+        spec_arguments: t.Optional[dict] = None,
+        **kwargs,
+    ) -> None:
         self.specification = specification
         self.base_path = base_path
+        self.label = label
         self.kwargs = kwargs
+        # The file the specification was loaded from, and the arguments it was rendered with,
+        # so it can be reloaded
+        self.source = source
+        self.spec_arguments = spec_arguments
+        # The middlewares this API was added to, and what they returned for it
+        self.registrations: t.List[t.Tuple[SpecMiddleware, t.Any]] = []
+        # Versions of the specification files and fingerprints of the operations, to detect
+        # what changed on reload
+        self.file_versions: t.Optional[t.Dict[str, t.Tuple[int, int]]] = None
+        self.fingerprints: t.Optional[t.Dict[t.Tuple[str, str], str]] = None
+
+    def record_versions(self) -> None:
+        """Record the current version of the specification files and operations."""
+        files = _spec_files(self.source, self.specification)
+        self.file_versions = _file_versions(files)
+        self.fingerprints = self.specification.operation_fingerprints()
+
+    def changed(self) -> bool:
+        """Whether the specification files changed since their versions were recorded."""
+        if self.file_versions is None:
+            return True
+        return _file_versions(self.file_versions) != self.file_versions
+
+
+def _spec_files(
+    source: t.Optional[pathlib.Path], specification: Specification
+) -> t.List[str]:
+    """The files of a specification, including the files it references."""
+    if source is None:
+        return []
+    return [str(source), *sorted(specification.referenced_files())]
+
+
+def _file_versions(paths: t.Iterable[str]) -> t.Dict[str, t.Tuple[int, int]]:
+    versions = {}
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            versions[path] = (-1, -1)
+        else:
+            versions[path] = (stat.st_mtime_ns, stat.st_size)
+    return versions
+
+
+class _Reload(t.NamedTuple):
+    """A reload of an API which is prepared, but not swapped in yet."""
+
+    specification: Specification
+    file_versions: t.Dict[str, t.Tuple[int, int]]
+    fingerprints: t.Dict[t.Tuple[str, str], str]
+    previous: t.List[t.Tuple[SpecMiddleware, t.Any]]
+    registrations: t.List[t.Tuple[SpecMiddleware, t.Any]]
+    rebuilt: t.List[t.Tuple[str, str]]
 
 
 class ConnexionMiddleware:
@@ -200,6 +272,12 @@ class ConnexionMiddleware:
         lifespan: t.Optional[Lifespan] = None,
         middlewares: t.Optional[t.List[ASGIApp]] = None,
         specification_dir: t.Union[pathlib.Path, str] = "",
+        spec_cache_dir: t.Optional[t.Union[pathlib.Path, str]] = None,
+        profile_startup: t.Optional[bool] = None,
+        reload_interval: t.Optional[float] = None,
+        http_client_options: t.Optional[HTTPClientOptions] = None,
+        security_thread_pool_options: t.Optional[ThreadPoolOptions] = None,
+        security_hooks: t.Optional[t.List[SecurityHook]] = None,
         arguments: t.Optional[dict] = None,
         auth_all_paths: t.Optional[bool] = None,
         jsonifier: t.Optional[Jsonifier] = None,
@@ -222,6 +300,24 @@ class ConnexionMiddleware:
         :param specification_dir: The directory holding the specification(s). The provided path
             should either be absolute or relative to the root path of the application. Defaults to
             the root path.
+        :param spec_cache_dir: Directory to cache loaded specifications in, so later starts can
+            skip parsing, validating and resolving them. The provided path should either be
+            absolute or relative to the root path of the application. Disabled by default.
+        :param profile_startup: Whether to profile the startup of the application. The report is
+            available via :attr:`startup_profiler`. Defaults to the
+            ``CONNEXION_PROFILE_STARTUP`` environment variable.
+        :param reload_interval: Interval in seconds at which to check the specification files for
+            changes while the application is running. Changed specifications are reloaded, and
+            only the operations that changed are rebuilt. See :meth:`reload`. The files are
+            watched during the lifespan of the application, so this requires a server which
+            supports the ASGI lifespan protocol. Disabled by default.
+        :param http_client_options: Instance of :class:`options.HTTPClientOptions` to configure
+            the HTTP client shared by the security handlers, for instance to call token info
+            urls.
+        :param security_thread_pool_options: Instance of :class:`options.ThreadPoolOptions` to
+            configure the thread pool in which synchronous security functions are run.
+        :param security_hooks: Callables which are called with a :class:`security.SecurityEvent`
+            after each verification of a security scheme, for instance to record metrics.
         :param arguments: Arguments to substitute the specification using Jinja.
         :param auth_all_paths: whether to authenticate not paths not defined in the specification.
             Defaults to False.
@@ -253,6 +349,25 @@ class ConnexionMiddleware:
             spec_dir if spec_dir.is_absolute() else self.root_path / spec_dir
         )
 
+        self.spec_cache_dir: t.Optional[pathlib.Path] = None
+        if spec_cache_dir is not None:
+            cache_dir = pathlib.Path(spec_cache_dir)
+            self.spec_cache_dir = (
+                cache_dir if cache_dir.is_absolute() else self.root_path / cache_dir
+            )
+
+        if profile_startup is None:
+            profile_startup = profiling.profile_startup_from_env()
+        self.startup_profiler: t.Optional[profiling.StartupProfiler] = (
+            profiling.StartupProfiler() if profile_startup else None
+        )
+
+        self.reload_interval = reload_interval
+        self.http_client_options = http_client_options
+        self.security_thread_pool_options = security_thread_pool_options
+        self.security_hooks = security_hooks
+        self._reload_lock = threading.Lock()
+
         self.app = app
         self.lifespan = lifespan
         self.middlewares = (
@@ -318,35 +433,69 @@ class ConnexionMiddleware:
         :return: Tuple of the outer middleware wrapping the application and a list of the wrapped
             middlewares, including the wrapped application.
         """
-        # Include the wrapped application in the returned list.
-        app = self.app
-        apps = [app]
-        for middleware in reversed(self.middlewares):
-            arguments, _ = inspect_function_arguments(middleware)
-            if "lifespan" in arguments:
-                app = middleware(app, lifespan=self.lifespan)  # type: ignore
-            else:
-                app = middleware(app)  # type: ignore
-            apps.append(app)
-
-        # We sort the APIs by base path so that the most specific APIs are registered first.
-        # This is due to the way Starlette matches routes.
-        self.apis = utils.sort_apis_by_basepath(self.apis)
-        for app in apps:
-            if isinstance(app, SpecMiddleware):
-                for api in self.apis:
-                    app.add_api(
-                        api.specification,
-                        base_path=api.base_path,
-                        **api.kwargs,
-                    )
-
-            if isinstance(app, ExceptionMiddleware):
-                for error_handler in self.error_handlers:
-                    app.add_exception_handler(*error_handler)
+        with self._profile(), profiling.phase("build_middleware_stack"):
+            # Include the wrapped application in the returned list.
+            app = self.app
+            apps = [app]
+            for middleware in reversed(self.middlewares):
+                arguments, _ = inspect_function_arguments(middleware)
+                kwargs: t.Dict[str, t.Any] = {}
+                if "lifespan" in arguments:
+                    kwargs["lifespan"] = self.lifespan
+                if "http_client_options" in arguments:
+                    kwargs["http_client_options"] = self.http_client_options
+                if "security_thread_pool_options" in arguments:
+                    kwargs[
+                        "security_thread_pool_options"
+                    ] = self.security_thread_pool_options
+                if "security_hooks" in arguments:
+                    kwargs["security_hooks"] = self.security_hooks
+                app = middleware(app, **kwargs)  # type: ignore
+                apps.append(app)
+
+            # Let middlewares manage their resources within the lifespan of the application
+            for lifespan_app in apps:
+                if isinstance(lifespan_app, LifespanMiddleware):
+                    for app in apps:
+                        lifespan = getattr(app, "lifespan", None)
+                        if isinstance(app, SpecMiddleware) and callable(lifespan):
+                            lifespan_app.add_lifespan(lifespan)
+
+            # We sort the APIs by base path so that the most specific APIs are registered first.
+            # This is due to the way Starlette matches routes.
+            self.apis = utils.sort_apis_by_basepath(self.apis)
+            for app in apps:
+                if isinstance(app, SpecMiddleware):
+                    for api in self.apis:
+                        with profiling.phase(type(app).__name__, api=api.label):
+                            registered = app.add_api(
+                                api.specification,
+                                base_path=api.base_path,
+                                **api.kwargs,
+                            )
+                        api.registrations.append((app, registered))
+
+                if isinstance(app, ExceptionMiddleware):
+                    for error_handler in self.error_handlers:
+                        app.add_exception_handler(*error_handler)
+
+            # Also when not watching, so a manual reload only reloads what changed
+            for api in self.apis:
+                if api.source is not None:
+                    with profiling.phase("record_versions", api=api.label):
+                        api.record_versions()
+
+        if self.startup_profiler is not None:
+            logger.info("Startup profile:\n%s", self.startup_profiler.format_report())
 
         return app, list(reversed(apps))
 
+    def _profile(self) -> t.ContextManager:
+        """Context in which the startup is profiled, if enabled."""
+        if self.startup_profiler is None:
+            return contextlib.nullcontext()
+        return self.startup_profiler.activate()
+
     def add_api(
         self,
         specification: t.Union[pathlib.Path, str, dict],
@@ -406,12 +555,20 @@ class ConnexionMiddleware:
         if self.middleware_stack is not None:
             raise RuntimeError("Cannot add api after an application has started")
 
+        # Label to identify the API by in the startup profile
+        if name is not None or isinstance(specification, (pathlib.Path, str)):
+            label = str(name or specification)
+        else:
+            label = base_path or specification.get("info", {}).get("title")
+
+        source = None
         if isinstance(specification, str) and (
             specification.startswith("http://") or specification.startswith("https://")
         ):
             pass
         elif isinstance(specification, (pathlib.Path, str)):
             specification = t.cast(pathlib.Path, self.specification_dir / specification)
+            source = specification
 
             # Add specification as file to watch for reloading
             if pathlib.Path.cwd() in specification.parents:
@@ -419,7 +576,10 @@ class ConnexionMiddleware:
                     str(specification.relative_to(pathlib.Path.cwd()))
                 )
 
-        specification = Specification.load(specification, arguments=arguments)
+        with self._profile(), profiling.phase("load_specification", api=label):
+            specification = Specification.load(
+                specification, arguments=arguments, cache_dir=self.spec_cache_dir
+            )
 
         options = self.options.replace(
             auth_all_paths=auth_all_paths,
@@ -436,7 +596,14 @@ class ConnexionMiddleware:
         )
 
         api = API(
-            specification, base_path=base_path, name=name, **options.__dict__, **kwargs
+            specification,
+            base_path=base_path,
+            name=name,
+            label=label,
+            source=source,
+            spec_arguments=arguments,
+            **options.__dict__,
+            **kwargs,
         )
         self.apis.append(api)
 
@@ -462,6 +629,147 @@ class ConnexionMiddleware:
         error_handler = (code_or_exception, function)
         self.error_handlers.append(error_handler)
 
+    def warm_up(self, *, freeze: bool = True) -> None:
+        """Prepare the application to handle requests, so this isn't done on the first request.
+        This builds the middleware stack, builds the validators, resolves the endpoint functions
+        and renders the specification documents.
+
+        Call this before forking worker processes, e.g. in a module loaded with gunicorn's
+        ``--preload`` option, so the work is done once and the memory is shared between the
+        workers.
+
+        :param freeze: Whether to move all objects tracked by the garbage collector into a
+            permanent generation using :func:`gc.freeze`. This prevents the garbage collector from
+            touching them in the workers, which would copy the memory pages they are on.
+        """
+        if self.middleware_stack is None:
+            self.app, self.middleware_stack = self._build_middleware_stack()
+
+        for app in self.middleware_stack:
+            warm_up = getattr(app, "warm_up", None)
+            if warm_up is not None:
+                warm_up()
+
+        if freeze:
+            gc.collect()
+            gc.freeze()
+
+    def reload(self) -> t.List[str]:
+        """Reload the APIs of which the specification file, or a file it references, changed.
+
+        Only the operations of which the definition changed are rebuilt. The others, including
+        their validators and resolved endpoint functions, are reused. All middlewares first
+        prepare their new version of an API before any of them is swapped in, so a specification
+        which fails to load or build leaves the running version untouched.
+
+        Only APIs added from a file can be reloaded. If the application was not started yet,
+        only their specifications are replaced.
+
+        :return: The labels of the reloaded APIs.
+        """
+        reloaded = []
+        with self._reload_lock:
+            for api in self.apis:
+                if api.source is not None and api.changed():
+                    self._swap(api, self._prepare_reload(api))
+                    reloaded.append(api.label)
+        return reloaded
+
+    def _prepare_reload(self, api: API) -> _Reload:
+        """Load the new version of the specification of an API and prepare the new version of the
+        API on every middleware it is registered on."""
+        source = t.cast(pathlib.Path, api.source)
+        # Record the versions before loading, so changes made while loading are picked up later
+        file_versions = _file_versions(api.file_versions or [str(source)])
+        specification = Specification.load(
+            source, arguments=api.spec_arguments, cache_dir=self.spec_cache_dir
+        )
+        for path in _spec_files(source, specification):
+            file_versions.setdefault(path, _file_versions([path])[path])
+
+        base_path = specification.base_path
+        if api.base_path is None and base_path != api.specification.base_path:
+            raise ReloadError("The base path of an API can't be reloaded")
+
+        fingerprints = specification.operation_fingerprints()
+        # Without fingerprints of the running version, all operations are rebuilt
+        previous_fingerprints = api.fingerprints or {}
+        unchanged = {
+            key
+            for key, fingerprint in fingerprints.items()
+            if previous_fingerprints.get(key) == fingerprint
+        }
+
+        registrations = [
+            (
+                middleware,
+                middleware.reload_api(
+                    registered,
+                    specification,
+                    unchanged=unchanged,
+                    base_path=api.base_path,
+                    **api.kwargs,
+                ),
+            )
+            for middleware, registered in api.registrations
+        ]
+        return _Reload(
+            specification,
+            file_versions=file_versions,
+            fingerprints=fingerprints,
+            previous=api.registrations,
+            registrations=registrations,
+            rebuilt=sorted(fingerprints.keys() - unchanged),
+        )
+
+    def _swap(self, api: API, reload: _Reload) -> None:
+        """Swap in a prepared reload of an API, unless the API was reloaded in the meantime."""
+        if api.registrations is not reload.previous:
+            return
+
+        for (middleware, registered), (_, new_registered) in zip(
+            api.registrations, reload.registrations
+        ):
+            middleware.swap_api(registered, new_registered)
+
+        api.specification = reload.specification
+        api.registrations = reload.registrations
+        api.file_versions = reload.file_versions
+        api.fingerprints = reload.fingerprints
+        logger.info(
+            "Reloaded %s, rebuilt operations: %s",
+            api.label,
+            ", ".join(f"{method.upper()} {path}" for path, method in reload.rebuilt)
+            or "none",
+        )
+
+    async def _watch_specifications(self) -> None:
+        """Periodically reload the APIs of which the specification changed. The reloads are
+        prepared in a thread, and swapped in on the event loop in between requests."""
+        interval = t.cast(float, self.reload_interval)
+        while True:
+            await asyncio.sleep(interval)
+            # Don't block the event loop while a reload is in progress, try again later instead
+            if not self._reload_lock.acquire(blocking=False):
+                continue
+            try:
+                await self._reload_changed()
+            finally:
+                self._reload_lock.release()
+
+    async def _reload_changed(self) -> None:
+        for api in self.apis:
+            if api.source is None or not api.changed():
+                continue
+            try:
+                reload = await run_in_threadpool(self._prepare_reload, api)
+            except Exception:
+                logger.exception("Failed to reload %s", api.label)
+                # Don't retry until the files change again
+                api.file_versions = _file_versions(api.file_versions or ())
+            else:
+                self._swap(api, reload)
+
     def run(self, import_string: t.Optional[str] = None, **kwargs):
         """Run the application using uvicorn.
 
@@ -500,4 +808,16 @@ class ConnexionMiddleware:
         # Set so starlette router throws exceptions instead of returning error responses
         # This instance is also passed to any lifespan handler
         scope["app"] = self
+
+        if scope["type"] == "lifespan" and self.reload_interval is not None:
+            # Watch the specifications for as long as the application runs
+            watcher = asyncio.get_running_loop().create_task(
+                self._watch_specifications()
+            )
+            try:
+                await self.app(scope, receive, send)
+            finally:
+                watcher.cancel()
+            return
+
         await self.app(scope, receive, send)
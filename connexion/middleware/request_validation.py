@@ -15,6 +15,9 @@ from connexion.validators import VALIDATOR_MAP
 
 logger = logging.getLogger("connexion.middleware.validation")
 
+# The mime type of a request is chosen by the client, so the number of cached validators is limited
+MAX_BODY_VALIDATORS = 16
+
 
 class RequestValidationOperation:
     def __init__(
@@ -30,6 +33,8 @@ class RequestValidationOperation:
         self.strict_validation = strict_validation
         self._validator_map = VALIDATOR_MAP.copy()
         self._validator_map.update(validator_map or {})
+        # Body validators by mime type, None if the body isn't validated
+        self._body_validators: t.Dict[str, t.Any] = {}
 
     def extract_content_type(
         self, headers: t.List[t.Tuple[bytes, bytes]]
@@ -94,27 +99,32 @@ class RequestValidationOperation:
 
         return self._security_query_params
 
-    async def __call__(self, scope: Scope, receive: Receive, send: Send):
-        # Validate parameters & headers
-        uri_parser_class = self._operation._uri_parser_class
-        uri_parser = uri_parser_class(
-            self._operation.parameters, self._operation.body_definition()
-        )
-        parameter_validator_cls = self._validator_map["parameter"]
-        parameter_validator = parameter_validator_cls(  # type: ignore
-            self._operation.parameters,
-            uri_parser=uri_parser,
-            strict_validation=self.strict_validation,
-            security_query_params=self.security_query_params,
-        )
-        parameter_validator.validate(scope)
+    @property
+    def parameter_validator(self):
+        """Validator for the parameters of the operation, which is built once."""
+        if not hasattr(self, "_parameter_validator"):
+            uri_parser_class = self._operation._uri_parser_class
+            uri_parser = uri_parser_class(
+                self._operation.parameters, self._operation.body_definition()
+            )
+            parameter_validator_cls = self._validator_map["parameter"]
+            self._parameter_validator = parameter_validator_cls(  # type: ignore
+                self._operation.parameters,
+                uri_parser=uri_parser,
+                strict_validation=self.strict_validation,
+                security_query_params=self.security_query_params,
+            )
+        return self._parameter_validator
 
-        # Extract content type
-        headers = scope["headers"]
-        mime_type, encoding = self.extract_content_type(headers)
-        self.validate_mime_type(mime_type)
+    def body_validator(self, mime_type: str):
+        """Validator for request bodies of a mime type, or None if they aren't validated. It is
+        built once per mime type, and shared between requests."""
+        try:
+            return self._body_validators[mime_type]
+        except KeyError:
+            pass
 
-        # Validate body
+        validator = None
         schema = self._operation.body_schema(mime_type)
         if schema:
             try:
@@ -131,13 +141,42 @@ class RequestValidationOperation:
                     nullable=utils.is_nullable(
                         self._operation.body_definition(mime_type)
                     ),
-                    encoding=encoding,
+                    encoding="utf-8",
                     strict_validation=self.strict_validation,
                     uri_parser=self._operation.uri_parser_class(
                         self._operation.parameters, self._operation.body_definition()
                     ),
+                    ref_resolver=self._operation.ref_resolver,
                 )
-                receive, scope = await validator.wrap_receive(receive, scope=scope)
+
+        if len(self._body_validators) < MAX_BODY_VALIDATORS:
+            self._body_validators[mime_type] = validator
+        return validator
+
+    def warm_up(self) -> None:
+        """Build the validators of the parameters and of the bodies of the mime types the
+        operation consumes, so they're not built on the first request."""
+        self.parameter_validator
+        for mime_type in self._operation.consumes:
+            validator = self.body_validator(mime_type)
+            # Compile the schema validator as well
+            getattr(validator, "_validator", None)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        # Validate parameters & headers
+        self.parameter_validator.validate(scope)
+
+        # Extract content type
+        headers = scope["headers"]
+        mime_type, encoding = self.extract_content_type(headers)
+        self.validate_mime_type(mime_type)
+
+        # Validate body
+        validator = self.body_validator(mime_type)
+        if validator is not None:
+            receive, scope = await validator.wrap_receive(
+                receive, scope=scope, encoding=encoding
+            )
 
         await self.next_app(scope, receive, send)
 
@@ -28,6 +28,8 @@ class ResponseValidationOperation:
         self._operation = operation
         self._validator_map = VALIDATOR_MAP.copy()
         self._validator_map.update(validator_map or {})
+        # Body validators by status and mime type, None if the body isn't validated
+        self._body_validators: t.Dict[t.Tuple[str, str], t.Any] = {}
 
     def extract_content_type(
         self, headers: t.List[t.Tuple[bytes, bytes]]
@@ -86,6 +88,48 @@ class ResponseValidationOperation:
             ).format(pretty_list)
             raise NonConformingResponseHeaders(detail=msg)
 
+    def body_validator(self, status: str, mime_type: str):
+        """Validator for response bodies with a status and mime type, or None if they aren't
+        validated. It is built once per status and mime type, and shared between requests."""
+        key = (status, mime_type)
+        try:
+            return self._body_validators[key]
+        except KeyError:
+            pass
+
+        validator = None
+        try:
+            body_validator = self._validator_map["response"][mime_type]  # type: ignore
+        except KeyError:
+            logger.info(
+                f"Skipping validation. No validator registered for content type: "
+                f"{mime_type}."
+            )
+        else:
+            validator = body_validator(
+                None,
+                schema=self._operation.response_schema(status, mime_type),
+                nullable=utils.is_nullable(
+                    self._operation.response_definition(status, mime_type)
+                ),
+                encoding="utf-8",
+                ref_resolver=self._operation.ref_resolver,
+            )
+
+        self._body_validators[key] = validator
+        return validator
+
+    def warm_up(self) -> None:
+        """Build the validators of the responses the operation defines, for the mime types it
+        produces, so they're not built on the first request."""
+        for status in self._operation.responses:
+            if status == "default":
+                continue
+            for mime_type in self._operation.produces:
+                validator = self.body_validator(str(status), mime_type)
+                # Compile the schema validator as well
+                getattr(validator, "validator", None)
+
     async def __call__(self, scope: Scope, receive: Receive, send: Send):
         async def wrapped_send(message: t.MutableMapping[str, t.Any]) -> None:
             nonlocal send
@@ -104,23 +148,9 @@ class ResponseValidationOperation:
                 self.validate_required_headers(headers, response_definition)
 
                 # Validate body
-                try:
-                    body_validator = self._validator_map["response"][mime_type]  # type: ignore
-                except KeyError:
-                    logger.info(
-                        f"Skipping validation. No validator registered for content type: "
-                        f"{mime_type}."
-                    )
-                else:
-                    validator = body_validator(
-                        scope,
-                        schema=self._operation.response_schema(status, mime_type),
-                        nullable=utils.is_nullable(
-                            self._operation.response_definition(status, mime_type)
-                        ),
-                        encoding=encoding,
-                    )
-                    send = validator.wrap_send(send)
+                validator = self.body_validator(status, mime_type)
+                if validator is not None:
+                    send = validator.wrap_send(send, scope=scope, encoding=encoding)
 
             return await send(message)
 
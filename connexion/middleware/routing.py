@@ -9,7 +9,11 @@ from connexion.frameworks import starlette as starlette_utils
 from connexion.middleware.abstract import (
     ROUTING_CONTEXT,
     AbstractRoutingAPI,
+    RouteKey,
     SpecMiddleware,
+    check_base_path,
+    replace_mount,
+    reusable_routes,
 )
 from connexion.operations import AbstractOperation
 from connexion.resolver import Resolver
@@ -119,7 +123,7 @@ class RoutingMiddleware(SpecMiddleware):
         base_path: t.Optional[str] = None,
         arguments: t.Optional[dict] = None,
         **kwargs,
-    ) -> None:
+    ) -> RoutingAPI:
         """Add an API to the router based on a OpenAPI spec.
 
         :param specification: OpenAPI spec.
@@ -145,6 +149,37 @@ class RoutingMiddleware(SpecMiddleware):
                 route.app.default = api.router
 
         self.router.mount(api.base_path, app=api.router)
+        return api
+
+    def reload_api(
+        self,
+        api: RoutingAPI,
+        specification: Specification,
+        *,
+        unchanged: t.Collection[RouteKey],
+        **kwargs,
+    ) -> RoutingAPI:
+        new_api = RoutingAPI(
+            specification,
+            next_app=self.app,
+            reusable_routes=reusable_routes(api, unchanged),
+            **kwargs,
+        )
+        check_base_path(api, new_api)
+        return new_api
+
+    def swap_api(self, api: RoutingAPI, new_api: RoutingAPI) -> None:
+        # Keep the chain of APIs registered on the same base path
+        new_api.router.default = api.router.default
+        for route in self.router.routes:
+            if (
+                isinstance(route, starlette.routing.Mount)
+                and route.path == api.base_path
+                and route.app.default is api.router
+            ):
+                route.app.default = new_api.router
+
+        replace_mount(self.router, api.router, new_api.router, api.base_path)
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         """Route request to matching operation, and attach it to the scope before calling the
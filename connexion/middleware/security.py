@@ -1,3 +1,4 @@
+import contextlib
 import logging
 import typing as t
 from collections import defaultdict
@@ -6,10 +7,12 @@ from starlette.types import ASGIApp, Receive, Scope, Send
 
 from connexion.exceptions import ProblemException
 from connexion.lifecycle import ConnexionRequest
-from connexion.middleware.abstract import RoutedAPI, RoutedMiddleware
+from connexion.middleware.abstract import RoutedAPI, RoutedMiddleware, RouteKey
 from connexion.operations import AbstractOperation
-from connexion.security import SecurityHandlerFactory
+from connexion.options import HTTPClientOptions, ThreadPoolOptions
+from connexion.security import SecurityHandlerFactory, SecurityHook, SharedHTTPClient
 from connexion.spec import Specification
+from connexion.utils import ThreadPool
 
 logger = logging.getLogger("connexion.middleware.security")
 
@@ -22,11 +25,13 @@ class SecurityOperation:
         security_handler_factory: SecurityHandlerFactory,
         security: list,
         security_schemes: dict,
+        operation_id: t.Optional[str] = None,
     ):
         self.next_app = next_app
         self.security_handler_factory = security_handler_factory
         self.security = security
         self.security_schemes = security_schemes
+        self.operation_id = operation_id
         self.verification_fn = self._get_verification_fn()
 
     @classmethod
@@ -52,6 +57,7 @@ class SecurityOperation:
             security_handler_factory=security_handler_factory,
             security=operation.security,
             security_schemes=operation.security_schemes,
+            operation_id=getattr(operation, "operation_id", None),
         )
 
     def _get_verification_fn(self):
@@ -85,7 +91,9 @@ class SecurityOperation:
                 if sec_req_func is None:
                     break
 
-                sec_req_funcs[scheme_name] = sec_req_func
+                sec_req_funcs[scheme_name] = self.security_handler_factory.instrument(
+                    sec_req_func, scheme_name, self.operation_id
+                )
 
             else:
                 # No break encountered: no missing funcs
@@ -99,7 +107,9 @@ class SecurityOperation:
                         )
                     )
 
-        return self.security_handler_factory.verify_security(auth_funcs)
+        return self.security_handler_factory.verify_security(
+            auth_funcs, concurrent=self.security_handler_factory.concurrent
+        )
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if not self.security:
@@ -117,11 +127,22 @@ class SecurityAPI(RoutedAPI[SecurityOperation]):
         *args,
         auth_all_paths: bool = False,
         security_map: t.Optional[dict] = None,
+        http_client: t.Optional[SharedHTTPClient] = None,
+        thread_pool: t.Optional[ThreadPool] = None,
+        security_hooks: t.Optional[t.Sequence[SecurityHook]] = None,
+        security_caches: t.Optional[t.Dict[t.Hashable, t.Any]] = None,
         **kwargs,
     ):
         super().__init__(*args, **kwargs)
 
-        self.security_handler_factory = SecurityHandlerFactory(security_map)
+        self.security_handler_factory = SecurityHandlerFactory(
+            security_map,
+            http_client=http_client,
+            thread_pool=thread_pool,
+            concurrent=bool(self.specification.get("x-concurrentSecurity", False)),
+            hooks=security_hooks,
+            caches=security_caches,
+        )
 
         if auth_all_paths:
             self.add_auth_on_not_found()
@@ -157,6 +178,66 @@ class SecurityMiddleware(RoutedMiddleware[SecurityAPI]):
 
     api_cls = SecurityAPI
 
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        http_client_options: t.Optional[HTTPClientOptions] = None,
+        security_thread_pool_options: t.Optional[ThreadPoolOptions] = None,
+        security_hooks: t.Optional[t.Sequence[SecurityHook]] = None,
+    ) -> None:
+        """
+        :param app: app to wrap in middleware.
+        :param http_client_options: Options for the HTTP client shared by the security handlers.
+        :param security_thread_pool_options: Options for the thread pool to run synchronous
+            security functions in.
+        :param security_hooks: Callables to report the verification of each security scheme to.
+        """
+        super().__init__(app)
+        self.http_client = SharedHTTPClient(http_client_options)
+        thread_pool_options = security_thread_pool_options or ThreadPoolOptions()
+        self.thread_pool = thread_pool_options.create_pool("security")
+        self.security_hooks = security_hooks
+        # The caches of the security handlers, shared between the APIs and their reloads
+        self.security_caches: t.Dict[t.Hashable, t.Any] = {}
+
+    def add_api(self, specification: Specification, **kwargs) -> SecurityAPI:
+        return super().add_api(
+            specification,
+            http_client=self.http_client,
+            thread_pool=self.thread_pool,
+            security_hooks=self.security_hooks,
+            security_caches=self.security_caches,
+            **kwargs,
+        )
+
+    def reload_api(
+        self,
+        api: SecurityAPI,
+        specification: Specification,
+        *,
+        unchanged: t.Collection[RouteKey],
+        **kwargs,
+    ) -> SecurityAPI:
+        return super().reload_api(
+            api,
+            specification,
+            unchanged=unchanged,
+            http_client=self.http_client,
+            thread_pool=self.thread_pool,
+            security_hooks=self.security_hooks,
+            security_caches=self.security_caches,
+            **kwargs,
+        )
+
+    @contextlib.asynccontextmanager
+    async def lifespan(self, app: t.Any) -> t.AsyncIterator[None]:
+        """Close the shared HTTP client when the application shuts down."""
+        try:
+            yield
+        finally:
+            await self.http_client.aclose()
+
 
 class MissingSecurityOperation(ProblemException):
     pass
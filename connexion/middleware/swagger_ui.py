@@ -9,12 +9,17 @@ from starlette.responses import RedirectResponse
 from starlette.responses import Response as StarletteResponse
 from starlette.routing import Router
 from starlette.staticfiles import StaticFiles
-from starlette.templating import Jinja2Templates
 from starlette.types import ASGIApp, Receive, Scope, Send
 
+from connexion.json_schema import break_cycles
 from connexion.jsonifier import Jsonifier
 from connexion.middleware import SpecMiddleware
-from connexion.middleware.abstract import AbstractSpecAPI
+from connexion.middleware.abstract import (
+    AbstractSpecAPI,
+    RouteKey,
+    check_base_path,
+    replace_mount,
+)
 from connexion.options import SwaggerUIConfig, SwaggerUIOptions
 from connexion.spec import Specification
 from connexion.utils import yamldumper
@@ -24,6 +29,9 @@ logger = logging.getLogger("connexion.middleware.swagger_ui")
 
 _original_scope: ContextVar[Scope] = ContextVar("SCOPE")
 
+MAX_RENDERED_DOCUMENTS = 16
+"""Maximum number of rendered specification documents cached per API."""
+
 
 class SwaggerUIAPI(AbstractSpecAPI):
     def __init__(
@@ -47,10 +55,16 @@ class SwaggerUIAPI(AbstractSpecAPI):
         if self.options.swagger_ui_available:
             self.add_swagger_ui()
 
+        # Imported lazily, so Jinja2 is only loaded when the swagger ui is used
+        from starlette.templating import Jinja2Templates
+
         self._templates = Jinja2Templates(
             directory=str(self.options.swagger_ui_template_dir)
         )
 
+        # Rendered specification documents by (format, base path)
+        self._documents: t.Dict[t.Tuple[str, str], bytes] = {}
+
     @staticmethod
     def normalize_string(string):
         return re.sub(r"[^a-zA-Z0-9]", "_", string.strip("/"))
@@ -63,14 +77,31 @@ class SwaggerUIAPI(AbstractSpecAPI):
             "route_root_path", request.scope.get("root_path", "")
         ).rstrip("/")
 
-    def _spec_for_prefix(self, request) -> dict:
-        """
-        returns a spec with a modified basePath / servers block
-        which corresponds to the incoming request path.
-        This is needed when behind a path-altering reverse proxy.
-        """
-        base_path = self._base_path_for_prefix(request)
-        return self.specification.with_base_path(base_path).raw
+    def _render_document(self, format_: str, base_path: str) -> bytes:
+        """Render the specification for the base path as json or yaml, caching the result."""
+        key = (format_, base_path)
+        document = self._documents.get(key)
+        if document is None:
+            spec = break_cycles(self.specification.with_base_path(base_path))
+            if format_ == "json":
+                # Yaml parses datetime objects when loading the spec, so we need our custom
+                # jsonifier to dump it
+                document = Jsonifier().dumps(spec).encode()
+            else:
+                document = yamldumper(spec).encode()
+            # The base path depends on the deployment, so the number of entries is limited
+            if len(self._documents) < MAX_RENDERED_DOCUMENTS:
+                self._documents[key] = document
+        return document
+
+    def warm_up(self) -> None:
+        """Render the specification documents served at the base path of this API, when the
+        application isn't mounted under a root path."""
+        base_path = self.base_path.rstrip("/")
+        if self.options.openapi_spec_available:
+            self._render_document("json", base_path)
+            if self.options.openapi_spec_path.endswith("json"):
+                self._render_document("yaml", base_path)
 
     def add_openapi_json(self):
         """
@@ -103,18 +134,15 @@ class SwaggerUIAPI(AbstractSpecAPI):
         )
 
     async def _get_openapi_json(self, request):
-        # Yaml parses datetime objects when loading the spec, so we need our custom jsonifier to dump it
-        jsonifier = Jsonifier()
-
         return StarletteResponse(
-            content=jsonifier.dumps(self._spec_for_prefix(request)),
+            content=self._render_document("json", self._base_path_for_prefix(request)),
             status_code=200,
             media_type="application/json",
         )
 
     async def _get_openapi_yaml(self, request):
         return StarletteResponse(
-            content=yamldumper(self._spec_for_prefix(request)),
+            content=self._render_document("yaml", self._base_path_for_prefix(request)),
             status_code=200,
             media_type="text/yaml",
         )
@@ -189,6 +217,7 @@ class SwaggerUIMiddleware(SpecMiddleware):
         :param app: app to wrap in middleware.
         """
         self.app = app
+        self.apis: t.List[SwaggerUIAPI] = []
         # Set default to pass unknown routes to next app
         self.router = Router(default=self.default_fn)
 
@@ -198,7 +227,7 @@ class SwaggerUIMiddleware(SpecMiddleware):
         base_path: t.Optional[str] = None,
         arguments: t.Optional[dict] = None,
         **kwargs
-    ) -> None:
+    ) -> SwaggerUIAPI:
         """Add an API to the router based on a OpenAPI spec.
 
         :param specification: OpenAPI spec.
@@ -212,7 +241,29 @@ class SwaggerUIMiddleware(SpecMiddleware):
             default=self.default_fn,
             **kwargs
         )
+        self.apis.append(api)
         self.router.mount(api.base_path, app=api.router)
+        return api
+
+    def reload_api(
+        self,
+        api: SwaggerUIAPI,
+        specification: Specification,
+        *,
+        unchanged: t.Collection[RouteKey],
+        **kwargs
+    ) -> SwaggerUIAPI:
+        new_api = SwaggerUIAPI(specification, default=self.default_fn, **kwargs)
+        check_base_path(api, new_api)
+        return new_api
+
+    def swap_api(self, api: SwaggerUIAPI, new_api: SwaggerUIAPI) -> None:
+        self.apis[self.apis.index(api)] = new_api
+        replace_mount(self.router, api.router, new_api.router, api.base_path)
+
+    def warm_up(self) -> None:
+        for api in self.apis:
+            api.warm_up()
 
     async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
         if scope["type"] != "http":
@@ -6,6 +6,7 @@ and functionality shared between Swagger 2 and OpenAPI 3 specifications.
 import abc
 import logging
 import typing as t
+import warnings
 
 from connexion.utils import all_json
 
@@ -208,13 +209,38 @@ class AbstractOperation(metaclass=abc.ABCMeta):
         Returns the types for parameters in the path
         """
 
-    @abc.abstractmethod
+    @property
+    def ref_resolver(self):
+        """
+        Resolver for references remaining in the schemas of this operation. It is shared between
+        the operations of a specification, so the definitions don't need to be attached to every
+        schema that is validated.
+        """
+        return self._ref_resolver
+
     def with_definitions(self, schema):
         """
         Returns the given schema, but with the definitions from the spec
         attached. This allows any remaining references to be resolved by a
         validator (for example).
+
+        Deprecated: pass the :attr:`ref_resolver` to the validator instead. The given schema is
+        no longer modified, since it can be shared with other operations.
         """
+        warnings.warn(
+            "with_definitions is deprecated, resolve references with ref_resolver instead",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        if "schema" not in schema:
+            return schema
+        document = self.ref_resolver.referrer
+        definitions = {
+            key: document[key]
+            for key in ("components", "definitions")
+            if key in document
+        }
+        return {**schema, "schema": {**schema["schema"], **definitions}}
 
     def get_mimetype(self):
         """
@@ -241,6 +267,15 @@ class AbstractOperation(metaclass=abc.ABCMeta):
         """
         return self._uri_parser_class
 
+    @property
+    def resolution(self):
+        """
+        Resolution of the operation, which can be lazy.
+
+        :rtype: connexion.resolver.Resolution
+        """
+        return self._resolution
+
     @property
     def function(self):
         """
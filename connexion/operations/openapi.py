@@ -7,6 +7,7 @@ import typing as t
 from http import HTTPStatus
 
 from connexion.datastructures import MediaTypeDict, NoContent
+from connexion.json_schema import create_ref_resolver
 from connexion.operations.abstract import AbstractOperation
 from connexion.uri_parsing import OpenAPIURIParser
 from connexion.utils import build_example_from_schema, deep_get
@@ -32,6 +33,7 @@ class OpenAPIOperation(AbstractOperation):
         components=None,
         randomize_endpoint=None,
         uri_parser_class=None,
+        ref_resolver=None,
     ):
         """
         This class uses the OperationID identify the module and function that will handle the operation
@@ -64,8 +66,14 @@ class OpenAPIOperation(AbstractOperation):
         :type randomize_endpoint: integer
         :param uri_parser_class: class to use for uri parsing
         :type uri_parser_class: AbstractURIParser
+        :param ref_resolver: Resolver for references in the schemas of the operation, shared
+            between the operations of a specification. Built from the components if not provided.
+        :type ref_resolver: jsonschema.RefResolver
         """
         self.components = components or {}
+        self._ref_resolver = ref_resolver or create_ref_resolver(
+            {"components": self.components}
+        )
 
         uri_parser_class = uri_parser_class or OpenAPIURIParser
 
@@ -84,7 +92,7 @@ class OpenAPIOperation(AbstractOperation):
 
         self._parameters = operation.get("parameters", [])
         if path_parameters:
-            self._parameters += path_parameters
+            self._parameters = self._parameters + path_parameters
 
         self._responses = operation.get("responses", {})
 
@@ -111,6 +119,7 @@ class OpenAPIOperation(AbstractOperation):
             app_security=spec.security,
             security_schemes=spec.security_schemes,
             components=spec.components,
+            ref_resolver=spec.ref_resolver,
             *args,
             **kwargs,
         )
@@ -134,19 +143,11 @@ class OpenAPIOperation(AbstractOperation):
     def produces(self):
         return self._produces
 
-    def with_definitions(self, schema: dict):
-        if self.components:
-            schema.setdefault("schema", {})
-            schema["schema"]["components"] = self.components
-        return schema
-
     def response_schema(self, status_code=None, content_type=None):
         response_definition = self.response_definition(status_code, content_type)
         content_definition = response_definition.get("content", response_definition)
         content_definition = content_definition.get(content_type, content_definition)
-        if "schema" in content_definition:
-            return self.with_definitions(content_definition).get("schema", {})
-        return {}
+        return content_definition.get("schema", {})
 
     def example_response(self, status_code=None, content_type=None):
         """
@@ -240,6 +241,5 @@ class OpenAPIOperation(AbstractOperation):
                     content_type,
                 )
             content_type_dict = MediaTypeDict(self.request_body.get("content", {}))
-            res = content_type_dict.get(content_type, {})
-            return self.with_definitions(res)
+            return content_type_dict.get(content_type, {})
         return {}
@@ -8,6 +8,7 @@ from http import HTTPStatus
 
 from connexion.datastructures import NoContent
 from connexion.exceptions import InvalidSpecification
+from connexion.json_schema import create_ref_resolver
 from connexion.operations.abstract import AbstractOperation
 from connexion.uri_parsing import Swagger2URIParser
 from connexion.utils import build_example_from_schema, deep_get
@@ -49,6 +50,7 @@ class Swagger2Operation(AbstractOperation):
         definitions=None,
         randomize_endpoint=None,
         uri_parser_class=None,
+        ref_resolver=None,
     ):
         """
         :param method: HTTP method
@@ -77,6 +79,9 @@ class Swagger2Operation(AbstractOperation):
         :type randomize_endpoint: integer
         :param uri_parser_class: class to use for uri parsing
         :type uri_parser_class: AbstractURIParser
+        :param ref_resolver: Resolver for references in the schemas of the operation, shared
+            between the operations of a specification. Built from the definitions if not provided.
+        :type ref_resolver: jsonschema.RefResolver
         """
         uri_parser_class = uri_parser_class or Swagger2URIParser
 
@@ -97,10 +102,13 @@ class Swagger2Operation(AbstractOperation):
         self._consumes = operation.get("consumes", app_consumes)
 
         self.definitions = definitions or {}
+        self._ref_resolver = ref_resolver or create_ref_resolver(
+            {"definitions": self.definitions}
+        )
 
         self._parameters = operation.get("parameters", [])
         if path_parameters:
-            self._parameters += path_parameters
+            self._parameters = self._parameters + path_parameters
 
         self._responses = operation.get("responses", {})
 
@@ -117,6 +125,7 @@ class Swagger2Operation(AbstractOperation):
             app_security=spec.security,
             security_schemes=spec.security_schemes,
             definitions=spec.definitions,
+            ref_resolver=spec.ref_resolver,
             *args,
             **kwargs,
         )
@@ -175,14 +184,9 @@ class Swagger2Operation(AbstractOperation):
             types[path_defn["name"]] = path_type
         return types
 
-    def with_definitions(self, schema):
-        if "schema" in schema:
-            schema["schema"]["definitions"] = self.definitions
-        return schema
-
     def response_schema(self, status_code=None, content_type=None):
         response_definition = self.response_definition(status_code, content_type)
-        return self.with_definitions(response_definition.get("schema", {}))
+        return response_definition.get("schema", {})
 
     def example_response(self, status_code=None, *args, **kwargs):
         """
@@ -229,7 +233,7 @@ class Swagger2Operation(AbstractOperation):
         The body schema definition for this operation.
         """
         body_definition = self.body_definition(content_type)
-        return self.with_definitions(body_definition).get("schema", {})
+        return body_definition.get("schema", {})
 
     def body_definition(self, content_type: t.Optional[str] = None) -> dict:
         """
@@ -243,7 +247,10 @@ class Swagger2Operation(AbstractOperation):
         """Translate Swagger2 json parameters into OpenAPI 3 jsonschema spec."""
         nullable = body_parameter.get("x-nullable")
         if nullable is not None:
-            body_parameter["schema"]["nullable"] = nullable
+            body_parameter = {
+                **body_parameter,
+                "schema": {**body_parameter["schema"], "nullable": nullable},
+            }
         return body_parameter
 
     def _transform_form(self, form_parameters: t.List[dict]) -> dict:
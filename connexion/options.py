@@ -5,6 +5,8 @@ import dataclasses
 import logging
 import typing as t
 
+from connexion.utils import ThreadPool, ThreadPoolWaitHook
+
 try:
     from swagger_ui_bundle import swagger_ui_path as default_template_dir
 except ImportError:
@@ -45,6 +47,70 @@ class SwaggerUIOptions:
     swagger_ui_template_arguments: dict = dataclasses.field(default_factory=dict)
 
 
+@dataclasses.dataclass
+class HTTPClientOptions:
+    """Options to configure the HTTP client shared by the security handlers of an application, for
+    instance to call token info urls.
+
+    :param timeout: Timeout in seconds for connecting, reading, writing and acquiring a connection
+        from the pool.
+    :param max_connections: Maximum number of concurrent connections.
+    :param max_keepalive_connections: Maximum number of idle connections to keep alive.
+    :param keepalive_expiry: Time in seconds to keep idle connections alive.
+    :param http2: Whether to use HTTP/2 if the server supports it. Requires the `h2` package,
+        which can be installed with `pip install httpx[http2]`.
+    """
+
+    timeout: float = 5
+    max_connections: t.Optional[int] = 100
+    max_keepalive_connections: t.Optional[int] = 20
+    keepalive_expiry: t.Optional[float] = 5
+    http2: bool = False
+
+    def create_client(self):
+        """Create an `httpx.AsyncClient` with these options."""
+        # Imported lazily, since it's only needed for remote token validation
+        import httpx
+
+        return httpx.AsyncClient(
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+                keepalive_expiry=self.keepalive_expiry,
+            ),
+            http2=self.http2,
+        )
+
+
+@dataclasses.dataclass
+class ThreadPoolOptions:
+    """Options to configure the thread pool in which synchronous functions are run, so they don't
+    block the event loop.
+
+    :param max_threads: Maximum number of functions to run at once. If not provided, the default
+        thread limit of anyio is shared, which is 40 threads unless configured otherwise.
+    :param wait_hooks: Callables which are called with the name of the pool and the time in
+        seconds a function waited for a thread, for instance to record metrics to size the pool.
+    """
+
+    max_threads: t.Optional[int] = None
+    wait_hooks: t.Sequence[ThreadPoolWaitHook] = ()
+
+    def create_pool(
+        self, name: str = "default", max_threads: t.Optional[int] = None
+    ) -> ThreadPool:
+        """Create a :class:`utils.ThreadPool` with these options.
+
+        :param name: Name of the pool, which is passed to the wait hooks.
+        :param max_threads: Maximum number of functions to run at once, instead of
+            :attr:`max_threads`.
+        """
+        if max_threads is None:
+            max_threads = self.max_threads
+        return ThreadPool(max_threads, name=name, wait_hooks=self.wait_hooks)
+
+
 class SwaggerUIConfig:
     """Class holding swagger UI specific options."""
 
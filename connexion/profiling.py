@@ -0,0 +1,230 @@
+"""
+This module defines a profiler for the startup of Connexion applications. It records the wall time
+and memory allocations of the startup phases, such as loading the specifications, building the
+middleware stack and adding the operations, per API and per operation.
+"""
+
+import contextlib
+import dataclasses
+import os
+import time
+import tracemalloc
+import typing as t
+from contextvars import ContextVar
+
+PROFILE_STARTUP_ENV = "CONNEXION_PROFILE_STARTUP"
+"""Environment variable to enable the startup profiler if it's not explicitly configured."""
+
+_profiler: ContextVar[t.Optional["StartupProfiler"]] = ContextVar(
+    "STARTUP_PROFILER", default=None
+)
+
+
+def profile_startup_from_env() -> bool:
+    """Whether the startup profiler is enabled via the environment."""
+    return os.environ.get(PROFILE_STARTUP_ENV, "").lower() in ("1", "true", "yes")
+
+
+@dataclasses.dataclass
+class Phase:
+    """A recorded startup phase."""
+
+    name: str
+    api: t.Optional[str] = None
+    operation: t.Optional[str] = None
+    duration: float = 0.0
+    """Wall time of the phase in seconds."""
+    allocated: t.Optional[int] = None
+    """Bytes allocated and still in use at the end of the phase, if allocations are traced."""
+    children: t.List["Phase"] = dataclasses.field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "api": self.api,
+            "operation": self.operation,
+            "duration": self.duration,
+            "allocated": self.allocated,
+            "children": [child.to_dict() for child in self.children],
+        }
+
+
+class StartupProfiler:
+    """Profiler recording the startup phases of an application.
+
+    Phases are recorded by the :func:`phase` context manager while the profiler is active. Nested
+    phases inherit the api and operation of the phase they are part of.
+    """
+
+    def __init__(self, *, trace_allocations: bool = True) -> None:
+        """
+        :param trace_allocations: Whether to trace memory allocations using :mod:`tracemalloc`.
+            Tracing allocations slows down the startup considerably, which also affects the
+            recorded wall times.
+        """
+        self.trace_allocations = trace_allocations
+        self.phases: t.List[Phase] = []
+        self._stack: t.List[Phase] = []
+
+    @contextlib.contextmanager
+    def activate(self) -> t.Iterator["StartupProfiler"]:
+        """Record the phases in this context on this profiler."""
+        token = _profiler.set(self)
+        start_tracing = self.trace_allocations and not tracemalloc.is_tracing()
+        if start_tracing:
+            tracemalloc.start()
+        try:
+            yield self
+        finally:
+            if start_tracing:
+                tracemalloc.stop()
+            _profiler.reset(token)
+
+    @contextlib.contextmanager
+    def phase(
+        self,
+        name: str,
+        *,
+        api: t.Optional[str] = None,
+        operation: t.Optional[str] = None,
+    ) -> t.Iterator[Phase]:
+        """Record a phase of the startup."""
+        parent = self._stack[-1] if self._stack else None
+        if parent is not None:
+            api = api or parent.api
+            operation = operation or parent.operation
+        phase = Phase(name, api=api, operation=operation)
+        (parent.children if parent is not None else self.phases).append(phase)
+        self._stack.append(phase)
+
+        tracing = tracemalloc.is_tracing()
+        allocated = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.perf_counter()
+        try:
+            yield phase
+        finally:
+            phase.duration = time.perf_counter() - start
+            if tracing and tracemalloc.is_tracing():
+                phase.allocated = tracemalloc.get_traced_memory()[0] - allocated
+            self._stack.pop()
+
+    def report(self) -> dict:
+        """Structured report of the recorded phases.
+
+        Next to the tree of recorded ``phases``, the report contains the totals per ``api`` and
+        per ``operation``, summed over all middlewares.
+        """
+        apis: t.Dict[str, dict] = {}
+        operations: t.Dict[t.Tuple[str, str], dict] = {}
+
+        def add(totals: dict, phase: Phase) -> None:
+            totals["duration"] += phase.duration
+            if phase.allocated is not None:
+                totals["allocated"] = (totals["allocated"] or 0) + phase.allocated
+
+        def walk(phases: t.List[Phase], parent: t.Optional[Phase]) -> None:
+            for phase in phases:
+                # Only count the outermost phase of an api or operation, which includes its children
+                if phase.api is not None and (parent is None or parent.api is None):
+                    add(
+                        apis.setdefault(
+                            phase.api,
+                            {"api": phase.api, "duration": 0.0, "allocated": None},
+                        ),
+                        phase,
+                    )
+                if phase.operation is not None and (
+                    parent is None or parent.operation is None
+                ):
+                    key = (phase.api or "", phase.operation)
+                    add(
+                        operations.setdefault(
+                            key,
+                            {
+                                "api": phase.api,
+                                "operation": phase.operation,
+                                "duration": 0.0,
+                                "allocated": None,
+                            },
+                        ),
+                        phase,
+                    )
+                walk(phase.children, phase)
+
+        walk(self.phases, None)
+
+        def by_duration(totals):
+            return sorted(totals, key=lambda total: total["duration"], reverse=True)
+
+        return {
+            "duration": sum(phase.duration for phase in self.phases),
+            "phases": [phase.to_dict() for phase in self.phases],
+            "apis": by_duration(apis.values()),
+            "operations": by_duration(operations.values()),
+        }
+
+    def format_report(self, *, max_operations: int = 20) -> str:
+        """Human readable report of the recorded phases.
+
+        :param max_operations: Maximum number of the slowest operations to list.
+        """
+        report = self.report()
+        lines = [f"Startup took {_format_duration(report['duration'])}", ""]
+
+        def format_phases(
+            phases: t.List[dict], parent_api: t.Optional[str], depth: int
+        ):
+            for phase in phases:
+                # Operations are summarized below instead of listed per middleware
+                if phase["operation"] is not None:
+                    continue
+                name = phase["name"]
+                if phase["api"] != parent_api:
+                    name += f" [api={phase['api']}]"
+                lines.append(
+                    f"{_format_duration(phase['duration']):>10} "
+                    f"{_format_size(phase['allocated']):>10}  {'  ' * depth}{name}"
+                )
+                format_phases(phase["children"], phase["api"], depth + 1)
+
+        format_phases(report["phases"], None, 0)
+
+        if report["operations"]:
+            lines += ["", f"Slowest operations (top {max_operations}):"]
+            for total in report["operations"][:max_operations]:
+                lines.append(
+                    f"{_format_duration(total['duration']):>10} "
+                    f"{_format_size(total['allocated']):>10}  "
+                    f"{total['operation']} [api={total['api']}]"
+                )
+        return "\n".join(lines)
+
+
+@contextlib.contextmanager
+def phase(
+    name: str, *, api: t.Optional[str] = None, operation: t.Optional[str] = None
+) -> t.Iterator[t.Optional[Phase]]:
+    """Record a startup phase on the active :class:`StartupProfiler`. This does nothing if no
+    profiler is active.
+
+    :param name: Name of the phase
+    :param api: API the phase belongs to, inherited from the enclosing phase if not provided
+    :param operation: Operation the phase belongs to, inherited from the enclosing phase if not
+        provided
+    """
+    profiler = _profiler.get()
+    if profiler is None:
+        yield None
+        return
+    with profiler.phase(name, api=api, operation=operation) as phase_:
+        yield phase_
+
+
+def _format_duration(duration: float) -> str:
+    return f"{duration * 1000:.1f} ms"
+
+
+def _format_size(size: t.Optional[int]) -> str:
+    if size is None:
+        return "-"
+    return f"{size / 1024:.1f} KiB"
@@ -3,13 +3,14 @@ This module contains resolvers, functions that resolves the user defined view fu
 from the operations defined in the OpenAPI spec.
 """
 
+import functools
 import inspect
 import logging
+import threading
 import typing as t
 
-from inflection import camelize
-
 import connexion.utils as utils
+from connexion import profiling
 from connexion.exceptions import ResolverError
 
 logger = logging.getLogger("connexion.resolver")
@@ -26,6 +27,38 @@ class Resolution:
         self.function = function
         self.operation_id = operation_id
 
+    @property
+    def is_resolved(self) -> bool:
+        """Whether the endpoint function has been resolved"""
+        return True
+
+
+class LazyResolution(Resolution):
+    def __init__(self, function_resolver: t.Callable[[], t.Callable], operation_id):
+        """
+        Represents the result of a lazy operation resolution. The endpoint function is only
+        resolved when it is first accessed. This is done once, even if it is accessed from
+        multiple threads at the same time.
+
+        :param function_resolver: Callable without arguments that resolves the endpoint function
+        """
+        self._function_resolver = function_resolver
+        self._function: t.Optional[t.Callable] = None
+        self._lock = threading.Lock()
+        self.operation_id = operation_id
+
+    @property
+    def is_resolved(self) -> bool:
+        return self._function is not None
+
+    @property
+    def function(self):
+        if self._function is None:
+            with self._lock:
+                if self._function is None:
+                    self._function = self._function_resolver()
+        return self._function
+
 
 class Resolver:
     def __init__(self, function_resolver: t.Callable = utils.get_function_from_name):
@@ -43,9 +76,9 @@ class Resolver:
         :type operation: connexion.operations.AbstractOperation
         """
         operation_id = self.resolve_operation_id(operation)
-        return Resolution(
-            self.resolve_function_from_operation_id(operation_id), operation_id
-        )
+        with profiling.phase("resolve_function"):
+            function = self.resolve_function_from_operation_id(operation_id)
+        return Resolution(function, operation_id)
 
     def resolve_operation_id(self, operation):
         """
@@ -74,6 +107,48 @@ class Resolver:
             raise ResolverError(str(e))
 
 
+class LazyResolver(Resolver):
+    """
+    Resolves endpoint functions on the first request to their operation instead of at startup, so
+    applications with many operations start faster. Only the operationIds are resolved at startup,
+    errors resolving the endpoint functions are raised on the first request instead.
+    """
+
+    def __init__(self, resolver: t.Optional[t.Union[Resolver, t.Callable]] = None):
+        """
+        :param resolver: Resolver to resolve the endpoint functions with lazily, or a callable
+            that maps operationId to a function. Defaults to a :class:`Resolver`.
+        """
+        if resolver is None:
+            resolver = Resolver()
+        elif not isinstance(resolver, Resolver):
+            resolver = Resolver(function_resolver=resolver)
+        self.resolver = resolver
+        super().__init__(function_resolver=resolver.function_resolver)
+
+    def resolve(self, operation):
+        """
+        Resolves the operationId, and defers resolving the function to the first access. The
+        function is resolved with the `resolve` method of the wrapped resolver, so resolvers
+        which override it keep their behaviour.
+
+        :type operation: connexion.operations.AbstractOperation
+        """
+        operation_id = self.resolve_operation_id(operation)
+        return LazyResolution(
+            functools.partial(self._resolve_function, operation), operation_id
+        )
+
+    def _resolve_function(self, operation):
+        return self.resolver.resolve(operation).function
+
+    def resolve_operation_id(self, operation):
+        return self.resolver.resolve_operation_id(operation)
+
+    def resolve_function_from_operation_id(self, operation_id):
+        return self.resolver.resolve_function_from_operation_id(operation_id)
+
+
 class RelativeResolver(Resolver):
     """
     Resolves endpoint functions relative to a given root path or module.
@@ -246,6 +321,8 @@ class MethodResolverBase(RestyResolver):
         # Use RestyResolver to get operation_id for us (follow their naming conventions/structure)
         operation_id = self.resolve_operation_id_using_rest_semantics(operation)
         module_name, view_base, meth_name = operation_id.rsplit(".", 2)
+        from inflection import camelize
+
         view_name = camelize(view_base) + "View"
 
         return f"{module_name}.{view_name}.{meth_name}"
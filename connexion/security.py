@@ -45,17 +45,31 @@ OpenAPI 3.0 lets you describe APIs protected using the following security scheme
 
 import asyncio
 import base64
-import http.cookies
+import collections
+import dataclasses
+import functools
+import hashlib
+import hmac
+import json
 import logging
 import os
+import secrets
+import threading
+import time
 import typing as t
+from contextvars import ContextVar
 
-import httpx
+from starlette.requests import cookie_parser
 
 from connexion.decorators.parameter import inspect_function_arguments
 from connexion.exceptions import OAuthProblem, OAuthResponseProblem, OAuthScopeProblem
 from connexion.lifecycle import ConnexionRequest
-from connexion.utils import get_function_from_name
+from connexion.options import HTTPClientOptions
+from connexion.utils import ThreadPool, get_function_from_name, has_coroutine
+
+if t.TYPE_CHECKING:
+    import httpx
+    import jwt
 
 logger = logging.getLogger(__name__)
 
@@ -63,12 +77,331 @@ logger = logging.getLogger(__name__)
 NO_VALUE = object()
 """Sentinel value to indicate that no security credentials were found."""
 
+_MISSING = object()
+
+
+@dataclasses.dataclass
+class SecurityEvent:
+    """
+    The verification of a security scheme for a request, as reported to security hooks. Hooks are
+    called on the event loop after each verification, so they should be fast, for instance by
+    only updating metrics.
+    """
+
+    scheme: str
+    """The name of the security scheme."""
+    operation_id: t.Optional[str]
+    """The id of the operation, or None for paths which are not defined in the specification."""
+    outcome: str = ""
+    """
+    The outcome of the verification:
+
+    - ``success``: the credentials are valid.
+    - ``no_credentials``: the request has no credentials for the security scheme.
+    - ``unauthorized``: the credentials are invalid (401).
+    - ``forbidden``: the credentials are valid, but don't have the required scopes (403).
+    - ``error``: the verification failed with another error.
+    """
+    duration: float = 0.0
+    """The duration of the verification in seconds."""
+    cache: t.Optional[str] = None
+    """``hit`` or ``miss`` if a cache was used to verify the credentials, None otherwise."""
+    remote_calls: int = 0
+    """The number of calls to a token info url."""
+
+
+SecurityHook = t.Callable[[SecurityEvent], None]
+
+_security_event: ContextVar[t.Optional[SecurityEvent]] = ContextVar(
+    "SECURITY_EVENT", default=None
+)
+
+
+def instrument(
+    func: t.Callable,
+    hooks: t.Sequence[SecurityHook],
+    scheme: str,
+    operation_id: t.Optional[str],
+) -> t.Callable:
+    """
+    Wrap the function verifying a security scheme, so each verification is reported to the
+    hooks as a :class:`SecurityEvent`.
+
+    :param func: Function verifying the security scheme for a request.
+    :param hooks: The hooks to report to.
+    :param scheme: The name of the security scheme.
+    :param operation_id: The id of the operation.
+    """
+
+    async def wrapper(request):
+        event = SecurityEvent(scheme=scheme, operation_id=operation_id)
+        token = _security_event.set(event)
+        start = time.perf_counter()
+        try:
+            result = func(request)
+            while asyncio.iscoroutine(result):
+                result = await result
+        except Exception as exc:
+            status_code = getattr(exc, "status_code", getattr(exc, "status", None))
+            event.outcome = {401: "unauthorized", 403: "forbidden"}.get(
+                status_code, "error"
+            )
+            raise
+        else:
+            event.outcome = "no_credentials" if result is NO_VALUE else "success"
+            return result
+        finally:
+            event.duration = time.perf_counter() - start
+            _security_event.reset(token)
+            for hook in hooks:
+                try:
+                    hook(event)
+                except Exception:
+                    logger.exception("Security hook %r failed", hook)
+
+    return wrapper
+
+
+CacheInfo = collections.namedtuple(
+    "CacheInfo", ["hits", "misses", "negative_hits", "maxsize", "currsize"]
+)
+
+
+class TokenInfoCache:
+    """
+    Cache of the token info of tokens, bounded in size and in time. When the cache is full, the
+    least recently used entry is evicted.
+
+    An entry expires after the TTL of the cache, or earlier when the token info states it expires
+    sooner, via an ``exp`` timestamp or an ``expires_in`` number of seconds. Invalid tokens, for
+    which the token info is None, are cached as well for the negative TTL.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 60,
+        negative_ttl: t.Optional[float] = None,
+        *,
+        timer: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param maxsize: Maximum number of tokens to cache.
+        :param ttl: Maximum number of seconds to cache the token info of a valid token.
+        :param negative_ttl: Number of seconds to cache that a token is invalid. Defaults to the
+            TTL.
+        :param timer: Monotonic clock to expire entries with.
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.negative_ttl = ttl if negative_ttl is None else negative_ttl
+        self.timer = timer
+        self.hits = self.misses = self.negative_hits = 0
+        self._secret = secrets.token_bytes(32)
+        # Expiry time and token info, by token digest
+        self._entries: t.OrderedDict[
+            bytes, t.Tuple[float, t.Any]
+        ] = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _key(self, token: str) -> bytes:
+        # Don't keep the tokens themselves around. The digest is keyed with a random secret, so it
+        # can't be used to look up tokens or passwords offline, and lookups by digest don't leak
+        # the tokens through timing.
+        return hmac.digest(self._secret, token.encode(), hashlib.sha256)
+
+    def get(self, token: str, default: t.Any = None) -> t.Any:
+        """Return the cached token info of a token, which is None for an invalid token, or the
+        default if the token is not cached."""
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= self.timer():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                self._report("miss")
+                return default
+            self._entries.move_to_end(key)
+            if entry[1] is None:
+                self.negative_hits += 1
+            else:
+                self.hits += 1
+            self._report("hit")
+            return entry[1]
+
+    @staticmethod
+    def _report(result: str) -> None:
+        event = _security_event.get()
+        if event is not None:
+            event.cache = result
+
+    def set(self, token: str, token_info: t.Any) -> None:
+        """Cache the token info of a token, or None if the token is invalid."""
+        lifetime = self._lifetime(token_info)
+        if lifetime <= 0 or self.maxsize <= 0:
+            return
+
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (self.timer() + lifetime, token_info)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def _lifetime(self, token_info: t.Any) -> float:
+        if token_info is None:
+            return self.negative_ttl
+
+        lifetime = self.ttl
+        if isinstance(token_info, dict):
+            exp = token_info.get("exp")
+            if isinstance(exp, (int, float)):
+                lifetime = min(lifetime, exp - time.time())
+            expires_in = token_info.get("expires_in")
+            if isinstance(expires_in, (int, float)):
+                lifetime = min(lifetime, expires_in)
+        return lifetime
+
+    def cache_info(self) -> CacheInfo:
+        """Report the statistics of the cache, like :func:`functools.lru_cache`."""
+        return CacheInfo(
+            self.hits, self.misses, self.negative_hits, self.maxsize, len(self._entries)
+        )
+
+    def clear(self) -> None:
+        """Clear the cache and its statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.negative_hits = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls with the same key into a single call. Callers arriving while a
+    call for their key is in flight wait for it and share its result or error, instead of making
+    the same call again.
+    """
+
+    def __init__(self) -> None:
+        self._calls: t.Dict[t.Hashable, asyncio.Future] = {}
+
+    async def run(
+        self, key: t.Hashable, func: t.Callable[..., t.Awaitable], *args, **kwargs
+    ) -> t.Any:
+        """Await `func(*args, **kwargs)`, or the call in flight for the same key."""
+        loop = asyncio.get_running_loop()
+        future = self._calls.get(key)
+        if future is not None and future.get_loop() is loop:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The call in flight was cancelled with its caller, make the call ourselves
+                return await self.run(key, func, *args, **kwargs)
+
+        future = loop.create_future()
+        self._calls[key] = future
+        try:
+            result = await func(*args, **kwargs)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as e:
+            future.set_exception(e)
+            # Retrieve the exception, so it isn't logged if nobody was waiting for it
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            if self._calls.get(key) is future:
+                del self._calls[key]
+
+
+token_info_flights = SingleFlight()
+"""Coalesces concurrent token info lookups for the same token."""
+
+_default_thread_pool = ThreadPool()
+
+
+def coalesce_token_info(token_info_func: t.Callable, key: t.Hashable) -> t.Callable:
+    """
+    Wrap a coroutine function retrieving the token info of a token, so concurrent lookups of the
+    same token are coalesced into a single call.
+
+    :param token_info_func: Coroutine function accepting the token, and optionally the required
+        scopes.
+    :param key: Key identifying the source of the token info.
+    """
+
+    @functools.wraps(token_info_func)
+    async def wrapper(token, *args, **kwargs):
+        scopes = kwargs.get("required_scopes")
+        flight_key = (key, token, args, tuple(sorted(scopes)) if scopes else None)
+        token_info = await token_info_flights.run(
+            flight_key, token_info_func, token, *args, **kwargs
+        )
+        if isinstance(token_info, dict):
+            # Don't share the token info between the coalesced requests
+            token_info = dict(token_info)
+        return token_info
+
+    return wrapper
+
+
+class SharedHTTPClient:
+    """
+    HTTP client shared by the security handlers of an application. The underlying
+    `httpx.AsyncClient` is created on first use, and closed at the end of the lifespan of the
+    application.
+    """
+
+    def __init__(self, options: t.Optional[HTTPClientOptions] = None) -> None:
+        self.options = options or HTTPClientOptions()
+        self._client: t.Optional["httpx.AsyncClient"] = None
+
+    def get(self) -> "httpx.AsyncClient":
+        if self._client is None:
+            self._client = self.options.create_client()
+        return self._client
+
+    async def aclose(self) -> None:
+        client, self._client = self._client, None
+        if client is not None:
+            await client.aclose()
+
 
 class AbstractSecurityHandler:
 
     required_scopes_kw = "required_scopes"
     request_kw = "request"
     client = None
+    http_client: t.Optional[SharedHTTPClient] = None
+    """The HTTP client shared by the security handlers of the application, if any."""
+    thread_pool: t.Optional[ThreadPool] = None
+    """The thread pool to run synchronous security functions in. Defaults to the thread pool of
+    anyio."""
+    inline = False
+    """Whether to run synchronous security functions inline on the event loop instead of in the
+    thread pool, for functions which are fast enough. Set by ``x-inlineSecurityFunc``."""
+    credentials_cache_ttl: t.Optional[float] = None
+    """Number of seconds to cache the result of the security function for the same credentials.
+    Disabled by default, and overridden by ``x-credentialsCacheTtl``."""
+    credentials_cache_negative_ttl: t.Optional[float] = None
+    """Number of seconds to cache that credentials are invalid. Defaults to the TTL, and
+    overridden by ``x-credentialsCacheNegativeTtl``."""
+    credentials_cache_size: int = 1024
+    """Number of credentials to cache. Overridden by ``x-credentialsCacheSize``."""
+    caches: t.Optional[t.Dict[t.Hashable, t.Any]] = None
+    """The caches shared by the security handlers of the application, by what they cache and
+    their configuration. Set by the :class:`SecurityHandlerFactory`. Without it, the caches of a
+    handler are not shared."""
+    credentials_cache: t.Optional[TokenInfoCache] = None
+    """The cache of the security function of the security scheme of this handler, if enabled."""
     security_definition_key: str
     """The key which contains the value for the function name to resolve."""
     environ_key: str
@@ -81,8 +414,66 @@ class AbstractSecurityHandler:
             logger.warning("... %s missing", self.security_definition_key)
             return None
 
+        self.credentials_cache = self.get_credentials_cache(
+            security_scheme, security_func
+        )
         return self._get_verify_func(security_func)
 
+    def get_credentials_cache(
+        self, security_scheme: dict, func: t.Callable
+    ) -> t.Optional[TokenInfoCache]:
+        """
+        Gets the cache for the results of a security function, if it is enabled by
+        ``x-credentialsCacheTtl`` in the security scheme, or by the `credentials_cache_ttl` of
+        this handler. The size of the cache can be set with ``x-credentialsCacheSize`` and the
+        time to cache invalid credentials with ``x-credentialsCacheNegativeTtl``. Security schemes
+        with the same function and cache settings share their cache.
+
+        Functions which accept the request are not cached, since their result can depend on more
+        than the credentials.
+
+        :param security_scheme: Security Definition (scheme) from the spec.
+        :param func: The security function.
+        """
+        ttl = security_scheme.get("x-credentialsCacheTtl", self.credentials_cache_ttl)
+        if not ttl:
+            return None
+
+        if self._accepts_kwarg(func, self.request_kw):
+            logger.warning(
+                "... Not caching %s, since it accepts the request",
+                getattr(func, "__name__", func),
+            )
+            return None
+
+        negative_ttl = security_scheme.get(
+            "x-credentialsCacheNegativeTtl", self.credentials_cache_negative_ttl
+        )
+        maxsize = int(
+            security_scheme.get("x-credentialsCacheSize", self.credentials_cache_size)
+        )
+        ttl = float(ttl)
+        negative_ttl = None if negative_ttl is None else float(negative_ttl)
+        return self.get_cache(
+            ("credentials", func, maxsize, ttl, negative_ttl),
+            lambda: TokenInfoCache(maxsize=maxsize, ttl=ttl, negative_ttl=negative_ttl),
+        )
+
+    def get_cache(self, key: t.Hashable, create: t.Callable[[], t.Any]) -> t.Any:
+        """
+        Gets a cache shared by the security handlers of the application, creating it if it
+        doesn't exist yet.
+
+        :param key: What the cache caches and its configuration.
+        :param create: Callable creating the cache.
+        """
+        if self.caches is None:
+            self.caches = {}
+        cache = self.caches.get(key)
+        if cache is None:
+            cache = self.caches[key] = create()
+        return cache
+
     @classmethod
     def _get_function(
         cls,
@@ -107,17 +498,44 @@ class AbstractSecurityHandler:
         return default
 
     def _generic_check(self, func, exception_msg):
+        # Synchronous functions are run in the thread pool, so they don't block the event loop
+        run_in_thread_pool = not (self.inline or has_coroutine(func))
+        # Inspect the signature once, instead of on every request
+        pass_required_scopes = self._accepts_kwarg(func, self.required_scopes_kw)
+        pass_request = self._accepts_kwarg(func, self.request_kw)
+        cache = self.credentials_cache
+
         async def wrapper(request, *args, required_scopes=None):
+            if cache is not None:
+                # Encode the credentials unambiguously, the cache only keeps their digest
+                cache_key = json.dumps([args, sorted(required_scopes or [])])
+                token_info = cache.get(cache_key, _MISSING)
+                if token_info is not _MISSING:
+                    if token_info is None:
+                        raise OAuthResponseProblem(detail=exception_msg)
+                    if isinstance(token_info, dict):
+                        # Don't share the cached token info between requests
+                        token_info = dict(token_info)
+                    return token_info
+
             kwargs = {}
-            if self._accepts_kwarg(func, self.required_scopes_kw):
+            if pass_required_scopes:
                 kwargs[self.required_scopes_kw] = required_scopes
-            if self._accepts_kwarg(func, self.request_kw):
+            if pass_request:
                 kwargs[self.request_kw] = request
-            token_info = func(*args, **kwargs)
+            if run_in_thread_pool:
+                thread_pool = self.thread_pool or _default_thread_pool
+                token_info = await thread_pool.run(func, *args, **kwargs)
+            else:
+                token_info = func(*args, **kwargs)
             while asyncio.iscoroutine(token_info):
                 token_info = await token_info
             if token_info is NO_VALUE:
                 return NO_VALUE
+            if cache is not None:
+                cache.set(cache_key, token_info)
+                if isinstance(token_info, dict):
+                    token_info = dict(token_info)
             if token_info is None:
                 raise OAuthResponseProblem(detail=exception_msg)
             return token_info
@@ -141,6 +559,16 @@ class AbstractSecurityHandler:
             raise OAuthProblem(detail="Invalid authorization header")
         return auth_type.lower(), value
 
+    @classmethod
+    def _coalesce(cls, func: t.Callable) -> t.Callable:
+        """Coalesce concurrent calls of a coroutine function validating a token, unless its result
+        can depend on the request."""
+        if asyncio.iscoroutinefunction(func) and not cls._accepts_kwarg(
+            func, cls.request_kw
+        ):
+            return coalesce_token_info(func, func)
+        return func
+
     @staticmethod
     def _accepts_kwarg(func: t.Callable, keyword: str) -> bool:
         """Check if the function accepts the provided keyword argument."""
@@ -216,7 +644,7 @@ class BearerSecurityHandler(AbstractSecurityHandler):
         :param token_info_func: types.FunctionType
         :rtype: types.FunctionType
         """
-        check_bearer_func = self.check_bearer_token(token_info_func)
+        check_bearer_func = self.check_bearer_token(self._coalesce(token_info_func))
 
         def wrapper(request):
             auth_type, token = self.get_auth_header_value(request)
@@ -241,6 +669,9 @@ class ApiKeySecurityHandler(AbstractSecurityHandler):
             logger.warning("... %s missing", self.security_definition_key)
             return None
 
+        self.credentials_cache = self.get_credentials_cache(
+            security_scheme, apikey_info_func
+        )
         return self._get_verify_func(
             apikey_info_func,
             security_scheme["in"],
@@ -249,19 +680,14 @@ class ApiKeySecurityHandler(AbstractSecurityHandler):
         )
 
     def _get_verify_func(self, api_key_info_func, loc, name, required_scopes):
+        get_api_key = self.get_api_key_func(loc, name)
+        if get_api_key is None:
+            return lambda request: NO_VALUE
+
         check_api_key_func = self.check_api_key(api_key_info_func)
 
         def wrapper(request: ConnexionRequest):
-            if loc == "query":
-                api_key = request.query_params.get(name)
-            elif loc == "header":
-                api_key = request.headers.get(name)
-            elif loc == "cookie":
-                cookie_list = request.headers.get("Cookie")
-                api_key = self.get_cookie_value(cookie_list, name)
-            else:
-                return NO_VALUE
-
+            api_key = get_api_key(request)
             if api_key is None:
                 return NO_VALUE
 
@@ -269,6 +695,24 @@ class ApiKeySecurityHandler(AbstractSecurityHandler):
 
         return wrapper
 
+    def get_api_key_func(
+        self, loc: str, name: str
+    ) -> t.Optional[t.Callable[[ConnexionRequest], t.Optional[str]]]:
+        """
+        Return a function extracting the api key from a request, or None if the location is not
+        supported.
+
+        :param loc: The location of the api key: `query`, `header` or `cookie`.
+        :param name: The name of the api key.
+        """
+        if loc == "query":
+            return lambda request: request.query_params.get(name)
+        elif loc == "header":
+            return lambda request: request.headers.get(name)
+        elif loc == "cookie":
+            return lambda request: request.cookies.get(name)
+        return None
+
     def check_api_key(self, api_key_info_func):
         return self._generic_check(api_key_info_func, "Provided apikey is not valid")
 
@@ -280,12 +724,35 @@ class ApiKeySecurityHandler(AbstractSecurityHandler):
         :param cookies: str: cookies raw data
         :param name: str: cookies key
         """
-        cookie_parser = http.cookies.SimpleCookie()
-        cookie_parser.load(str(cookies))
-        try:
-            return cookie_parser[name].value
-        except KeyError:
-            return None
+        return cookie_parser(str(cookies)).get(name)
+
+
+async def _resolve_coroutine(result: t.Any) -> t.Any:
+    while asyncio.iscoroutine(result):
+        result = await result
+    return result
+
+
+async def _resolve(func: t.Callable, request: ConnexionRequest) -> t.Any:
+    return await _resolve_coroutine(func(request))
+
+
+def _validate_scope(required_scopes: t.AbstractSet[str], token_scopes) -> bool:
+    if isinstance(token_scopes, list):
+        token_scopes = set(token_scopes)
+    else:
+        token_scopes = set(token_scopes.split())
+    logger.debug("... Scopes required: %s", required_scopes)
+    logger.debug("... Token scopes: %s", token_scopes)
+    if not required_scopes <= token_scopes:
+        logger.info(
+            "... Token scopes (%s) do not match the scopes necessary to call endpoint (%s)."
+            " Aborting with 403.",
+            token_scopes,
+            required_scopes,
+        )
+        return False
+    return True
 
 
 class OAuthSecurityHandler(AbstractSecurityHandler):
@@ -318,16 +785,66 @@ class OAuthSecurityHandler(AbstractSecurityHandler):
             security_definition, "x-tokenInfoFunc", "TOKENINFO_FUNC"
         )
         if token_info_func:
-            return token_info_func
+            return self._coalesce(token_info_func)
 
         token_info_url = security_definition.get("x-tokenInfoUrl") or os.environ.get(
             "TOKENINFO_URL"
         )
         if token_info_url:
-            return self.get_token_info_remote(token_info_url)
+            token_info_func = self.get_token_info_remote(token_info_url)
+            cache = self.get_token_info_cache(security_definition, token_info_url)
+            if cache is not None:
+                token_info_func = self.cache_token_info(token_info_func, cache)
+            return token_info_func
 
         return None
 
+    def get_token_info_cache(
+        self, security_definition: dict, token_info_url: str
+    ) -> t.Optional[TokenInfoCache]:
+        """
+        Gets the cache for the token info retrieved from the token info url, if the security
+        definition enables it with ``x-tokenInfoCacheTtl``. The size of the cache can be set with
+        ``x-tokenInfoCacheSize`` and the time to cache invalid tokens with
+        ``x-tokenInfoCacheNegativeTtl``. Security definitions with the same token info url and
+        cache settings share their cache.
+        """
+        ttl = security_definition.get("x-tokenInfoCacheTtl")
+        if not ttl:
+            return None
+
+        negative_ttl = security_definition.get("x-tokenInfoCacheNegativeTtl")
+        maxsize = int(security_definition.get("x-tokenInfoCacheSize", 1024))
+        ttl = float(ttl)
+        negative_ttl = None if negative_ttl is None else float(negative_ttl)
+        return self.get_cache(
+            ("token_info", token_info_url, maxsize, ttl, negative_ttl),
+            lambda: TokenInfoCache(maxsize=maxsize, ttl=ttl, negative_ttl=negative_ttl),
+        )
+
+    @staticmethod
+    def cache_token_info(
+        token_info_func: t.Callable, cache: TokenInfoCache
+    ) -> t.Callable:
+        """
+        Wrap a function retrieving the token info of a token, so its results are cached.
+
+        :param token_info_func: Coroutine function accepting the token.
+        :param cache: The cache to use.
+        """
+
+        async def wrapper(token):
+            token_info = cache.get(token, _MISSING)
+            if token_info is _MISSING:
+                token_info = await token_info_func(token)
+                cache.set(token, token_info)
+            if isinstance(token_info, dict):
+                # Don't share the cached token info between requests
+                token_info = dict(token_info)
+            return token_info
+
+        return wrapper
+
     @classmethod
     def get_scope_validate_func(cls, security_definition):
         """
@@ -351,22 +868,24 @@ class OAuthSecurityHandler(AbstractSecurityHandler):
         :param token_scopes: Scopes granted by authorization server
         :rtype: bool
         """
-        required_scopes = set(required_scopes)
-        if isinstance(token_scopes, list):
-            token_scopes = set(token_scopes)
-        else:
-            token_scopes = set(token_scopes.split())
-        logger.debug("... Scopes required: %s", required_scopes)
-        logger.debug("... Token scopes: %s", token_scopes)
-        if not required_scopes <= token_scopes:
-            logger.info(
-                "... Token scopes (%s) do not match the scopes necessary to call endpoint (%s)."
-                " Aborting with 403.",
-                token_scopes,
-                required_scopes,
-            )
-            return False
-        return True
+        return _validate_scope(set(required_scopes), token_scopes)
+
+    @staticmethod
+    def compile_validate_scope(required_scopes: t.Iterable[str]) -> t.Callable:
+        """
+        Return a function equivalent to :meth:`validate_scope` for a fixed list of required
+        scopes, which computes the set of required scopes only once.
+
+        :param required_scopes: Scopes required to access operation
+        """
+        required_scope_set = frozenset(required_scopes)
+        if not required_scope_set:
+            return lambda required_scopes, token_scopes: True
+
+        def validate_scope(required_scopes, token_scopes):
+            return _validate_scope(required_scope_set, token_scopes)
+
+        return validate_scope
 
     def get_token_info_remote(self, token_info_url: str) -> t.Callable:
         """
@@ -374,24 +893,35 @@ class OAuthSecurityHandler(AbstractSecurityHandler):
 
         Returned function must accept oauth token in parameter.
         It must return a token_info dict in case of success, None otherwise.
+        Concurrent calls for the same token are coalesced into a single request.
 
         :param token_info_url: URL to get information about the token
         """
 
         async def wrapper(token):
-            if self.client is None:
-                self.client = httpx.AsyncClient()
             headers = {"Authorization": f"Bearer {token}"}
-            token_request = await self.client.get(
-                token_info_url, headers=headers, timeout=5
-            )
+            event = _security_event.get()
+            if event is not None:
+                event.remote_calls += 1
+            token_request = await self.get_client().get(token_info_url, headers=headers)
             if token_request.status_code != 200:
                 return
             return token_request.json()
 
-        return wrapper
+        return coalesce_token_info(wrapper, token_info_url)
+
+    def get_client(self) -> "httpx.AsyncClient":
+        """The HTTP client to call remote services with."""
+        client = self.client
+        if client is None and self.http_client is not None:
+            client = self.http_client.get()
+        if client is None:
+            client = self.client = HTTPClientOptions().create_client()
+        return client
 
     def _get_verify_func(self, token_info_func, scope_validate_func, required_scopes):
+        if scope_validate_func is self.validate_scope:
+            scope_validate_func = self.compile_validate_scope(required_scopes)
         check_oauth_func = self.check_oauth_func(token_info_func, scope_validate_func)
 
         def wrapper(request):
@@ -430,6 +960,212 @@ class OAuthSecurityHandler(AbstractSecurityHandler):
         return wrapper
 
 
+class JSONWebKeySet:
+    """
+    The keys of a JSON Web Key Set (JWKS) loaded from a file or url, indexed by key id.
+
+    The keys are loaded again after the refresh interval. When a token is signed with an unknown
+    key, for instance after the keys were rotated, they are loaded again as well, but at most once
+    per minimum refresh interval.
+    """
+
+    min_refresh_interval = 60
+
+    def __init__(
+        self,
+        source: str,
+        refresh_interval: float = 3600,
+        *,
+        thread_pool: t.Optional[ThreadPool] = None,
+        timer: t.Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        :param source: Url or path of the JWKS.
+        :param refresh_interval: Number of seconds after which to load the keys again.
+        :param thread_pool: Thread pool to read a JWKS file in, so it doesn't block the event
+            loop. Defaults to the thread pool of anyio.
+        :param timer: Monotonic clock to refresh the keys with.
+        """
+        self.source = source
+        self.refresh_interval = refresh_interval
+        self.thread_pool = thread_pool
+        self.timer = timer
+        self._keys: t.Dict[t.Optional[str], "jwt.PyJWK"] = {}
+        self._loaded_at: t.Optional[float] = None
+        self._flights = SingleFlight()
+
+    async def get_key(
+        self, key_id: t.Optional[str], get_client: t.Callable[[], "httpx.AsyncClient"]
+    ) -> t.Optional["jwt.PyJWK"]:
+        """
+        Get the key with the provided id, or the only key if no id is provided.
+
+        :param key_id: The `kid` in the header of the token.
+        :param get_client: Callable returning the HTTP client to load the keys with.
+        """
+        if self._loaded_at is None:
+            await self._flights.run(None, self._load, get_client)
+        else:
+            age = self.timer() - self._loaded_at
+            if age >= self.refresh_interval or (
+                key_id not in self._keys and age >= self.min_refresh_interval
+            ):
+                await self._flights.run(None, self._load, get_client)
+
+        if key_id is None and len(self._keys) == 1:
+            return next(iter(self._keys.values()))
+        return self._keys.get(key_id)
+
+    async def _load(self, get_client: t.Callable[[], "httpx.AsyncClient"]) -> None:
+        # Imported lazily, since it's only needed for local JWT validation
+        import jwt
+
+        try:
+            if self.source.startswith(("http://", "https://")):
+                response = await get_client().get(self.source)
+                response.raise_for_status()
+                data = response.json()
+            else:
+                path = self.source
+                if path.startswith("file://"):
+                    path = path[len("file://") :]
+                thread_pool = self.thread_pool or _default_thread_pool
+                data = await thread_pool.run(self._read_file, path)
+            key_set = jwt.PyJWKSet.from_dict(data)
+        except Exception:
+            if self._loaded_at is None:
+                raise
+            # Keep using the current keys, and try again after the minimum refresh interval
+            logger.exception("... Failed to refresh the JWKS from %s", self.source)
+            self._loaded_at = (
+                self.timer() - self.refresh_interval + self.min_refresh_interval
+            )
+            return
+
+        self._keys = {key.key_id: key for key in key_set.keys}
+        self._loaded_at = self.timer()
+
+    @staticmethod
+    def _read_file(path: str) -> t.Any:
+        with open(path, "rb") as f:
+            return json.load(f)
+
+
+class JWTSecurityHandler(OAuthSecurityHandler):
+    """
+    Security Handler which validates JWT bearer tokens locally, using the keys of a JSON Web Key
+    Set (JWKS). It can be registered for `bearer` and `oauth2` security schemes via the
+    `security_map`. Security schemes without a JWKS are handled by the default handlers.
+
+    The signature is verified against the key matching the `kid` of the token, as well as the
+    expiry and, if configured, the issuer and audience of the token. Decoded claims are cached
+    until the token expires.
+    """
+
+    def get_fn(self, security_scheme, required_scopes):
+        jwks_url = security_scheme.get("x-jwksUrl") or os.environ.get("JWKS_URL")
+        if not jwks_url:
+            fallback_cls = (
+                OAuthSecurityHandler
+                if security_scheme["type"] == "oauth2"
+                else BearerSecurityHandler
+            )
+            fallback = fallback_cls()
+            fallback.http_client = self.http_client
+            fallback.thread_pool = self.thread_pool
+            fallback.inline = self.inline
+            fallback.caches = self.caches
+            return fallback.get_fn(security_scheme, required_scopes)
+
+        return self._get_verify_func(
+            self.get_jwt_decode_func(security_scheme, jwks_url),
+            self.get_scope_validate_func(security_scheme),
+            required_scopes,
+        )
+
+    def get_jwt_decode_func(self, security_scheme: dict, jwks_url: str) -> t.Callable:
+        """
+        Return a function which validates a token and returns its claims, or None if the token is
+        invalid. The validation can be configured with the following security scheme extensions:
+
+        - ``x-jwksRefreshInterval``: Seconds after which to load the keys again, 3600 by default.
+        - ``x-jwtAlgorithms``: Allowed signing algorithms, ``["RS256"]`` by default.
+        - ``x-jwtIssuer``: Required issuer of the tokens.
+        - ``x-jwtAudience``: Required audience of the tokens.
+        - ``x-jwtLeeway``: Seconds of leeway when validating the expiry, 0 by default.
+        - ``x-jwtCacheSize``: Number of tokens to cache the claims of, 1024 by default.
+
+        :param security_scheme: Security Definition (scheme) from the spec.
+        :param jwks_url: Url or path of the JWKS.
+        """
+        refresh_interval = float(security_scheme.get("x-jwksRefreshInterval", 3600))
+        algorithms = list(security_scheme.get("x-jwtAlgorithms", ["RS256"]))
+        issuer = security_scheme.get("x-jwtIssuer")
+        audience = security_scheme.get("x-jwtAudience")
+        leeway = float(security_scheme.get("x-jwtLeeway", 0))
+
+        maxsize = int(security_scheme.get("x-jwtCacheSize", 1024))
+
+        key_set = self.get_cache(
+            ("jwks", jwks_url, refresh_interval),
+            lambda: JSONWebKeySet(
+                jwks_url, refresh_interval, thread_pool=self.thread_pool
+            ),
+        )
+        cache = self.get_cache(
+            (
+                "jwt_claims",
+                jwks_url,
+                refresh_interval,
+                tuple(algorithms),
+                issuer,
+                str(audience),
+                leeway,
+                maxsize,
+            ),
+            # Claims are cached until the token expires, invalid tokens are not cached
+            lambda: TokenInfoCache(
+                maxsize=maxsize, ttl=refresh_interval, negative_ttl=0
+            ),
+        )
+
+        async def decode(token):
+            # Imported lazily, since it's only needed for local JWT validation
+            import jwt
+
+            claims = cache.get(token, _MISSING)
+            if claims is not _MISSING:
+                return dict(claims)
+
+            try:
+                key_id = jwt.get_unverified_header(token).get("kid")
+            except jwt.InvalidTokenError:
+                return None
+            key = await key_set.get_key(key_id, self.get_client)
+            if key is None:
+                logger.debug("... No key found for key id %s", key_id)
+                return None
+
+            try:
+                claims = jwt.decode(
+                    token,
+                    key.key,
+                    algorithms=algorithms,
+                    issuer=issuer,
+                    audience=audience,
+                    leeway=leeway,
+                    options={"verify_aud": audience is not None},
+                )
+            except jwt.InvalidTokenError as e:
+                logger.debug("... Invalid token: %s", e)
+                return None
+
+            cache.set(token, claims)
+            return dict(claims)
+
+        return decode
+
+
 SECURITY_HANDLERS = {
     # Swagger 2: `type: basic`
     # OpenAPI 3: `type: http` and `scheme: basic`
@@ -455,10 +1191,60 @@ class SecurityHandlerFactory:
     def __init__(
         self,
         security_handlers: t.Optional[dict] = None,
+        *,
+        http_client: t.Optional[SharedHTTPClient] = None,
+        thread_pool: t.Optional[ThreadPool] = None,
+        concurrent: bool = False,
+        hooks: t.Optional[t.Sequence[SecurityHook]] = None,
+        caches: t.Optional[t.Dict[t.Hashable, t.Any]] = None,
     ) -> None:
+        """
+        :param security_handlers: Security handlers to use, by security scheme type.
+        :param http_client: HTTP client to share between the security handlers.
+        :param thread_pool: Thread pool to run synchronous security functions in.
+        :param concurrent: Whether to verify the security schemes of an operation concurrently,
+            instead of one after the other. See :meth:`verify_security`.
+        :param hooks: Callables to report the verification of each security scheme to, as a
+            :class:`SecurityEvent`.
+        :param caches: Caches to share between the security handlers. See
+            :attr:`AbstractSecurityHandler.caches`.
+        """
         self.security_handlers = SECURITY_HANDLERS.copy()
         if security_handlers is not None:
             self.security_handlers.update(security_handlers)
+        self.http_client = http_client
+        self.thread_pool = thread_pool
+        self.concurrent = concurrent
+        self.hooks = list(hooks or [])
+        self.caches = {} if caches is None else caches
+
+    def _get_fn(
+        self,
+        security_handler: t.Type[AbstractSecurityHandler],
+        security_scheme: dict,
+        required_scopes: t.List[str],
+    ) -> t.Optional[t.Callable]:
+        handler = security_handler()
+        handler.caches = self.caches
+        if self.http_client is not None:
+            handler.http_client = self.http_client
+        if self.thread_pool is not None:
+            handler.thread_pool = self.thread_pool
+        handler.inline = bool(security_scheme.get("x-inlineSecurityFunc", False))
+        return handler.get_fn(security_scheme, required_scopes)
+
+    def instrument(
+        self, func: t.Callable, scheme: str, operation_id: t.Optional[str]
+    ) -> t.Callable:
+        """Report the verifications of a security scheme to the hooks, if there are any.
+
+        :param func: Function verifying the security scheme for a request.
+        :param scheme: The name of the security scheme.
+        :param operation_id: The id of the operation.
+        """
+        if not self.hooks:
+            return func
+        return instrument(func, self.hooks, scheme, operation_id)
 
     def parse_security_scheme(
         self,
@@ -473,14 +1259,14 @@ class SecurityHandlerFactory:
         security_type = security_scheme["type"]
         if security_type in ("basic", "oauth2"):
             security_handler = self.security_handlers[security_type]
-            return security_handler().get_fn(security_scheme, required_scopes)
+            return self._get_fn(security_handler, security_scheme, required_scopes)
 
         # OpenAPI 3.0.0
         elif security_type == "http":
             scheme = security_scheme["scheme"].lower()
             if scheme in self.security_handlers:
                 security_handler = self.security_handlers[scheme]
-                return security_handler().get_fn(security_scheme, required_scopes)
+                return self._get_fn(security_handler, security_scheme, required_scopes)
             else:
                 logger.warning("... Unsupported http authorization scheme %s", scheme)
                 return None
@@ -488,15 +1274,17 @@ class SecurityHandlerFactory:
         elif security_type == "apiKey":
             scheme = security_scheme.get("x-authentication-scheme", "").lower()
             if scheme == "bearer":
-                return BearerSecurityHandler().get_fn(security_scheme, required_scopes)
+                return self._get_fn(
+                    BearerSecurityHandler, security_scheme, required_scopes
+                )
             else:
                 security_handler = self.security_handlers["apiKey"]
-                return security_handler().get_fn(security_scheme, required_scopes)
+                return self._get_fn(security_handler, security_scheme, required_scopes)
 
         elif security_type == "openIdConnect":
             if security_type in self.security_handlers:
                 security_handler = self.security_handlers[security_type]
-                return security_handler().get_fn(security_scheme, required_scopes)
+                return self._get_fn(security_handler, security_scheme, required_scopes)
             logger.warning("... No default implementation for openIdConnect")
             return None
 
@@ -506,12 +1294,12 @@ class SecurityHandlerFactory:
             and (scheme := security_scheme["scheme"].lower()) in self.security_handlers
         ):
             security_handler = self.security_handlers[scheme]
-            return security_handler().get_fn(security_scheme, required_scopes)
+            return self._get_fn(security_handler, security_scheme, required_scopes)
 
         # Custom security type handler
         elif security_type in self.security_handlers:
             security_handler = self.security_handlers[security_type]
-            return security_handler().get_fn(security_scheme, required_scopes)
+            return self._get_fn(security_handler, security_scheme, required_scopes)
 
         else:
             logger.warning(
@@ -559,9 +1347,30 @@ class SecurityHandlerFactory:
         :rtype: types.FunctionType
         """
 
+        schemes = tuple(schemes.items())
+
+        if self.concurrent:
+
+            async def concurrent_wrapper(request):
+                results = await asyncio.gather(
+                    *(_resolve(func, request) for _, func in schemes),
+                    return_exceptions=True,
+                )
+                # Evaluate the results in order, as if the schemes were verified one by one
+                token_info = {}
+                for (scheme_name, _), result in zip(schemes, results):
+                    if isinstance(result, BaseException):
+                        raise result
+                    if result is NO_VALUE:
+                        return NO_VALUE
+                    token_info[scheme_name] = result
+                return token_info
+
+            return concurrent_wrapper
+
         async def wrapper(request):
             token_info = {}
-            for scheme_name, func in schemes.items():
+            for scheme_name, func in schemes:
                 result = func(request)
                 while asyncio.iscoroutine(result):
                     result = await result
@@ -574,7 +1383,37 @@ class SecurityHandlerFactory:
         return wrapper
 
     @classmethod
-    def verify_security(cls, auth_funcs):
+    def verify_security(cls, auth_funcs, *, concurrent: bool = False):
+        """
+        Return a function verifying the security of a request, which passes if any of the
+        alternative security requirements is met.
+
+        :param auth_funcs: The functions verifying each security requirement.
+        :param concurrent: Whether to verify the requirements concurrently. The first one to pass
+            is used and the others are cancelled, instead of verifying them one by one until one
+            passes. If none pass, the same error is raised in both cases.
+        """
+        auth_funcs = tuple(auth_funcs)
+
+        if concurrent and len(auth_funcs) > 1:
+            return cls._verify_security_concurrently(auth_funcs)
+
+        if len(auth_funcs) == 1:
+            # Most operations have a single security requirement, which doesn't need to collect
+            # the errors of the alternatives
+            (func,) = auth_funcs
+
+            async def verify_fn(request):
+                token_info = func(request)
+                while asyncio.iscoroutine(token_info):
+                    token_info = await token_info
+                if token_info is NO_VALUE:
+                    logger.info("... No auth provided. Aborting with 401.")
+                    raise OAuthProblem(detail="No authorization token provided")
+                cls._set_security_context(request, token_info)
+
+            return verify_fn
+
         async def verify_fn(request):
             token_info = NO_VALUE
             errors = []
@@ -595,16 +1434,87 @@ class SecurityHandlerFactory:
                     logger.info("... No auth provided. Aborting with 401.")
                     raise OAuthProblem(detail="No authorization token provided")
 
-            request.context.update(
-                {
-                    # Fallback to 'uid' for backward compatibility
-                    "user": token_info.get("sub", token_info.get("uid")),
-                    "token_info": token_info,
-                }
-            )
+            cls._set_security_context(request, token_info)
 
         return verify_fn
 
+    @classmethod
+    def _verify_security_concurrently(cls, auth_funcs: t.Tuple[t.Callable, ...]):
+        async def verify_fn(request):
+            token_info = NO_VALUE
+            errors: t.List[t.Tuple[int, Exception]] = []
+            pending: t.List[t.Tuple[int, t.Coroutine]] = []
+            for index, func in enumerate(auth_funcs):
+                try:
+                    result = func(request)
+                except Exception as err:
+                    errors.append((index, err))
+                    continue
+                if asyncio.iscoroutine(result):
+                    pending.append((index, result))
+                elif result is not NO_VALUE:
+                    token_info = result
+                    break
+
+            if token_info is NO_VALUE:
+                token_info = await cls._first_token_info(pending, errors)
+            else:
+                for _, coroutine in pending:
+                    coroutine.close()
+
+            if token_info is NO_VALUE:
+                if errors:
+                    # Raise the same error as when verifying the requirements one by one
+                    cls._raise_most_specific([err for _, err in sorted(errors)])
+                logger.info("... No auth provided. Aborting with 401.")
+                raise OAuthProblem(detail="No authorization token provided")
+
+            cls._set_security_context(request, token_info)
+
+        return verify_fn
+
+    @staticmethod
+    async def _first_token_info(
+        pending: t.List[t.Tuple[int, t.Coroutine]],
+        errors: t.List[t.Tuple[int, Exception]],
+    ) -> t.Any:
+        """Run the pending verifications concurrently, and return the first token info, or
+        NO_VALUE if none pass. The errors of failed verifications are added to `errors`."""
+        tasks = {
+            asyncio.ensure_future(_resolve_coroutine(coroutine)): index
+            for index, coroutine in pending
+        }
+        try:
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=tasks.__getitem__):
+                    index = tasks.pop(task)
+                    try:
+                        result = task.result()
+                    except Exception as err:
+                        errors.append((index, err))
+                        continue
+                    if result is not NO_VALUE:
+                        return result
+            return NO_VALUE
+        finally:
+            for task in tasks:
+                task.cancel()
+                # Retrieve the exception of tasks which finish before they are cancelled
+                task.add_done_callback(
+                    lambda task: task.cancelled() or task.exception()
+                )
+
+    @staticmethod
+    def _set_security_context(request, token_info) -> None:
+        request.context.update(
+            {
+                # Fallback to 'uid' for backward compatibility
+                "user": token_info.get("sub", token_info.get("uid")),
+                "token_info": token_info,
+            }
+        )
+
     @staticmethod
     def _raise_most_specific(exceptions: t.List[Exception]) -> None:
         """Raises the most specific error from a list of exceptions by status code.
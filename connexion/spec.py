@@ -4,25 +4,42 @@ This module defines Python interfaces for OpenAPI specifications.
 
 import abc
 import copy
+import hashlib
 import json
+import logging
 import os
 import pathlib
+import pickle
 import pkgutil
+import re
+import sys
+import tempfile
 import typing as t
 from collections.abc import Mapping
-from urllib.parse import urlsplit
+from urllib.parse import urldefrag, urljoin, urlsplit
 
-import jinja2
 import jsonschema
-import yaml
 from jsonschema import Draft4Validator
 from jsonschema.validators import extend as extend_validator
 
+from . import profiling
 from .exceptions import InvalidSpecification
-from .json_schema import NullableTypeValidator, URLHandler, resolve_refs
+from .http_facts import METHODS
+from .json_schema import (
+    FileHandler,
+    NullableTypeValidator,
+    URLHandler,
+    create_ref_resolver,
+    handlers,
+    load_document,
+    resolve_pointer,
+    resolve_refs,
+)
 from .operations import AbstractOperation, OpenAPIOperation, Swagger2Operation
 from .utils import deep_get
 
+logger = logging.getLogger(__name__)
+
 validate_properties = Draft4Validator.VALIDATORS["properties"]
 
 
@@ -64,6 +81,9 @@ NO_SPEC_VERSION_ERR_MSG = """Unable to get the spec version.
 You are missing either '"swagger": "2.0"' or '"openapi": "3.0.0"'
 from the top level of your spec."""
 
+# Start of a Jinja2 expression, statement or comment
+_JINJA_MARKERS = re.compile(rb"{[{%#]")
+
 
 def canonical_base_path(base_path):
     """
@@ -79,8 +99,24 @@ class Specification(Mapping):
     def __init__(self, raw_spec, *, base_uri=""):
         self._raw_spec = copy.deepcopy(raw_spec)
         self._set_defaults(raw_spec)
-        self._validate_spec(raw_spec)
-        self._spec = resolve_refs(raw_spec, base_uri=base_uri)
+        with profiling.phase("validate"):
+            self._validate_spec(raw_spec)
+        with profiling.phase("resolve_refs"):
+            self._spec = resolve_refs(raw_spec, base_uri=base_uri)
+        self._base_uri = base_uri
+        # Resolver for references in the schemas of this specification, shared by its
+        # operations and their validators
+        self.ref_resolver = create_ref_resolver(self._spec, base_uri=base_uri)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # The resolver is not picklable, it is rebuilt instead
+        del state["ref_resolver"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.ref_resolver = create_ref_resolver(self._spec, base_uri=self._base_uri)
 
     @classmethod
     @abc.abstractmethod
@@ -132,29 +168,51 @@ class Specification(Mapping):
     @staticmethod
     def _load_spec_from_file(arguments, specification):
         """
-        Loads a YAML specification file, optionally rendering it with Jinja2.
+        Loads a json or YAML specification file, optionally rendering it with Jinja2. Rendering is
+        skipped if no arguments are passed and the file doesn't contain any Jinja2 markers.
 
         :param arguments: passed to Jinja2 renderer
         :param specification: path to specification
         """
-        arguments = arguments or {}
-
         with specification.open(mode="rb") as openapi_yaml:
             contents = openapi_yaml.read()
+
+        if arguments or _JINJA_MARKERS.search(contents):
+            import jinja2
+
             try:
                 openapi_template = contents.decode()
             except UnicodeDecodeError:
                 openapi_template = contents.decode("utf-8", "replace")
 
-            openapi_string = jinja2.Template(openapi_template).render(**arguments)
-            return yaml.safe_load(openapi_string)
+            with profiling.phase("render"):
+                contents = jinja2.Template(openapi_template).render(**(arguments or {}))
+
+        with profiling.phase("parse"):
+            return load_document(contents)
 
     @classmethod
-    def from_file(cls, spec, *, arguments=None, base_uri=""):
+    def from_file(cls, spec, *, arguments=None, base_uri="", cache_dir=None):
         """
         Takes in a path to a YAML file, and returns a Specification
+
+        :param cache_dir: Optional directory of a :class:`SpecificationCache`. If provided, the
+            loaded specification is served from and stored in this cache.
         """
         specification_path = pathlib.Path(spec)
+        if cache_dir is not None:
+            cache = SpecificationCache(cache_dir)
+            key = cache.key(specification_path, arguments=arguments, base_uri=base_uri)
+            with profiling.phase("cache_get"):
+                specification = cache.get(key)
+            if specification is None:
+                specification = cls.from_file(
+                    specification_path, arguments=arguments, base_uri=base_uri
+                )
+                with profiling.phase("cache_set"):
+                    cache.set(key, specification, base_uri=base_uri)
+            return specification
+
         spec = cls._load_spec_from_file(arguments, specification_path)
         return cls.from_dict(spec, base_uri=base_uri)
 
@@ -204,20 +262,46 @@ class Specification(Mapping):
         return OpenAPISpecification(spec, base_uri=base_uri)
 
     def clone(self):
-        return type(self)(copy.deepcopy(self._spec))
+        """Return a copy of this specification without validating or resolving it again.
+
+        The copy shares its nested structures with this specification. Only the top level is
+        copied, so top level keys (eg. the base path) can be overwritten on the copy without
+        affecting this specification.
+        """
+        new_spec = self.__class__.__new__(self.__class__)
+        new_spec.__dict__.update(self.__dict__)
+        new_spec._raw_spec = copy.copy(self._raw_spec)
+        new_spec._spec = copy.copy(self._spec)
+        return new_spec
 
     @classmethod
-    def load(cls, spec, *, arguments=None):
+    def load(cls, spec, *, arguments=None, cache_dir=None):
         if isinstance(spec, str) and (
             spec.startswith("http://") or spec.startswith("https://")
         ):
             return cls.from_url(spec)
         if not isinstance(spec, dict):
             base_uri = f"{pathlib.Path(spec).parent}{os.sep}"
-            return cls.from_file(spec, arguments=arguments, base_uri=base_uri)
+            return cls.from_file(
+                spec, arguments=arguments, base_uri=base_uri, cache_dir=cache_dir
+            )
         return cls.from_dict(spec)
 
+    def operation_fingerprints(self) -> t.Dict[t.Tuple[str, str], str]:
+        """
+        Fingerprints of the operations in this specification, by path and method. A fingerprint
+        covers the definition of the operation, the definitions it references and the
+        specification wide settings that apply to it. Operations with the same fingerprint in two
+        versions of a specification are defined the same.
+        """
+        return _FingerprintBuilder(self).build()
+
+    def referenced_files(self) -> t.Set[str]:
+        """The paths of all local files referenced by this specification, recursively."""
+        return SpecificationCache._referenced_files(self._raw_spec, self._base_uri)
+
     def with_base_path(self, base_path):
+        """Return a view of this specification with the provided base path. See :meth:`clone`."""
         new_spec = self.clone()
         new_spec.base_path = base_path
         return new_spec
@@ -329,3 +413,224 @@ class OpenAPISpecification(Specification):
         user_servers = [{"url": base_path}]
         self._raw_spec["servers"] = user_servers
         self._spec["servers"] = user_servers
+
+
+class _FingerprintBuilder:
+    """Builds the fingerprints of the operations of a specification from its raw form, following
+    its references."""
+
+    # Top level keys which don't affect the operations, or which are only included for the
+    # operations which reference them
+    _ignored_keys = {
+        "paths",
+        "info",
+        "tags",
+        "externalDocs",
+        "components",
+        "definitions",
+        "parameters",
+        "responses",
+    }
+
+    def __init__(self, specification: Specification) -> None:
+        self.raw = specification.raw
+        self.paths = specification.get("paths", {})
+        self.base_uri = specification._base_uri
+        self._documents: t.Dict[str, t.Any] = {}
+        # Digest and references of referenced fragments, by absolute uri
+        self._fragments: t.Dict[str, t.Tuple[str, t.List[str]]] = {}
+
+    def build(self) -> t.Dict[t.Tuple[str, str], str]:
+        shared = {k: v for k, v in self.raw.items() if k not in self._ignored_keys}
+        # Security schemes are referenced by name instead of by reference
+        shared["securitySchemes"] = self.raw.get("components", {}).get(
+            "securitySchemes"
+        )
+
+        # Tag objects carry extensions which apply to their operations, eg. x-maxThreads
+        tags = {
+            tag.get("name"): tag
+            for tag in self.raw.get("tags", [])
+            if isinstance(tag, Mapping)
+        }
+
+        fingerprints = {}
+        for path, path_item in self.raw.get("paths", {}).items():
+            # Take the methods from the resolved path item, which can be a reference
+            for method, operation in self.paths.get(path, {}).items():
+                if method not in METHODS:
+                    continue
+                definition = {
+                    "shared": shared,
+                    "path_item": {
+                        k: v for k, v in path_item.items() if k not in METHODS
+                    },
+                    "method": method,
+                    "operation": path_item.get(method),
+                    "tags": [tags.get(tag) for tag in operation.get("tags", [])],
+                }
+                fingerprints[(path, method)] = self._fingerprint(definition)
+        return fingerprints
+
+    def _fingerprint(self, definition: t.Any) -> str:
+        digest = hashlib.sha256(self._dumps(definition).encode())
+
+        # Add the digests of all referenced fragments, transitively
+        seen: t.Set[str] = set()
+        stack = [urljoin(self.base_uri, ref) for ref in self._refs(definition)]
+        while stack:
+            uri = stack.pop()
+            if uri in seen:
+                continue
+            seen.add(uri)
+            _, refs = self._fragment(uri)
+            stack.extend(refs)
+        for uri in sorted(seen):
+            digest.update(f"{uri}:{self._fragments[uri][0]}".encode())
+
+        return digest.hexdigest()
+
+    def _fragment(self, uri: str) -> t.Tuple[str, t.List[str]]:
+        """The digest of the referenced fragment and the absolute uris it references."""
+        if uri not in self._fragments:
+            url, pointer = urldefrag(uri)
+            try:
+                node = resolve_pointer(self._document(url), pointer)
+            except Exception:
+                # Unresolvable references are reported when the specification is loaded
+                node = None
+            refs = [urljoin(url or self.base_uri, ref) for ref in self._refs(node)]
+            digest = hashlib.sha256(self._dumps(node).encode()).hexdigest()
+            self._fragments[uri] = (digest, refs)
+        return self._fragments[uri]
+
+    def _document(self, url: str) -> t.Any:
+        if url in ("", self.base_uri):
+            return self.raw
+        if url not in self._documents:
+            handler = handlers.get(urlsplit(url).scheme, handlers[""])
+            self._documents[url] = handler(url)
+        return self._documents[url]
+
+    @staticmethod
+    def _refs(node: t.Any) -> t.List[str]:
+        refs = []
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Mapping):
+                ref = node.get("$ref")
+                if isinstance(ref, str):
+                    refs.append(ref)
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+        return refs
+
+    @staticmethod
+    def _dumps(node: t.Any) -> str:
+        return json.dumps(node, sort_keys=True, default=str)
+
+
+class SpecificationCache:
+    """On-disk cache of loaded specifications.
+
+    Loading a specification file renders it with Jinja2, parses it, validates it against the
+    OpenAPI schema and resolves its references. The cache stores the result in a pickled form, so
+    later processes can skip all of that work. Entries are keyed by a hash of the specification
+    file, the Jinja2 arguments and the base uri, and are invalidated when any local file
+    referenced by the specification changes. Remote references are not tracked.
+
+    .. note: Cache entries are unpickled, so the cache directory should only be writable by
+        trusted users.
+    """
+
+    version = 3
+    """Version of the cache format, included in every key."""
+
+    def __init__(self, cache_dir: t.Union[pathlib.Path, str]) -> None:
+        self.cache_dir = pathlib.Path(cache_dir)
+
+    def key(
+        self,
+        specification_path: pathlib.Path,
+        *,
+        arguments: t.Optional[dict] = None,
+        base_uri: str = "",
+    ) -> str:
+        """Compute the cache key for a specification file."""
+        digest = hashlib.sha256()
+        digest.update(f"{self.version}:{sys.version_info[:2]}:{base_uri}".encode())
+        digest.update(
+            json.dumps(arguments or {}, sort_keys=True, default=repr).encode()
+        )
+        digest.update(specification_path.read_bytes())
+        return digest.hexdigest()
+
+    def _path(self, key: str) -> pathlib.Path:
+        return self.cache_dir / f"{key}.pickle"
+
+    def get(self, key: str) -> t.Optional["Specification"]:
+        """Return the cached specification for the key, or None if it is missing or stale."""
+        try:
+            entry = pickle.loads(self._path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("Ignoring unreadable specification cache entry %s: %s", key, e)
+            return None
+
+        for path, digest in entry["dependencies"].items():
+            if self._digest(path) != digest:
+                logger.debug("Specification cache entry %s is stale", key)
+                return None
+
+        return entry["specification"]
+
+    def set(self, key: str, specification: "Specification", *, base_uri="") -> None:
+        """Store a specification in the cache, together with the digests of the local files it
+        references."""
+        dependencies = {
+            path: self._digest(path)
+            for path in self._referenced_files(specification.raw, base_uri)
+        }
+        entry = {"dependencies": dependencies, "specification": specification}
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first, so concurrent processes never read partial entries
+        with tempfile.NamedTemporaryFile(dir=self.cache_dir, delete=False) as f:
+            pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(f.name, self._path(key))
+
+    @staticmethod
+    def _digest(path: str) -> t.Optional[str]:
+        try:
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
+
+    @classmethod
+    def _referenced_files(
+        cls, document: t.Any, base_uri: str, seen: t.Optional[t.Set[str]] = None
+    ) -> t.Set[str]:
+        """Collect the paths of all local files referenced by the document, recursively."""
+        seen = set() if seen is None else seen
+
+        stack = [document]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, Mapping):
+                ref = node.get("$ref")
+                if isinstance(ref, str):
+                    uri, _ = urldefrag(urljoin(base_uri, ref))
+                    if uri and uri != base_uri and urlsplit(uri).scheme in ("", "file"):
+                        path = FileHandler._uri_to_path(uri)
+                        if path not in seen:
+                            seen.add(path)
+                            cls._referenced_files(FileHandler()(uri), uri, seen)
+                stack.extend(node.values())
+            elif isinstance(node, list):
+                stack.extend(node)
+
+        return seen
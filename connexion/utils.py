@@ -6,16 +6,21 @@ import asyncio
 import functools
 import importlib
 import inspect
+import logging
 import os
 import pkgutil
 import sys
+import time
 import typing as t
 
+import anyio.to_thread
 import yaml
 from starlette.routing import compile_path
 
 from connexion.exceptions import TypeValidationError
 
+logger = logging.getLogger(__name__)
+
 if t.TYPE_CHECKING:
     from connexion.middleware.main import API
 
@@ -544,3 +549,69 @@ def build_example_from_schema(schema):
 
     faker = JSF(schema)
     return faker.generate()
+
+
+ThreadPoolWaitHook = t.Callable[[str, float], None]
+"""Callable which is called with the name of a thread pool and the time in seconds a function
+waited for a thread."""
+
+
+class ThreadPool:
+    """
+    Runs synchronous functions in worker threads, so they don't block the event loop. The number
+    of functions running at once is limited to `max_threads`, or shared with the default thread
+    limit of anyio if it is not provided.
+    """
+
+    def __init__(
+        self,
+        max_threads: t.Optional[int] = None,
+        *,
+        name: str = "default",
+        wait_hooks: t.Sequence[ThreadPoolWaitHook] = (),
+    ) -> None:
+        """
+        :param max_threads: Maximum number of functions to run at once.
+        :param name: Name of the pool, which is passed to the wait hooks.
+        :param wait_hooks: Callables which are called with the name of the pool and the time a
+            function waited for a thread, after it ran.
+        """
+        self.max_threads = max_threads
+        self.name = name
+        self.wait_hooks = list(wait_hooks)
+        self._limiter: t.Optional[anyio.CapacityLimiter] = None
+
+    @property
+    def limiter(self) -> t.Optional[anyio.CapacityLimiter]:
+        # Created lazily, since it needs to be created within the event loop
+        if self._limiter is None and self.max_threads is not None:
+            self._limiter = anyio.CapacityLimiter(self.max_threads)
+        return self._limiter
+
+    async def run(self, func: t.Callable, *args, **kwargs) -> t.Any:
+        """Run a function in a worker thread and return its result."""
+        if not self.wait_hooks:
+            return await anyio.to_thread.run_sync(
+                functools.partial(func, *args, **kwargs), limiter=self.limiter
+            )
+
+        submitted = time.perf_counter()
+        started = None
+
+        def run_func():
+            nonlocal started
+            started = time.perf_counter()
+            return func(*args, **kwargs)
+
+        try:
+            return await anyio.to_thread.run_sync(run_func, limiter=self.limiter)
+        finally:
+            if started is not None:
+                self._report_wait(started - submitted)
+
+    def _report_wait(self, wait: float) -> None:
+        for hook in self.wait_hooks:
+            try:
+                hook(self.name, wait)
+            except Exception:
+                logger.exception("Thread pool wait hook %r failed", hook)
@@ -10,6 +10,7 @@ from starlette.datastructures import Headers, MutableHeaders
 from starlette.types import Receive, Scope, Send
 
 from connexion.exceptions import BadRequestProblem
+from connexion.json_schema import RefResolver
 
 
 class AbstractRequestBodyValidator:
@@ -36,6 +37,7 @@ class AbstractRequestBodyValidator:
         nullable: bool = False,
         encoding: str,
         strict_validation: bool,
+        ref_resolver: t.Optional[RefResolver] = None,
         **kwargs,
     ):
         """
@@ -45,12 +47,15 @@ class AbstractRequestBodyValidator:
         :param encoding: Encoding of body (passed via Content-Type header)
         :param kwargs: Additional arguments for subclasses
         :param strict_validation: Whether to allow parameters not defined in the spec
+        :param ref_resolver: Resolver for references in the schema, shared by the operations of
+            a specification
         """
         self._schema = schema
         self._nullable = nullable
         self._required = required
         self._encoding = encoding
         self._strict_validation = strict_validation
+        self._ref_resolver = ref_resolver
 
     async def _parse(
         self, stream: t.AsyncGenerator[bytes, None], scope: Scope
@@ -114,13 +119,21 @@ class AbstractRequestBodyValidator:
         return receive_
 
     async def wrap_receive(
-        self, receive: Receive, *, scope: Scope
+        self, receive: Receive, *, scope: Scope, encoding: t.Optional[str] = None
     ) -> t.Tuple[Receive, Scope]:
         """
         Wrap the provided `receive` channel with request body validation.
 
         This method updates the provided `scope` in place with the right `Content-Length` header.
+
+        :param encoding: Encoding of the body of this request, if it differs from the encoding
+            of the validator. A validator is shared between requests, so it is applied to a copy.
         """
+        if encoding is not None and encoding != self._encoding:
+            validator = copy.copy(self)
+            validator._encoding = encoding
+            return await validator.wrap_receive(receive, scope=scope)
+
         # Handle missing bodies
         headers = Headers(scope=scope)
         if not int(headers.get("content-length", 0)):
@@ -167,16 +180,18 @@ class AbstractResponseBodyValidator:
 
     def __init__(
         self,
-        scope: Scope,
+        scope: t.Optional[Scope],
         *,
         schema: dict,
         nullable: bool = False,
         encoding: str,
+        ref_resolver: t.Optional[RefResolver] = None,
     ) -> None:
         self._scope = scope
         self._schema = schema
         self._nullable = nullable
         self._encoding = encoding
+        self._ref_resolver = ref_resolver
 
     def _parse(self, stream: t.Generator[bytes, None, None]) -> t.Any:
         """Parse the incoming stream."""
@@ -188,8 +203,27 @@ class AbstractResponseBodyValidator:
         :raises: :class:`connexion.exceptions.NonConformingResponse`
         """
 
-    def wrap_send(self, send: Send) -> Send:
-        """Wrap the provided send channel with response body validation"""
+    def wrap_send(
+        self,
+        send: Send,
+        *,
+        scope: t.Optional[Scope] = None,
+        encoding: t.Optional[str] = None,
+    ) -> Send:
+        """Wrap the provided send channel with response body validation
+
+        :param scope: Scope of this request. A validator is shared between requests, so it is
+            applied to a copy.
+        :param encoding: Encoding of the body of this response, if it differs from the encoding
+            of the validator.
+        """
+        if scope is not None or (encoding is not None and encoding != self._encoding):
+            validator = copy.copy(self)
+            if scope is not None:
+                validator._scope = scope
+            if encoding is not None:
+                validator._encoding = encoding
+            return validator.wrap_send(send)
 
         messages = []
 
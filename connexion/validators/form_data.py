@@ -1,3 +1,4 @@
+import functools
 import logging
 import typing as t
 
@@ -7,7 +8,11 @@ from starlette.formparsers import FormParser, MultiPartParser
 from starlette.types import Scope
 
 from connexion.exceptions import BadRequestProblem, ExtraParameterProblem
-from connexion.json_schema import Draft4RequestValidator, format_error_with_path
+from connexion.json_schema import (
+    Draft4RequestValidator,
+    RefResolver,
+    format_error_with_path,
+)
 from connexion.uri_parsing import AbstractURIParser
 from connexion.validators import AbstractRequestBodyValidator
 
@@ -26,6 +31,7 @@ class FormDataValidator(AbstractRequestBodyValidator):
         encoding: str,
         strict_validation: bool,
         uri_parser: t.Optional[AbstractURIParser] = None,
+        ref_resolver: t.Optional[RefResolver] = None,
     ) -> None:
         super().__init__(
             schema=schema,
@@ -33,13 +39,16 @@ class FormDataValidator(AbstractRequestBodyValidator):
             nullable=nullable,
             encoding=encoding,
             strict_validation=strict_validation,
+            ref_resolver=ref_resolver,
         )
         self._uri_parser = uri_parser
 
-    @property
+    @functools.cached_property
     def _validator(self):
         return Draft4RequestValidator(
-            self._schema, format_checker=Draft4Validator.FORMAT_CHECKER
+            self._schema,
+            format_checker=Draft4Validator.FORMAT_CHECKER,
+            resolver=self._ref_resolver,
         )
 
     @property
@@ -1,3 +1,4 @@
+import functools
 import json
 import logging
 import typing as t
@@ -10,6 +11,7 @@ from connexion.exceptions import BadRequestProblem, NonConformingResponseBody
 from connexion.json_schema import (
     Draft4RequestValidator,
     Draft4ResponseValidator,
+    RefResolver,
     format_error_with_path,
 )
 from connexion.validators import (
@@ -31,6 +33,7 @@ class JSONRequestBodyValidator(AbstractRequestBodyValidator):
         nullable=False,
         encoding: str,
         strict_validation: bool,
+        ref_resolver: t.Optional[RefResolver] = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -39,12 +42,15 @@ class JSONRequestBodyValidator(AbstractRequestBodyValidator):
             nullable=nullable,
             encoding=encoding,
             strict_validation=strict_validation,
+            ref_resolver=ref_resolver,
         )
 
-    @property
+    @functools.cached_property
     def _validator(self):
         return Draft4RequestValidator(
-            self._schema, format_checker=Draft4Validator.FORMAT_CHECKER
+            self._schema,
+            format_checker=Draft4Validator.FORMAT_CHECKER,
+            resolver=self._ref_resolver,
         )
 
     async def _parse(
@@ -83,11 +89,13 @@ class DefaultsJSONRequestBodyValidator(JSONRequestBodyValidator):
     MUTABLE_VALIDATION = True
     """This validator might mutate to the body."""
 
-    @property
+    @functools.cached_property
     def _validator(self):
         validator_cls = self.extend_with_set_default(Draft4RequestValidator)
         return validator_cls(
-            self._schema, format_checker=Draft4Validator.FORMAT_CHECKER
+            self._schema,
+            format_checker=Draft4Validator.FORMAT_CHECKER,
+            resolver=self._ref_resolver,
         )
 
     # via https://python-jsonschema.readthedocs.io/
@@ -110,10 +118,12 @@ class DefaultsJSONRequestBodyValidator(JSONRequestBodyValidator):
 class JSONResponseBodyValidator(AbstractResponseBodyValidator):
     """Response body validator for json content types."""
 
-    @property
+    @functools.cached_property
     def validator(self) -> Draft4Validator:
         return Draft4ResponseValidator(
-            self._schema, format_checker=Draft4Validator.FORMAT_CHECKER
+            self._schema,
+            format_checker=Draft4Validator.FORMAT_CHECKER,
+            resolver=self._ref_resolver,
         )
 
     def _parse(self, stream: t.Generator[bytes, None, None]) -> t.Any:
@@ -1,16 +1,24 @@
 import json
+import time
 from unittest import mock
 
 import jinja2
 import pytest
 import yaml
-from connexion import App
-from connexion.exceptions import InvalidSpecification
+from connexion import App, AsyncApp
+from connexion.exceptions import InvalidSpecification, ReloadError
 from connexion.http_facts import METHODS
 from connexion.json_schema import ExtendedSafeLoader
 from connexion.lifecycle import ConnexionRequest, ConnexionResponse
 from connexion.middleware.abstract import AbstractRoutingAPI
-from connexion.options import SwaggerUIOptions
+from connexion.middleware.request_validation import RequestValidationMiddleware
+from connexion.middleware.response_validation import ResponseValidationMiddleware
+from connexion.middleware.routing import RoutingMiddleware
+from connexion.middleware.swagger_ui import SwaggerUIMiddleware
+from connexion.options import SwaggerUIOptions, ThreadPoolOptions
+from connexion.resolver import LazyResolver
+from connexion.spec import Specification
+from connexion.utils import get_function_from_name
 
 from conftest import TEST_FOLDER, build_app_from_fixture
 
@@ -252,6 +260,285 @@ def test_resolve_classmethod(simple_app):
     assert resp.text == '"DummyClass"\n'
 
 
+def test_lazy_resolver(simple_api_spec_dir, app_class, spec):
+    function_resolver = mock.MagicMock(wraps=get_function_from_name)
+    app = app_class(__name__, specification_dir=simple_api_spec_dir)
+    app.add_api(spec, resolver=LazyResolver(function_resolver))
+    app_client = app.test_client()
+    function_resolver.assert_not_called()
+
+    for _ in range(2):
+        get_bye = app_client.get("/v1.0/bye/jsantos")
+        assert get_bye.status_code == 200
+        assert get_bye.text == "Goodbye jsantos"
+    function_resolver.assert_called_once_with("fakeapi.hello.get_bye")
+
+
+def test_handlers_decorated_once(simple_api_spec_dir, app_class, spec, monkeypatch):
+    app = app_class(__name__, specification_dir=simple_api_spec_dir)
+    app.add_api(spec)
+    app_client = app.test_client()
+    # The middleware stack, and so the operations, are built on the first request
+    assert app_client.get("/v1.0/bye/jsantos").status_code == 200
+
+    inspect_arguments = mock.MagicMock()
+    monkeypatch.setattr(
+        "connexion.decorators.parameter.inspect_function_arguments", inspect_arguments
+    )
+    for _ in range(2):
+        get_bye = app_client.get("/v1.0/bye/jsantos")
+        assert get_bye.status_code == 200
+        assert get_bye.text == "Goodbye jsantos"
+    inspect_arguments.assert_not_called()
+
+
+def test_warm_up(simple_api_spec_dir, app_class, spec, monkeypatch):
+    freeze = mock.MagicMock()
+    monkeypatch.setattr("connexion.middleware.main.gc.freeze", freeze)
+    function_resolver = mock.MagicMock(wraps=get_function_from_name)
+    app = app_class(__name__, specification_dir=simple_api_spec_dir)
+    app.add_api(spec, resolver=LazyResolver(function_resolver))
+
+    app.warm_up()
+
+    freeze.assert_called_once_with()
+    function_resolver.assert_any_call("fakeapi.hello.get_bye")
+    call_count = function_resolver.call_count
+
+    app_client = app.test_client()
+    get_bye = app_client.get("/v1.0/bye/jsantos")
+    assert get_bye.status_code == 200
+    assert get_bye.text == "Goodbye jsantos"
+    assert function_resolver.call_count == call_count
+
+    (swagger_ui_middleware,) = [
+        middleware
+        for middleware in app.middleware.middleware_stack
+        if isinstance(middleware, SwaggerUIMiddleware)
+    ]
+    (swagger_ui_api,) = swagger_ui_middleware.apis
+    warmed_documents = dict(swagger_ui_api._documents)
+    assert set(warmed_documents) == {("json", "/v1.0"), ("yaml", "/v1.0")}
+
+    spec_json = app_client.get(f"/v1.0/{spec.replace('yaml', 'json')}")
+    assert spec_json.status_code == 200
+    assert spec_json.json()["paths"]
+    spec_yaml = app_client.get(f"/v1.0/{spec}")
+    assert spec_yaml.status_code == 200
+    # The requests are served from the documents rendered by warm_up
+    assert swagger_ui_api._documents == warmed_documents
+    assert spec_json.content == warmed_documents["json", "/v1.0"]
+
+
+def test_warm_up_recursive_schema(app_class, spec):
+    app = build_app_from_fixture(
+        "different_schemas", app_class=app_class, spec_file=spec
+    )
+
+    app.warm_up(freeze=False)
+
+    spec_json = app.test_client().get(f"/v1.0/{spec.replace('yaml', 'json')}")
+    assert spec_json.status_code == 200
+
+
+def test_warm_up_validators(app_class, spec):
+    app = build_app_from_fixture(
+        "different_schemas",
+        app_class=app_class,
+        spec_file=spec,
+        validate_responses=True,
+    )
+    app.warm_up(freeze=False)
+
+    def get_operation(middleware_cls):
+        (middleware,) = [
+            middleware
+            for middleware in app.middleware.middleware_stack
+            if isinstance(middleware, middleware_cls)
+        ]
+        (api,) = middleware.apis["/v1.0"]
+        return api.operations["fakeapi.hello.schema_recursive"]
+
+    request_operation = get_operation(RequestValidationMiddleware)
+    response_operation = get_operation(ResponseValidationMiddleware)
+    # The validators and their schema validators are built by warm_up
+    body_validator = request_operation.body_validator("application/json")
+    assert "_validator" in vars(body_validator)
+    schema_validator = body_validator._validator
+    response_validator = response_operation.body_validator("200", "application/json")
+    assert "validator" in vars(response_validator)
+
+    app_client = app.test_client()
+    for _ in range(2):
+        response = app_client.post("/v1.0/test_schema_recursive", json={"children": []})
+        assert response.status_code == 200
+
+    # The same validators are used for every request
+    assert request_operation.body_validator("application/json") is body_validator
+    assert body_validator._validator is schema_validator
+    assert request_operation._body_validators == {"application/json": body_validator}
+    assert response_operation._body_validators[("200", "application/json")] is (
+        response_validator
+    )
+
+
+RELOAD_SPEC = """
+openapi: 3.0.0
+info: {title: Reload, version: v1}
+paths:
+  /bye/{name}:
+    get:
+      operationId: fakeapi.hello.get_bye
+      parameters:
+        - {name: name, in: path, required: true, schema: {type: string, maxLength: MAX}}
+      responses:
+        "200": {description: OK}
+  /list/{name}:
+    get:
+      operationId: fakeapi.hello.get_list
+      parameters:
+        - {name: name, in: path, required: true, schema: {type: string}}
+      responses:
+        "200": {description: OK}
+"""
+
+
+def test_reload(tmp_path, app_class):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "5"))
+    app = app_class(__name__, specification_dir=tmp_path, reload_interval=60)
+    app.add_api("openapi.yaml")
+    app_client = app.test_client()
+    assert app_client.get("/bye/jsantos").status_code == 400
+
+    (api,) = app.middleware.apis
+    routes = {
+        middleware: registered.routes
+        for middleware, registered in api.registrations
+        # The Swagger UI doesn't build anything per operation
+        if getattr(registered, "routes", None)
+    }
+    assert routes
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "10"))
+
+    assert app.reload() == ["openapi.yaml"]
+    assert app.reload() == []
+
+    get_bye = app_client.get("/bye/jsantos")
+    assert get_bye.status_code == 200
+    assert get_bye.json() == "Goodbye jsantos"
+    assert app_client.get("/list/jsantos").json() == ["hello", "jsantos"]
+    assert app_client.get("/openapi.json").json()["paths"]["/bye/{name}"]
+    for middleware, registered in api.registrations:
+        if middleware in routes:
+            # Only the changed operation is rebuilt
+            old_routes = routes[middleware]
+            list_route, bye_route = ("/list/{name}", "get"), ("/bye/{name}", "get")
+            assert registered.routes[list_route] is old_routes[list_route]
+            assert registered.routes[bye_route] is not old_routes[bye_route]
+
+
+def test_reload_without_interval(tmp_path, app_class):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "5"))
+    app = app_class(__name__, specification_dir=tmp_path)
+    app.add_api("openapi.yaml")
+    app_client = app.test_client()
+    assert app_client.get("/bye/jsantos").status_code == 400
+
+    # Nothing changed since the application started
+    assert app.reload() == []
+
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "10"))
+    assert app.reload() == ["openapi.yaml"]
+    assert app_client.get("/bye/jsantos").status_code == 200
+
+
+def test_reload_invalid_specification(tmp_path, app_class):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "5"))
+    app = app_class(__name__, specification_dir=tmp_path, reload_interval=60)
+    app.add_api("openapi.yaml")
+    app_client = app.test_client()
+    assert app_client.get("/bye/jsantos").status_code == 400
+
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "-1"))
+    with pytest.raises(InvalidSpecification):
+        app.reload()
+
+    # The running version is untouched
+    assert app_client.get("/bye/jsantos").status_code == 400
+    assert app_client.get("/bye/js").status_code == 200
+
+
+def test_reload_watcher(tmp_path, app_class):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "5"))
+    app = app_class(__name__, specification_dir=tmp_path, reload_interval=0.01)
+    app.add_api("openapi.yaml")
+
+    with app.test_client() as app_client:
+        assert app_client.get("/bye/jsantos").status_code == 400
+        spec_file.write_text(RELOAD_SPEC.replace("MAX", "10"))
+        for _ in range(100):
+            if app_client.get("/bye/jsantos").status_code == 200:
+                break
+            time.sleep(0.02)
+        else:
+            pytest.fail("The specification was not reloaded")
+
+
+def test_reload_watcher_waits_for_reload(tmp_path, app_class):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "5"))
+    app = app_class(__name__, specification_dir=tmp_path, reload_interval=0.01)
+    app.add_api("openapi.yaml")
+
+    with app.test_client() as app_client:
+        with app.middleware._reload_lock:
+            spec_file.write_text(RELOAD_SPEC.replace("MAX", "10"))
+            time.sleep(0.1)
+            assert app_client.get("/bye/jsantos").status_code == 400
+        for _ in range(100):
+            if app_client.get("/bye/jsantos").status_code == 200:
+                break
+            time.sleep(0.02)
+        else:
+            pytest.fail("The specification was not reloaded")
+
+
+def test_reload_base_path(tmp_path, app_class):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "5"))
+    app = app_class(__name__, specification_dir=tmp_path, reload_interval=60)
+    app.add_api("openapi.yaml")
+    app_client = app.test_client()
+    assert app_client.get("/bye/js").status_code == 200
+
+    spec_file.write_text(
+        RELOAD_SPEC.replace("MAX", "10").replace(
+            "paths:", "servers: [{url: /v2}]\npaths:"
+        )
+    )
+    with pytest.raises(ReloadError):
+        app.reload()
+
+    # The running version is untouched
+    assert app_client.get("/bye/jsantos").status_code == 400
+    assert app_client.get("/bye/js").status_code == 200
+
+
+def test_reload_api_base_path(tmp_path):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(RELOAD_SPEC.replace("MAX", "5"))
+    specification = Specification.load(spec_file)
+    middleware = RoutingMiddleware(mock.MagicMock())
+    api = middleware.add_api(specification)
+
+    with pytest.raises(ReloadError):
+        middleware.reload_api(api, specification, unchanged=set(), base_path="/v2")
+
+
 def test_default_query_param_does_not_match_defined_type(
     default_param_error_spec_dir, app_class, spec
 ):
@@ -316,3 +603,103 @@ def test_add_error_handler(app_class, simple_api_spec_dir):
     response = app_client.get("/does_not_exist")
     assert response.status_code == 404
     assert response.json()["error"] == "NotFound"
+
+
+THREAD_POOLS_SPEC = """
+openapi: 3.0.0
+info: {title: Thread pools, version: v1}
+tags:
+  - {name: lists, x-maxThreads: 2}
+paths:
+  /bye/{name}:
+    get:
+      operationId: fakeapi.hello.get_bye
+      x-maxThreads: 1
+      parameters:
+        - {name: name, in: path, required: true, schema: {type: string}}
+      responses:
+        "200": {description: OK}
+  /list/{name}:
+    get:
+      operationId: fakeapi.hello.get_list
+      tags: [lists]
+      parameters:
+        - {name: name, in: path, required: true, schema: {type: string}}
+      responses:
+        "200": {description: OK}
+  /greetings/{name}:
+    get:
+      operationId: fakeapi.hello.get_greetings
+      parameters:
+        - {name: name, in: path, required: true, schema: {type: string}}
+      responses:
+        "200": {description: OK}
+"""
+
+
+def test_thread_pools(tmp_path):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(THREAD_POOLS_SPEC)
+    waits = []
+    app = AsyncApp(
+        __name__,
+        specification_dir=tmp_path,
+        thread_pool_options=ThreadPoolOptions(
+            max_threads=4, wait_hooks=[lambda name, wait: waits.append(name)]
+        ),
+    )
+    app.add_api("openapi.yaml")
+    app_client = app.test_client()
+
+    assert app_client.get("/bye/jsantos").status_code == 200
+    assert app_client.get("/list/jsantos").status_code == 200
+    assert app_client.get("/greetings/jsantos").status_code == 200
+
+    assert waits == ["operation:fakeapi.hello.get_bye", "tag:lists", "default"]
+    thread_pools = app._middleware_app.thread_pools
+    assert {key: pool.max_threads for key, pool in thread_pools.items()} == {
+        ("operation:fakeapi.hello.get_bye", 1): 1,
+        ("tag:lists", 2): 2,
+        ("default", None): 4,
+    }
+
+    # APIs with another maximum for the same tag don't share the pool
+    lists_pool = thread_pools["tag:lists", 2]
+    other_pool = app._middleware_app.get_thread_pool("tag:lists", 3)
+    assert other_pool is not lists_pool
+    assert other_pool.max_threads == 3
+    assert app._middleware_app.get_thread_pool("tag:lists", 2) is lists_pool
+
+
+def test_reload_tag_max_threads(tmp_path):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(THREAD_POOLS_SPEC)
+    app = AsyncApp(__name__, specification_dir=tmp_path, reload_interval=60)
+    app.add_api("openapi.yaml")
+    app_client = app.test_client()
+    assert app_client.get("/list/jsantos").status_code == 200
+
+    def operations():
+        (api,) = app._middleware_app.apis[""]
+        return api.operations
+
+    old_operations = operations()
+    assert old_operations["fakeapi.hello.get_list"].thread_pool.max_threads == 2
+
+    spec_file.write_text(
+        THREAD_POOLS_SPEC.replace("x-maxThreads: 2", "x-maxThreads: 3")
+    )
+    assert app.reload() == ["openapi.yaml"]
+
+    assert app_client.get("/list/jsantos").status_code == 200
+    new_operations = operations()
+    list_operation = new_operations["fakeapi.hello.get_list"]
+    assert (
+        list_operation.thread_pool is app._middleware_app.thread_pools["tag:lists", 3]
+    )
+    assert list_operation.thread_pool.max_threads == 3
+    # Operations without the tag are reused
+    assert (
+        new_operations["fakeapi.hello.get_bye"]
+        is old_operations["fakeapi.hello.get_bye"]
+    )
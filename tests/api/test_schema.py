@@ -1,5 +1,8 @@
 import json
 
+import yaml
+from connexion.json_schema import resolve_pointer
+
 
 def test_schema(schema_app):
     app_client = schema_app.test_client()
@@ -207,6 +210,23 @@ def test_schema_recursive(schema_app):
     assert right_type.status_code == 200
 
 
+def test_schema_recursive_spec_endpoints(schema_app, spec):
+    app_client = schema_app.test_client()
+
+    spec_json = app_client.get(f"/v1.0/{spec.replace('yaml', 'json')}")
+    assert spec_json.status_code == 200
+    spec_yaml = app_client.get(f"/v1.0/{spec}")
+    assert spec_yaml.status_code == 200
+    assert yaml.safe_load(spec_yaml.text) == spec_json.json()
+
+    if spec == "swagger.yaml":
+        tree = spec_json.json()["definitions"]["simple_tree"]
+    else:
+        tree = spec_json.json()["components"]["schemas"]["simple_tree"]
+    pointer = tree["properties"]["children"]["items"]["$ref"]
+    assert resolve_pointer(spec_json.json(), pointer[1:]) == tree
+
+
 def test_schema_format(schema_app):
     app_client = schema_app.test_client()
 
@@ -375,3 +375,28 @@ def test_security_map_custom_type(secure_api_spec_dir):
         headers={"Authorization": f"bearer {valid_token}"},
     )
     assert res.status_code == 200
+
+
+def test_security_hooks(secure_api_spec_dir, spec):
+    events = []
+    app = App(
+        __name__,
+        specification_dir=secure_api_spec_dir,
+        security_hooks=[events.append],
+    )
+    app.add_api(spec)
+    app_client = app.test_client()
+
+    res = app_client.post(
+        "/v1.0/greeting_basic", headers={"Authorization": "Basic dGVzdDp0ZXN0"}
+    )
+    assert res.status_code == 200
+    res = app_client.post(
+        "/v1.0/greeting_basic", headers={"Authorization": "Basic dGVzdDp3cm9uZw=="}
+    )
+    assert res.status_code == 401
+
+    assert [(e.scheme, e.operation_id, e.outcome) for e in events] == [
+        ("basic", "fakeapi.hello.post_greeting_basic", "success"),
+        ("basic", "fakeapi.hello.post_greeting_basic", "unauthorized"),
+    ]
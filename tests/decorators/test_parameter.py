@@ -2,9 +2,12 @@ import sys
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from connexion.decorators import parameter
 from connexion.decorators.parameter import (
     AsyncParameterDecorator,
+    BindingPlan,
     SyncParameterDecorator,
+    argument_names,
     pythonic,
 )
 from connexion.frameworks.flask import Flask as FlaskFramework
@@ -111,3 +114,110 @@ async def test_async_injection_with_context():
 def test_pythonic_params():
     assert pythonic("orderBy[eq]") == "order_by_eq"
     assert pythonic("ids[]") == "ids"
+
+
+def test_pythonic_params_memoised():
+    pythonic.cache_clear()
+    for _ in range(3):
+        assert pythonic("FilterOption") == "filter_option"
+    assert pythonic.cache_info().hits == 2
+
+
+def test_argument_names():
+    operation = MagicMock(name="operation")
+    operation.is_request_body_defined = True
+    operation.consumes = ["application/json"]
+    operation.body_name = lambda _: "PetBody"
+    operation.parameters = [
+        {"name": "petId", "in": "path"},
+        {"name": "filter", "in": "query"},
+        {"name": "X-Request-ID", "in": "header"},
+    ]
+
+    assert argument_names(operation) == {
+        "petId": "petId",
+        "filter": "filter",
+        "PetBody": "PetBody",
+    }
+    assert argument_names(operation, pythonic_params=True) == {
+        "petId": "pet_id",
+        "filter": "filter_",
+        "PetBody": "pet_body",
+    }
+
+
+def test_binding_plan():
+    operation = MagicMock(name="operation")
+    operation.method = "get"
+    operation.consumes = []
+    operation.is_request_body_defined = False
+    operation.body_name = lambda _: "body"
+    operation.parameters = [
+        {"name": "petId", "in": "path", "schema": {"type": "integer"}},
+        {"name": "limit", "in": "query", "schema": {"type": "integer", "default": 10}},
+        {
+            "name": "filter",
+            "in": "query",
+            "schema": {
+                "type": "object",
+                "properties": {"kind": {"type": "string", "default": "cat"}},
+            },
+        },
+        {"name": "unused", "in": "query", "schema": {"type": "string"}},
+    ]
+
+    plan = BindingPlan(
+        operation,
+        arguments=["pet_id", "limit", "filter_"],
+        has_kwargs=False,
+        sanitize=pythonic,
+    )
+    assert [binding[:2] for binding in plan.query_bindings] == [
+        ("limit", "limit"),
+        ("filter", "filter_"),
+    ]
+
+    def bind(path_params, query_params):
+        return plan.bind(
+            path_params=path_params,
+            query_params=query_params,
+            body=None,
+            files={},
+            content_type="application/json",
+        )
+
+    kwargs = bind({"petId": "1"}, {"filter": {"name": "Tom"}, "unused": "foo"})
+    assert kwargs == {
+        "pet_id": 1,
+        "limit": 10,
+        "filter_": {"kind": "cat", "name": "Tom"},
+    }
+
+    # The defaults are not shared between requests
+    kwargs["filter_"]["kind"] = "dog"
+    assert bind({"petId": "2"}, {"limit": "5"}) == {
+        "pet_id": 2,
+        "limit": 5,
+        "filter_": {"kind": "cat"},
+    }
+
+
+def test_binding_plan_built_once_per_operation(monkeypatch):
+    binding_plan = MagicMock(wraps=BindingPlan)
+    monkeypatch.setattr(parameter, "BindingPlan", binding_plan)
+
+    request = MagicMock(name="request")
+    request.path_params = {"p1": "123"}
+
+    def handler(**kwargs):
+        return kwargs
+
+    decorated_handler = SyncParameterDecorator(framework=FlaskFramework)(handler)
+    operations = [MagicMock(name="operation"), MagicMock(name="operation")]
+    for operation in operations:
+        operation.is_request_body_defined = False
+        operation.body_name = lambda _: "body"
+        with TestContext(operation=operation):
+            for _ in range(2):
+                assert decorated_handler(request) == {"p1": "123"}
+    assert binding_plan.call_count == 2
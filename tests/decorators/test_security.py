@@ -1,8 +1,13 @@
+import asyncio
+import base64
 import json
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 import requests
+from connexion.decorators.parameter import inspect_function_arguments
 from connexion.exceptions import (
     BadRequestProblem,
     ConnexionException,
@@ -11,12 +16,20 @@ from connexion.exceptions import (
     OAuthScopeProblem,
 )
 from connexion.lifecycle import ConnexionRequest
+from connexion.options import ThreadPoolOptions
 from connexion.security import (
     NO_VALUE,
+    AbstractSecurityHandler,
     ApiKeySecurityHandler,
     BasicSecurityHandler,
+    BearerSecurityHandler,
+    JSONWebKeySet,
+    JWTSecurityHandler,
     OAuthSecurityHandler,
+    SecurityEvent,
     SecurityHandlerFactory,
+    SharedHTTPClient,
+    TokenInfoCache,
 )
 
 
@@ -115,6 +128,708 @@ async def test_verify_oauth_scopes_remote(monkeypatch):
     assert await wrapped_func(request) is not None
 
 
+async def test_verify_oauth_remote_cached(monkeypatch):
+    tokeninfo = dict(uid="foo", scope="admin")
+    tokeninfo_request = MagicMock()
+
+    async def get_tokeninfo_response(*args, headers, **kwargs):
+        tokeninfo_request(headers["Authorization"])
+        tokeninfo_response = requests.Response()
+        if headers["Authorization"] == "Bearer 123":
+            tokeninfo_response.status_code = requests.codes.ok
+            tokeninfo_response._content = json.dumps(tokeninfo).encode()
+        else:
+            tokeninfo_response.status_code = requests.codes.unauthorized
+        return tokeninfo_response
+
+    client = MagicMock()
+    client.get = get_tokeninfo_response
+    monkeypatch.setattr(OAuthSecurityHandler, "client", client)
+
+    security_handler = OAuthSecurityHandler()
+    token_info_func = security_handler.get_tokeninfo_func(
+        {"x-tokenInfoUrl": "https://example.org/tokeninfo", "x-tokenInfoCacheTtl": 60}
+    )
+    wrapped_func = security_handler._get_verify_func(
+        token_info_func, security_handler.validate_scope, ["admin"]
+    )
+
+    def request(token):
+        return ConnexionRequest(
+            scope={"type": "http", "headers": [[b"authorization", token]]}
+        )
+
+    for _ in range(3):
+        assert await wrapped_func(request(b"Bearer 123")) == tokeninfo
+        with pytest.raises(OAuthResponseProblem):
+            await wrapped_func(request(b"Bearer 456"))
+
+    assert tokeninfo_request.call_count == 2
+    (cache,) = security_handler.caches.values()
+    assert cache.cache_info() == (2, 2, 2, 1024, 2)
+
+
+def test_token_info_caches_scoped():
+    def get_cache(factory, security_definition):
+        security_handler = OAuthSecurityHandler()
+        security_handler.caches = factory.caches
+        return security_handler.get_token_info_cache(
+            security_definition, "https://example.org/tokeninfo"
+        )
+
+    factory = SecurityHandlerFactory()
+    cache = get_cache(factory, {"x-tokenInfoCacheTtl": 60})
+    assert get_cache(factory, {"x-tokenInfoCacheTtl": 60}) is cache
+    # Caches with another configuration or of another application are not shared
+    other_size = get_cache(
+        factory, {"x-tokenInfoCacheTtl": 60, "x-tokenInfoCacheSize": 10}
+    )
+    assert other_size is not cache
+    assert other_size.maxsize == 10
+    assert get_cache(SecurityHandlerFactory(), {"x-tokenInfoCacheTtl": 60}) is not cache
+
+
+async def test_verify_oauth_remote_coalesced(monkeypatch):
+    tokeninfo = dict(uid="foo", scope="admin")
+    tokeninfo_request = MagicMock()
+    respond = asyncio.Event()
+
+    async def get_tokeninfo_response(*args, headers, **kwargs):
+        tokeninfo_request(headers["Authorization"])
+        await respond.wait()
+        tokeninfo_response = requests.Response()
+        tokeninfo_response.status_code = requests.codes.ok
+        tokeninfo_response._content = json.dumps(tokeninfo).encode()
+        return tokeninfo_response
+
+    client = MagicMock()
+    client.get = get_tokeninfo_response
+    monkeypatch.setattr(OAuthSecurityHandler, "client", client)
+
+    security_handler = OAuthSecurityHandler()
+    token_info_func = security_handler.get_tokeninfo_func(
+        {"x-tokenInfoUrl": "https://example.org/tokeninfo"}
+    )
+    wrapped_func = security_handler._get_verify_func(
+        token_info_func, security_handler.validate_scope, ["admin"]
+    )
+
+    def request(token):
+        return ConnexionRequest(
+            scope={"type": "http", "headers": [[b"authorization", token]]}
+        )
+
+    lookups = asyncio.gather(
+        *(wrapped_func(request(b"Bearer 123")) for _ in range(5)),
+        wrapped_func(request(b"Bearer 456")),
+    )
+    await asyncio.sleep(0)
+    respond.set()
+    token_infos = await lookups
+
+    assert token_infos == [tokeninfo] * 6
+    # The coalesced requests don't share the token info
+    assert len({id(token_info) for token_info in token_infos}) == 6
+    assert tokeninfo_request.call_count == 2
+
+
+async def test_bearer_coalesced_error():
+    calls = []
+
+    async def bearer_info(token):
+        calls.append(token)
+        await asyncio.sleep(0)
+        raise OAuthProblem(detail="Token expired")
+
+    security_handler = BearerSecurityHandler()
+    wrapped_func = security_handler._get_verify_func(bearer_info)
+    request = ConnexionRequest(
+        scope={"type": "http", "headers": [[b"authorization", b"Bearer 123"]]}
+    )
+
+    results = await asyncio.gather(
+        *(wrapped_func(request) for _ in range(3)), return_exceptions=True
+    )
+
+    assert calls == ["123"]
+    assert all(isinstance(result, OAuthProblem) for result in results)
+
+
+async def test_verify_oauth_shared_http_client():
+    tokeninfo_request = MagicMock()
+
+    async def get_tokeninfo_response(*args, **kwargs):
+        tokeninfo_request()
+        tokeninfo_response = requests.Response()
+        tokeninfo_response.status_code = requests.codes.ok
+        tokeninfo_response._content = json.dumps(dict(uid="foo")).encode()
+        return tokeninfo_response
+
+    http_client = SharedHTTPClient()
+    http_client.get = MagicMock(return_value=MagicMock(get=get_tokeninfo_response))
+    security_handler_factory = SecurityHandlerFactory(http_client=http_client)
+    request = ConnexionRequest(
+        scope={"type": "http", "headers": [[b"authorization", b"Bearer 123"]]}
+    )
+
+    for url in ("https://example.org/tokeninfo", "https://example.com/tokeninfo"):
+        verify = security_handler_factory.parse_security_scheme(
+            {"type": "oauth2", "x-tokenInfoUrl": url}, []
+        )
+        assert await verify(request) == {"uid": "foo"}
+
+    assert tokeninfo_request.call_count == 2
+    assert http_client.get.call_count == 2
+
+
+@pytest.fixture
+def jwks(tmp_path):
+    jwt = pytest.importorskip("jwt")
+    from cryptography.hazmat.primitives.asymmetric import rsa
+
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = json.loads(jwt.algorithms.RSAAlgorithm.to_jwk(private_key.public_key()))
+    jwk["kid"] = "key-1"
+    path = tmp_path / "jwks.json"
+    path.write_text(json.dumps({"keys": [jwk]}))
+
+    def encode(claims, kid="key-1"):
+        return jwt.encode(claims, private_key, algorithm="RS256", headers={"kid": kid})
+
+    return str(path), encode
+
+
+async def test_verify_jwt(jwks):
+    path, encode = jwks
+    security_handler_factory = SecurityHandlerFactory(
+        {"bearer": JWTSecurityHandler, "oauth2": JWTSecurityHandler}
+    )
+    verify = security_handler_factory.parse_security_scheme(
+        {
+            "type": "oauth2",
+            "x-jwksUrl": path,
+            "x-jwtIssuer": "https://example.org",
+            "x-jwtAudience": "api",
+        },
+        ["read"],
+    )
+
+    def make_request(token):
+        header = f"Bearer {token}".encode()
+        return ConnexionRequest(
+            scope={"type": "http", "headers": [[b"authorization", header]]}
+        )
+
+    claims = {
+        "sub": "foo",
+        "scope": "read write",
+        "iss": "https://example.org",
+        "aud": "api",
+        "exp": time.time() + 60,
+    }
+    assert (await verify(make_request(encode(claims))))["sub"] == "foo"
+
+    for invalid_claims, kid in (
+        ({**claims, "exp": time.time() - 60}, "key-1"),
+        ({**claims, "iss": "https://example.com"}, "key-1"),
+        ({**claims, "aud": "other"}, "key-1"),
+        (claims, "key-2"),
+    ):
+        with pytest.raises(OAuthResponseProblem):
+            await verify(make_request(encode(invalid_claims, kid=kid)))
+
+    with pytest.raises(OAuthScopeProblem):
+        await verify(make_request(encode({**claims, "scope": "write"})))
+
+    # Bearer schemes without a JWKS are handled by the bearer security handler
+    verify = security_handler_factory.parse_security_scheme(
+        {"type": "http", "scheme": "bearer", "x-bearerInfoFunc": "os.path.basename"}, []
+    )
+    assert await verify(make_request("123")) == "123"
+
+
+async def test_verify_jwt_cached(jwks, monkeypatch):
+    jwt = pytest.importorskip("jwt")
+    path, encode = jwks
+    decode = MagicMock(side_effect=jwt.decode)
+    monkeypatch.setattr(jwt, "decode", decode)
+
+    security_handler = JWTSecurityHandler()
+    verify = security_handler.get_jwt_decode_func({"x-jwksUrl": path}, path)
+    token = encode({"sub": "foo", "exp": time.time() + 60})
+
+    assert await verify(token) == await verify(token)
+    assert decode.call_count == 1
+    assert await verify("invalid") is None
+
+
+async def test_json_web_key_set_file_read_in_thread_pool(jwks):
+    path, _ = jwks
+    thread_pool = MagicMock()
+    thread_pool.run = AsyncMock(side_effect=lambda func, *args: func(*args))
+    key_set = JSONWebKeySet(path, thread_pool=thread_pool)
+
+    assert (await key_set.get_key("key-1", MagicMock())).key_id == "key-1"
+    thread_pool.run.assert_awaited_once_with(key_set._read_file, path)
+
+
+def test_jwt_caches_scoped(jwks):
+    path, _ = jwks
+
+    def get_caches(factory, security_scheme):
+        security_handler = JWTSecurityHandler()
+        security_handler.caches = factory.caches
+        security_handler.get_jwt_decode_func(security_scheme, path)
+        return set(map(id, factory.caches.values()))
+
+    factory = SecurityHandlerFactory()
+    caches = get_caches(factory, {"type": "oauth2"})
+    assert len(caches) == 2
+    assert get_caches(factory, {"type": "oauth2"}) == caches
+    # Caches with another configuration or of another application are not shared
+    assert len(get_caches(factory, {"type": "oauth2", "x-jwtCacheSize": 10})) == 3
+    assert get_caches(SecurityHandlerFactory(), {"type": "oauth2"}).isdisjoint(caches)
+
+
+async def test_json_web_key_set(jwks):
+    path, _ = jwks
+    now = 0
+    key_set = JSONWebKeySet(path, refresh_interval=3600, timer=lambda: now)
+    get_client = MagicMock()
+
+    assert (await key_set.get_key("key-1", get_client)).key_id == "key-1"
+    # The only key is used for tokens without key id
+    assert (await key_set.get_key(None, get_client)).key_id == "key-1"
+
+    with open(path, "w") as f:
+        json.dump({"keys": []}, f)
+    # Unknown keys are only loaded again after the minimum refresh interval
+    assert await key_set.get_key("key-2", get_client) is None
+    now = 60
+    # The current keys are kept if the key set fails to load
+    assert (await key_set.get_key("key-1", get_client)).key_id == "key-1"
+    assert await key_set.get_key("key-2", get_client) is None
+    get_client.assert_not_called()
+
+
+async def test_sync_security_func_thread_pool(monkeypatch):
+    threads = []
+    started = threading.Barrier(2, timeout=5)
+
+    def apikey_info(apikey, required_scopes=None):
+        threads.append(threading.get_ident())
+        if apikey == "concurrent":
+            # Only passes if both calls run at the same time
+            started.wait()
+        return {"sub": apikey}
+
+    monkeypatch.setattr(
+        "connexion.security.get_function_from_name", lambda name: apikey_info
+    )
+    security_scheme = {
+        "type": "apiKey",
+        "in": "header",
+        "name": "X-Auth",
+        "x-apikeyInfoFunc": "apikey_info",
+    }
+
+    def make_request(apikey):
+        return ConnexionRequest(
+            scope={"type": "http", "headers": [[b"x-auth", apikey.encode()]]}
+        )
+
+    thread_pool = ThreadPoolOptions(max_threads=2).create_pool()
+    security_handler_factory = SecurityHandlerFactory(thread_pool=thread_pool)
+    verify = security_handler_factory.parse_security_scheme(security_scheme, [])
+    results = await asyncio.gather(
+        verify(make_request("concurrent")), verify(make_request("concurrent"))
+    )
+    assert results == [{"sub": "concurrent"}] * 2
+    assert threading.get_ident() not in threads
+    assert thread_pool.limiter.total_tokens == 2
+
+    # Functions marked as inline run on the event loop
+    threads.clear()
+    verify = security_handler_factory.parse_security_scheme(
+        {**security_scheme, "x-inlineSecurityFunc": True}, []
+    )
+    assert await verify(make_request("inline")) == {"sub": "inline"}
+    assert threads == [threading.get_ident()]
+
+
+async def test_security_compiled_at_startup(monkeypatch):
+    inspect_arguments = MagicMock(side_effect=inspect_function_arguments)
+    monkeypatch.setattr(
+        "connexion.security.inspect_function_arguments", inspect_arguments
+    )
+
+    def apikey_info(apikey, required_scopes):
+        return {"sub": apikey, "scope": "read"}
+
+    security_handler_factory = SecurityHandlerFactory()
+    verify = security_handler_factory.verify_security(
+        [
+            ApiKeySecurityHandler()._get_verify_func(
+                apikey_info, "header", "X-Auth", ["read"]
+            )
+        ]
+    )
+    call_count = inspect_arguments.call_count
+
+    for apikey in ("foo", "bar"):
+        request = ConnexionRequest(
+            scope={"type": "http", "headers": [[b"x-auth", apikey.encode()]]}
+        )
+        await verify(request)
+        assert request.context["user"] == apikey
+    assert inspect_arguments.call_count == call_count
+
+    with pytest.raises(OAuthProblem):
+        await verify(ConnexionRequest(scope={"type": "http", "headers": []}))
+
+
+def test_compile_validate_scope():
+    validate_scope = OAuthSecurityHandler.compile_validate_scope(["read", "write"])
+    assert validate_scope(["read", "write"], "read write admin")
+    assert validate_scope(["read", "write"], ["read", "write"])
+    assert not validate_scope(["read", "write"], "read")
+    assert OAuthSecurityHandler.compile_validate_scope([])([], "")
+
+
+async def test_basic_credentials_cached(monkeypatch):
+    def basic_info(username, password):
+        basic_info.call_count += 1
+        return {"sub": username}
+
+    basic_info.call_count = 0
+
+    def make_request(username, password):
+        user_pass = base64.b64encode(f"{username}:{password}".encode())
+        return ConnexionRequest(
+            scope={
+                "type": "http",
+                "headers": [[b"authorization", b"Basic " + user_pass]],
+            }
+        )
+
+    security_handler = BasicSecurityHandler()
+    security_handler.inline = True
+    security_handler.credentials_cache = security_handler.get_credentials_cache(
+        {"x-credentialsCacheTtl": 60}, basic_info
+    )
+    verify = security_handler._get_verify_func(basic_info)
+
+    for _ in range(3):
+        assert await verify(make_request("foo", "bar")) == {"sub": "foo"}
+    assert await verify(make_request("foo", "baz")) == {"sub": "foo"}
+    assert basic_info.call_count == 2
+    assert security_handler.credentials_cache.cache_info() == (2, 2, 0, 1024, 2)
+
+    # The cached token info is not shared between requests
+    token_info = await verify(make_request("foo", "bar"))
+    token_info["sub"] = "baz"
+    assert await verify(make_request("foo", "bar")) == {"sub": "foo"}
+
+
+async def test_api_key_credentials_cached(monkeypatch):
+    def apikey_info(apikey, required_scopes):
+        apikey_info.calls.append((apikey, required_scopes))
+        return {"sub": "foo"} if apikey == "valid" else None
+
+    apikey_info.calls = []
+    monkeypatch.setattr(
+        "connexion.security.get_function_from_name", lambda name: apikey_info
+    )
+
+    class CachedApiKeySecurityHandler(ApiKeySecurityHandler):
+        credentials_cache_ttl = 60
+        credentials_cache_negative_ttl = 5
+
+    security_handler_factory = SecurityHandlerFactory(
+        {"apiKey": CachedApiKeySecurityHandler}
+    )
+    security_scheme = {
+        "type": "apiKey",
+        "in": "header",
+        "name": "X-Auth",
+        "x-apikeyInfoFunc": "apikey_info",
+    }
+
+    def make_request(apikey):
+        return ConnexionRequest(
+            scope={"type": "http", "headers": [[b"x-auth", apikey.encode()]]}
+        )
+
+    for required_scopes in (["read"], ["read"], ["write"]):
+        verify = security_handler_factory.parse_security_scheme(
+            security_scheme, required_scopes
+        )
+        assert await verify(make_request("valid")) == {"sub": "foo"}
+        for _ in range(2):
+            with pytest.raises(OAuthResponseProblem):
+                await verify(make_request("invalid"))
+
+    # Cached by api key and required scopes, including invalid keys
+    assert apikey_info.calls == [
+        ("valid", ["read"]),
+        ("invalid", ["read"]),
+        ("valid", ["write"]),
+        ("invalid", ["write"]),
+    ]
+
+
+def test_credentials_caches_scoped():
+    def basic_info(username, password):
+        return {"sub": username}
+
+    def get_cache(factory, security_scheme):
+        security_handler = BasicSecurityHandler()
+        security_handler.caches = factory.caches
+        return security_handler.get_credentials_cache(security_scheme, basic_info)
+
+    factory = SecurityHandlerFactory()
+    cache = get_cache(factory, {"x-credentialsCacheTtl": 60})
+    assert get_cache(factory, {"x-credentialsCacheTtl": 60}) is cache
+    # Caches with another configuration or of another application are not shared
+    other_ttl = get_cache(factory, {"x-credentialsCacheTtl": 5})
+    assert other_ttl is not cache
+    assert other_ttl.ttl == 5
+    assert (
+        get_cache(SecurityHandlerFactory(), {"x-credentialsCacheTtl": 60}) is not cache
+    )
+
+
+def test_credentials_not_cached_with_request():
+    def apikey_info(apikey, request):
+        return {"sub": "foo"}
+
+    security_handler = ApiKeySecurityHandler()
+    assert (
+        security_handler.get_credentials_cache(
+            {"x-credentialsCacheTtl": 60}, apikey_info
+        )
+        is None
+    )
+    assert security_handler.get_credentials_cache({}, lambda apikey: {}) is None
+
+
+async def test_security_hooks(monkeypatch):
+    def basic_info(username, password):
+        return {"sub": username} if password == "bar" else None
+
+    def make_request(password):
+        user_pass = base64.b64encode(f"foo:{password}".encode())
+        return ConnexionRequest(
+            scope={
+                "type": "http",
+                "headers": [[b"authorization", b"Basic " + user_pass]],
+            }
+        )
+
+    def failing_hook(event):
+        raise RuntimeError("Hook failed")
+
+    events = []
+    security_handler = BasicSecurityHandler()
+    security_handler.credentials_cache = security_handler.get_credentials_cache(
+        {"x-credentialsCacheTtl": 60}, basic_info
+    )
+    verify = security_handler._get_verify_func(basic_info)
+    security_handler_factory = SecurityHandlerFactory(
+        hooks=[events.append, failing_hook]
+    )
+    verify = security_handler_factory.instrument(verify, "basic", "op")
+
+    assert await verify(make_request("bar")) == {"sub": "foo"}
+    assert await verify(make_request("bar")) == {"sub": "foo"}
+    with pytest.raises(OAuthResponseProblem):
+        await verify(make_request("baz"))
+    request = ConnexionRequest(scope={"type": "http", "headers": []})
+    assert await verify(request) is NO_VALUE
+
+    assert all(isinstance(event, SecurityEvent) for event in events)
+    assert [(e.scheme, e.operation_id) for e in events] == [("basic", "op")] * 4
+    assert [(e.outcome, e.cache) for e in events] == [
+        ("success", "miss"),
+        ("success", "hit"),
+        ("unauthorized", "miss"),
+        ("no_credentials", None),
+    ]
+    assert all(event.duration >= 0 for event in events)
+
+    # Without hooks, the security functions are not wrapped
+    assert SecurityHandlerFactory().instrument(verify, "basic", "op") is verify
+
+
+async def test_security_hooks_remote_calls(monkeypatch):
+    async def get(url, **kwargs):
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {"uid": "foo", "scope": "read"}
+        return response
+
+    events = []
+    client = MagicMock()
+    client.get = get
+    http_client = MagicMock()
+    http_client.get.return_value = client
+    security_handler_factory = SecurityHandlerFactory(
+        http_client=http_client, hooks=[events.append]
+    )
+    verify = security_handler_factory.parse_security_scheme(
+        {
+            "type": "oauth2",
+            "x-tokenInfoUrl": "https://example.com/tokeninfo",
+            "flows": {},
+        },
+        ["read"],
+    )
+    verify = security_handler_factory.instrument(verify, "oauth", "op")
+
+    request = ConnexionRequest(
+        scope={"type": "http", "headers": [[b"authorization", b"Bearer 123"]]}
+    )
+    assert await verify(request) == {"uid": "foo", "scope": "read"}
+    assert (events[0].outcome, events[0].remote_calls) == ("success", 1)
+
+
+async def test_verify_security_concurrently():
+    cancelled = []
+
+    async def slow(request):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.append("slow")
+            raise
+        return {"sub": "slow"}
+
+    async def fast(request):
+        return {"sub": "fast"}
+
+    async def no_credentials(request):
+        return NO_VALUE
+
+    async def unauthorized(request):
+        raise OAuthResponseProblem(detail="Unauthorized")
+
+    async def forbidden(request):
+        await asyncio.sleep(0)
+        raise OAuthScopeProblem(required_scopes=["read"], token_scopes=[])
+
+    verify = SecurityHandlerFactory.verify_security(
+        [slow, no_credentials, fast], concurrent=True
+    )
+    request = MagicMock()
+    request.context = {}
+    await asyncio.wait_for(verify(request), timeout=1)
+    assert request.context["user"] == "fast"
+    await asyncio.sleep(0)
+    assert cancelled == ["slow"]
+
+    # The most specific error is raised, like when verifying one by one
+    verify = SecurityHandlerFactory.verify_security(
+        [unauthorized, forbidden, no_credentials], concurrent=True
+    )
+    with pytest.raises(OAuthScopeProblem):
+        await verify(request)
+
+    verify = SecurityHandlerFactory.verify_security(
+        [no_credentials, lambda request: NO_VALUE], concurrent=True
+    )
+    with pytest.raises(OAuthProblem, match="No authorization token provided"):
+        await verify(request)
+
+
+async def test_verify_multiple_schemes_concurrently():
+    started = []
+
+    async def scheme(request):
+        started.append(request)
+        # Only completes if the other scheme is verified at the same time
+        while len(started) < 2:
+            await asyncio.sleep(0)
+        return {"sub": "foo"}
+
+    security_handler_factory = SecurityHandlerFactory(concurrent=True)
+    verify = security_handler_factory.verify_multiple_schemes(
+        {"key1": scheme, "key2": scheme}
+    )
+    result = await asyncio.wait_for(verify("request"), timeout=1)
+    assert result == {"key1": {"sub": "foo"}, "key2": {"sub": "foo"}}
+
+    async def no_credentials(request):
+        return NO_VALUE
+
+    async def unauthorized(request):
+        raise OAuthResponseProblem(detail="Unauthorized")
+
+    # The results are evaluated in order
+    verify = security_handler_factory.verify_multiple_schemes(
+        {"key1": no_credentials, "key2": unauthorized}
+    )
+    assert await verify("request") is NO_VALUE
+    verify = security_handler_factory.verify_multiple_schemes(
+        {"key1": unauthorized, "key2": no_credentials}
+    )
+    with pytest.raises(OAuthResponseProblem):
+        await verify("request")
+
+
+async def test_verify_api_key_cookie():
+    async def apikey_info(apikey, required_scopes=None):
+        return {"sub": apikey}
+
+    verify = ApiKeySecurityHandler()._get_verify_func(
+        apikey_info, "cookie", "session", []
+    )
+    request = ConnexionRequest(
+        scope={
+            "type": "http",
+            "headers": [[b"cookie", b"theme=dark; session=123; other"]],
+        }
+    )
+    assert await verify(request) == {"sub": "123"}
+    assert request.cookies is ConnexionRequest(request.scope).cookies
+
+    request = ConnexionRequest(scope={"type": "http", "headers": []})
+    assert verify(request) is NO_VALUE
+
+
+def test_token_info_cache():
+    now = 0
+    cache = TokenInfoCache(maxsize=2, ttl=60, negative_ttl=10, timer=lambda: now)
+
+    cache.set("valid", {"sub": "foo"})
+    cache.set("invalid", None)
+    assert cache.get("valid") == {"sub": "foo"}
+    assert cache.get("invalid", NO_VALUE) is None
+    assert cache.get("unknown", NO_VALUE) is NO_VALUE
+
+    now = 30
+    assert cache.get("invalid", NO_VALUE) is NO_VALUE
+    assert cache.get("valid") == {"sub": "foo"}
+    now = 90
+    assert cache.get("valid", NO_VALUE) is NO_VALUE
+
+    # The token info can expire the entry sooner
+    cache.set("expires_in", {"expires_in": 5})
+    now = 95
+    assert cache.get("expires_in", NO_VALUE) is NO_VALUE
+    cache.set("exp", {"exp": 0})
+    assert cache.get("exp", NO_VALUE) is NO_VALUE
+
+    # The least recently used entry is evicted
+    cache.set("a", {})
+    cache.set("b", {})
+    cache.get("a")
+    cache.set("c", {})
+    assert cache.get("b", NO_VALUE) is NO_VALUE
+    assert cache.get("a") == {}
+
+    assert cache.cache_info() == (4, 6, 1, 2, 2)
+
+
 async def test_verify_oauth_invalid_local_token_response_none():
     def somefunc(token):
         return None
@@ -1,5 +1,6 @@
 import os
 import pathlib
+import shutil
 import tempfile
 from unittest.mock import MagicMock
 
@@ -189,6 +190,36 @@ def test_use_of_safe_load_for_yaml_swagger_specs():
             pytest.fail("Could load invalid YAML file, use yaml.safe_load!")
 
 
+def test_load_json_spec(tmp_path, monkeypatch):
+    spec_file = tmp_path / "openapi.json"
+    spec_file.write_text(
+        '{"openapi": "3.0.0", "info": {"title": "Foo", "version": "v1"}, "paths": {}}'
+    )
+    monkeypatch.setattr("jinja2.Template", MagicMock(side_effect=AssertionError))
+
+    specification = Specification.load(spec_file)
+
+    assert specification["info"]["title"] == "Foo"
+
+
+def test_load_spec_coerces_keys_to_string(tmp_path):
+    spec_file = tmp_path / "swagger.yaml"
+    spec_file.write_text(
+        "swagger: '2.0'\n"
+        "info: {title: Foo, version: v1}\n"
+        "paths:\n"
+        "  /foo:\n"
+        "    get:\n"
+        "      responses:\n"
+        "        200:\n"
+        "          description: OK\n"
+    )
+
+    specification = Specification.load(spec_file)
+
+    assert list(specification["paths"]["/foo"]["get"]["responses"]) == ["200"]
+
+
 def test_validation_error_on_completely_invalid_swagger_spec():
     with tempfile.NamedTemporaryFile(delete=False) as f:
         f.write(b"[1]\n")
@@ -203,8 +234,81 @@ def test_relative_refs(relative_refs, spec):
     assert "$ref" not in specification.raw
 
 
+def test_with_base_path(spec, monkeypatch):
+    specification = Specification.load(TEST_FOLDER / "fixtures/simple" / spec)
+    original_base_path = specification.base_path
+
+    validate_spec = MagicMock()
+    monkeypatch.setattr(Specification, "_validate_spec", validate_spec)
+    view = specification.with_base_path("/other")
+    validate_spec.assert_not_called()
+
+    assert view.base_path == "/other"
+    assert specification.base_path == original_base_path
+    # The resolved structures are shared with the original specification
+    assert view["paths"] is specification["paths"]
+    assert view.ref_resolver is specification.ref_resolver
+
+
+def test_spec_cache(relative_refs, spec, tmp_path, monkeypatch):
+    spec_dir = tmp_path / "spec"
+    shutil.copytree(relative_refs, spec_dir)
+    cache_dir = tmp_path / "cache"
+
+    specification = Specification.load(spec_dir / spec, cache_dir=cache_dir)
+    assert len(list(cache_dir.iterdir())) == 1
+
+    # A cached specification is not validated or resolved again
+    validate_spec = MagicMock()
+    monkeypatch.setattr(Specification, "_validate_spec", validate_spec)
+    cached = Specification.load(spec_dir / spec, cache_dir=cache_dir)
+    validate_spec.assert_not_called()
+    assert cached.raw == specification.raw
+    assert dict(cached) == dict(specification)
+    assert cached.ref_resolver.referrer is cached._spec
+
+    # Other Jinja arguments result in a different cache entry
+    Specification.load(spec_dir / spec, arguments={"a": 1}, cache_dir=cache_dir)
+    assert validate_spec.call_count == 1
+
+    # Changing a referenced file invalidates the entry
+    for referenced in ("components.yaml", "definitions.yaml"):
+        with open(spec_dir / referenced, "a") as f:
+            f.write("\n# changed\n")
+    Specification.load(spec_dir / spec, cache_dir=cache_dir)
+    assert validate_spec.call_count == 2
+
+
 @pytest.fixture
 def mock_api_logger(monkeypatch):
     mocked_logger = MagicMock(name="mocked_logger")
     monkeypatch.setattr("connexion.apis.abstract.logger", mocked_logger)
     return mocked_logger
+
+
+def test_operation_fingerprints(tmp_path):
+    spec_file = tmp_path / "openapi.yaml"
+    spec_file.write_text(
+        "openapi: 3.0.0\n"
+        "info: {title: Foo, version: v1}\n"
+        "paths:\n"
+        "  /foo:\n"
+        "    get:\n"
+        "      responses:\n"
+        "        '200': {$ref: 'responses.yaml#/Foo'}\n"
+        "  /bar:\n"
+        "    get:\n"
+        "      responses:\n"
+        "        '200': {description: OK}\n"
+    )
+    responses_file = tmp_path / "responses.yaml"
+    responses_file.write_text("Foo: {description: OK}\n")
+
+    fingerprints = Specification.load(spec_file).operation_fingerprints()
+    assert fingerprints.keys() == {("/foo", "get"), ("/bar", "get")}
+    assert Specification.load(spec_file).operation_fingerprints() == fingerprints
+
+    responses_file.write_text("Foo: {description: Changed}\n")
+    changed = Specification.load(spec_file).operation_fingerprints()
+    assert changed[("/foo", "get")] != fingerprints[("/foo", "get")]
+    assert changed[("/bar", "get")] == fingerprints[("/bar", "get")]
@@ -1,5 +1,6 @@
 import contextlib
 import io
+import json
 import logging
 from unittest.mock import MagicMock
 
@@ -188,3 +189,22 @@ def test_run_unimplemented_operations_with_stub2(mock_app_run):
 def test_run_unimplemented_operations_and_mock(mock_app_run):
     spec_file = str(FIXTURES_FOLDER / "missing_implementation/swagger.yaml")
     main(["run", spec_file, "--mock=all"])
+
+
+def test_profile_spec(spec_file):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        main(["profile", spec_file])
+
+    assert "load_specification" in output.getvalue()
+    assert "Slowest operations" in output.getvalue()
+
+
+def test_profile_spec_json(spec_file):
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        main(["profile", spec_file, "--json"])
+
+    report = json.loads(output.getvalue())
+    assert report["apis"][0]["api"] == spec_file
+    assert report["operations"]
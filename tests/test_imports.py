@@ -0,0 +1,68 @@
+import re
+import subprocess
+import sys
+
+# Optional or feature specific dependencies which should only be imported when they're used
+LAZY_MODULES = [
+    "flask",
+    "werkzeug.routing",
+    "a2wsgi",
+    "httpx",
+    "requests",
+    "jinja2",
+    "inflection",
+    "jwt",
+    "starlette.testclient",
+]
+
+# Required dependencies of which the import time is the baseline for the import time of connexion
+BASELINE_MODULES = ["starlette.applications", "jsonschema"]
+
+# Upper bound of the import time of connexion, imported after its baseline, relative to the baseline.
+# Both are measured in the same process, so the ratio doesn't depend on the speed of the machine.
+IMPORT_TIME_RATIO = 1.5
+
+
+def test_import_does_not_load_lazy_modules():
+    code = (
+        "import sys, connexion;"
+        f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    output = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout
+
+    assert output.strip() == ""
+
+
+def _import_times(modules):
+    """Cumulative import times of top level imports, importing the modules in order."""
+    stderr = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(modules)}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    matches = re.findall(r"^import time:\s+\d+ \|\s+(\d+) \| (\S+)$", stderr, re.M)
+    return {module: int(cumulative) for cumulative, module in matches}
+
+
+def test_import_time():
+    ratios = []
+    # Take the best of a few runs, so a single slow run doesn't fail the test
+    for _ in range(3):
+        times = _import_times([*BASELINE_MODULES, "connexion"])
+        baseline = sum(times[module] for module in BASELINE_MODULES)
+        ratios.append(times["connexion"] / baseline)
+
+    assert min(ratios) < IMPORT_TIME_RATIO
+
+
+def test_lazy_flask_app():
+    import connexion
+    from connexion.apps.flask import FlaskApi, FlaskApp
+
+    assert connexion.FlaskApp is FlaskApp
+    assert connexion.App is FlaskApp
+    assert connexion.FlaskApi is FlaskApi
+    assert connexion.Api is FlaskApi
@@ -4,6 +4,8 @@ from unittest import mock
 
 import pytest
 from connexion import AsyncApp, ConnexionMiddleware
+from connexion.middleware.security import SecurityMiddleware
+from connexion.options import HTTPClientOptions
 
 
 def test_lifespan_handler(app_class):
@@ -36,3 +38,21 @@ async def test_lifespan():
     test_app = ConnexionMiddleware(check_lifecycle)
     await test_app({"type": "lifespan"}, mock.AsyncMock(), mock.AsyncMock())
     lifecycle_handler.handle.assert_called()
+
+
+def test_lifespan_closes_http_client(app_class):
+    app = app_class(__name__, http_client_options=HTTPClientOptions(max_connections=5))
+
+    with app.test_client():
+        (security_middleware,) = (
+            middleware
+            for middleware in app.middleware.middleware_stack
+            if isinstance(middleware, SecurityMiddleware)
+        )
+        http_client = security_middleware.http_client
+        assert http_client.options.max_connections == 5
+        client = http_client.get()
+        assert http_client.get() is client
+        assert not client.is_closed
+
+    assert client.is_closed
@@ -8,7 +8,7 @@ from connexion.middleware.swagger_ui import SwaggerUIMiddleware
 from connexion.types import Environ, ResponseStream, StartResponse, WSGIApp
 from starlette.datastructures import MutableHeaders
 
-from conftest import build_app_from_fixture
+from conftest import FIXTURES_FOLDER, build_app_from_fixture
 
 
 class TestMiddleware:
@@ -109,3 +109,43 @@ def test_add_wsgi_middleware(spec):
     app_client.post("/v1.0/greeting/robbe")
 
     mock.assert_called_once()
+
+
+def test_profile_startup(spec, app_class):
+    app = app_class(
+        __name__,
+        specification_dir=FIXTURES_FOLDER / "simple",
+        profile_startup=True,
+    )
+    app.add_api(spec)
+    app.middleware._build_middleware_stack()
+
+    report = app.middleware.startup_profiler.report()
+
+    phase_names = set()
+
+    def collect(phases):
+        for phase in phases:
+            phase_names.add(phase["name"])
+            collect(phase["children"])
+
+    collect(report["phases"])
+    assert {
+        "load_specification",
+        "validate",
+        "resolve_refs",
+        "build_middleware_stack",
+        "RoutingMiddleware",
+        "add_operation",
+    } <= phase_names
+
+    assert [total["api"] for total in report["apis"]] == [spec]
+    operations = {total["operation"] for total in report["operations"]}
+    assert "POST /greeting/{name}" in operations
+    assert all(total["allocated"] is not None for total in report["operations"])
+    assert "Slowest operations" in app.middleware.startup_profiler.format_report()
+
+
+def test_profile_startup_disabled(spec, app_class):
+    app = build_app_from_fixture("simple", app_class=app_class, spec_file=spec)
+    assert app.middleware.startup_profiler is None
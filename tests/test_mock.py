@@ -1,6 +1,7 @@
 from connexion.datastructures import NoContent
 from connexion.mock import MockResolver
 from connexion.operations import OpenAPIOperation, Swagger2Operation
+from connexion.resolver import LazyResolver
 
 
 def test_mock_resolver_default():
@@ -344,3 +345,29 @@ def test_mock_resolver_notimplemented():
         "No example response or response schema defined.",
         418,
     )
+
+
+def test_lazy_mock_resolver():
+    resolver = LazyResolver(MockResolver(mock_all=False))
+
+    operation = Swagger2Operation(
+        method="GET",
+        path="endpoint",
+        path_parameters=[],
+        operation={
+            "operationId": "fakeapi.hello.nonexistent_function",
+            "responses": {"418": {}},
+        },
+        app_produces=["application/json"],
+        app_consumes=["application/json"],
+        definitions={},
+        resolver=resolver,
+    )
+    assert operation.operation_id == "fakeapi.hello.nonexistent_function"
+    assert not operation._resolution.is_resolved
+
+    # the mock function is used instead of failing on the first request
+    assert operation._resolution.function() == (
+        "No example response or response schema defined.",
+        418,
+    )
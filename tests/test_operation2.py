@@ -417,10 +417,49 @@ def test_operation(api):
     assert operation.consumes == ["application/json"]
 
     expected_body_schema = op_spec["parameters"][0]["schema"]
-    expected_body_schema.update({"definitions": DEFINITIONS})
     assert operation.body_schema() == expected_body_schema
 
 
+def test_operation_ref_resolver(api):
+    operation = Swagger2Operation(
+        method="GET",
+        path="endpoint",
+        path_parameters=[],
+        operation=OPERATION1,
+        app_produces=["application/json"],
+        app_consumes=["application/json"],
+        definitions=DEFINITIONS,
+        resolver=Resolver(),
+    )
+
+    # The schema is not resolved, its reference is resolved by the shared resolver instead
+    assert operation.body_schema() == {"$ref": "#/definitions/new_stack"}
+    with operation.ref_resolver.resolving("#/definitions/new_stack") as resolved:
+        assert resolved == DEFINITIONS["new_stack"]
+
+
+def test_operation_with_definitions(api):
+    operation = Swagger2Operation(
+        method="GET",
+        path="endpoint",
+        path_parameters=[],
+        operation=OPERATION1,
+        app_produces=["application/json"],
+        app_consumes=["application/json"],
+        definitions=DEFINITIONS,
+        resolver=Resolver(),
+    )
+    schema = {"schema": {"$ref": "#/definitions/new_stack"}}
+
+    with pytest.deprecated_call():
+        with_definitions = operation.with_definitions(schema)
+
+    assert with_definitions == {
+        "schema": {"$ref": "#/definitions/new_stack", "definitions": DEFINITIONS}
+    }
+    assert schema == {"schema": {"$ref": "#/definitions/new_stack"}}
+
+
 def test_operation_remote_token_info():
     class MockOAuthHandler(OAuthSecurityHandler):
         """Mock."""
@@ -471,7 +510,6 @@ def test_operation_array(api):
     expected_body_schema = {
         "type": "array",
         "items": DEFINITIONS["new_stack"],
-        "definitions": DEFINITIONS,
     }
     assert operation.body_schema() == expected_body_schema
 
@@ -495,7 +533,6 @@ def test_operation_composed_definition(api):
     assert operation.consumes == ["application/json"]
 
     expected_body_schema = op_spec["parameters"][0]["schema"]
-    expected_body_schema.update({"definitions": DEFINITIONS})
     assert operation.body_schema() == expected_body_schema
 
 
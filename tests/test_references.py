@@ -1,7 +1,13 @@
 from unittest import mock
 
 import pytest
-from connexion.json_schema import RefResolutionError, resolve_refs
+from connexion import json_schema
+from connexion.json_schema import (
+    RefResolutionError,
+    break_cycles,
+    document_cache,
+    resolve_refs,
+)
 from connexion.jsonifier import Jsonifier
 
 DEFINITIONS = {
@@ -118,3 +124,103 @@ def test_resolve_ref_referring_to_another_ref(api):
     spec = resolve_refs(op_spec)
     assert spec["parameters"][0]["schema"] == expected
     assert spec["definitions"]["A"] == expected
+
+
+def test_resolve_ref_shares_referenced_object():
+    op_spec = {
+        "paths": {
+            f"/{i}": {"schema": {"$ref": "#/definitions/new_stack"}} for i in range(3)
+        },
+        "definitions": DEFINITIONS,
+    }
+
+    spec = resolve_refs(op_spec)
+    new_stack = spec["definitions"]["new_stack"]
+    assert all(path["schema"] is new_stack for path in spec["paths"].values())
+    assert spec["definitions"]["composed"]["properties"]["test"]["schema"] is new_stack
+
+
+def test_resolve_ref_with_siblings():
+    op_spec = {
+        "parameters": [
+            {"schema": {"$ref": "#/definitions/A", "description": "sibling"}},
+        ],
+        "definitions": {"A": {"type": "string"}},
+    }
+
+    spec = resolve_refs(op_spec)
+    assert spec["parameters"][0]["schema"] == {
+        "type": "string",
+        "description": "sibling",
+    }
+    assert spec["definitions"]["A"] == {"type": "string"}
+
+
+def test_resolve_recursive_ref():
+    op_spec = {
+        "parameters": [{"schema": {"$ref": "#/definitions/Node"}}],
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {"children": {"items": {"$ref": "#/definitions/Node"}}},
+            }
+        },
+    }
+
+    spec = resolve_refs(op_spec)
+    node = spec["definitions"]["Node"]
+    assert spec["parameters"][0]["schema"] is node
+    assert node["properties"]["children"]["items"] is node
+
+
+def test_break_cycles_of_recursive_ref():
+    op_spec = {
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "properties": {"children": {"items": {"$ref": "#/definitions/Node"}}},
+            }
+        },
+        "parameters": [{"schema": {"$ref": "#/definitions/Node"}}],
+    }
+
+    tree = break_cycles(resolve_refs(op_spec))
+    assert tree["definitions"]["Node"]["properties"]["children"]["items"] == {
+        "$ref": "#/definitions/Node"
+    }
+    assert tree["parameters"][0]["schema"]["properties"]["children"]["items"] == {
+        "$ref": "#/parameters/0/schema"
+    }
+    assert Jsonifier().loads(Jsonifier().dumps(tree)) == tree
+
+
+def test_resolve_circular_ref():
+    op_spec = {
+        "definitions": {
+            "A": {"$ref": "#/definitions/B"},
+            "B": {"$ref": "#/definitions/A"},
+        },
+    }
+
+    with pytest.raises(RefResolutionError):
+        resolve_refs(op_spec)
+
+
+def test_resolve_file_reference_is_cached(tmp_path, monkeypatch):
+    components = tmp_path / "components.yaml"
+    components.write_text("Name: {type: string}\n")
+    op_spec = {"schema": {"$ref": f"{components.as_uri()}#/Name"}}
+
+    document_cache.clear()
+    load_document = mock.MagicMock(wraps=json_schema.load_document)
+    monkeypatch.setattr(json_schema, "load_document", load_document)
+
+    first = resolve_refs(op_spec)
+    second = resolve_refs(op_spec)
+    assert first == second == {"schema": {"type": "string"}}
+    assert first["schema"] is not second["schema"]
+    assert load_document.call_count == 1
+
+    components.write_text("Name: {type: integer}\n")
+    assert resolve_refs(op_spec) == {"schema": {"type": "integer"}}
+    assert load_document.call_count == 2
@@ -1,8 +1,16 @@
+from unittest import mock
+
 import connexion.apps
 import pytest
 from connexion.exceptions import ResolverError
 from connexion.operations import Swagger2Operation
-from connexion.resolver import RelativeResolver, Resolver, RestyResolver
+from connexion.resolver import (
+    LazyResolver,
+    RelativeResolver,
+    Resolution,
+    Resolver,
+    RestyResolver,
+)
 
 
 def test_standard_get_function():
@@ -307,3 +315,75 @@ def test_resty_resolve_with_default_module_name_will_resolve_resource_root_post_
         resolver=RestyResolver("fakeapi"),
     )
     assert operation.operation_id == "fakeapi.hello.post"
+
+
+def test_lazy_resolver():
+    function_resolver = mock.MagicMock(
+        return_value=connexion.FlaskApp.add_error_handler
+    )
+    resolver = LazyResolver(function_resolver)
+
+    resolution = resolver.resolve(
+        Swagger2Operation(
+            method="GET",
+            path="endpoint",
+            path_parameters=[],
+            operation={"operationId": "fakeapi.hello.post_greeting"},
+            app_produces=["application/json"],
+            app_consumes=["application/json"],
+            definitions={},
+            resolver=resolver,
+        )
+    )
+    assert resolution.operation_id == "fakeapi.hello.post_greeting"
+    assert not resolution.is_resolved
+    function_resolver.assert_not_called()
+
+    assert resolution.function == connexion.FlaskApp.add_error_handler
+    assert resolution.function == connexion.FlaskApp.add_error_handler
+    assert resolution.is_resolved
+    function_resolver.assert_called_once_with("fakeapi.hello.post_greeting")
+
+
+def test_lazy_resolver_error():
+    resolution = LazyResolver().resolve(
+        Swagger2Operation(
+            method="GET",
+            path="endpoint",
+            path_parameters=[],
+            operation={"operationId": "fakeapi.module_does_not_exist.func"},
+            app_produces=["application/json"],
+            app_consumes=["application/json"],
+            definitions={},
+            resolver=Resolver(mock.MagicMock()),
+        )
+    )
+    with pytest.raises(ResolverError):
+        resolution.function
+
+
+def test_lazy_resolver_custom_resolve():
+    class PrefixResolver(Resolver):
+        def resolve(self, operation):
+            operation_id = self.resolve_operation_id(operation)
+            function = self.resolve_function_from_operation_id(
+                f"connexion.{operation_id}"
+            )
+            return Resolution(function, operation_id)
+
+    resolver = LazyResolver(PrefixResolver())
+    resolution = resolver.resolve(
+        Swagger2Operation(
+            method="GET",
+            path="endpoint",
+            path_parameters=[],
+            operation={"operationId": "FlaskApp.add_error_handler"},
+            app_produces=["application/json"],
+            app_consumes=["application/json"],
+            definitions={},
+            resolver=resolver,
+        )
+    )
+    assert resolution.operation_id == "FlaskApp.add_error_handler"
+    assert not resolution.is_resolved
+    assert resolution.function == connexion.FlaskApp.add_error_handler
@@ -1,4 +1,6 @@
+import asyncio
 import math
+import threading
 from unittest.mock import MagicMock
 
 import connexion.apps
@@ -143,3 +145,30 @@ def test_sort_apis_by_basepath():
         api4,
         api1,
     ]
+
+
+async def test_thread_pool():
+    waits = []
+    pool = utils.ThreadPool(
+        1, name="handlers", wait_hooks=[lambda *args: waits.append(args)]
+    )
+    started = threading.Event()
+    release = threading.Event()
+
+    def blocking():
+        started.set()
+        release.wait(5)
+        return "blocking"
+
+    first = asyncio.ensure_future(pool.run(blocking))
+    await asyncio.get_running_loop().run_in_executor(None, started.wait, 5)
+    # Only one function runs at once, so the second one waits for the first one
+    second = asyncio.ensure_future(pool.run(lambda x: x * 2, 21))
+    await asyncio.sleep(0.05)
+    assert not second.done()
+    release.set()
+
+    assert await first == "blocking"
+    assert await second == 42
+    assert [name for name, _ in waits] == ["handlers", "handlers"]
+    assert waits[1][1] >= 0.05
@@ -3,9 +3,13 @@ from urllib.parse import quote_plus
 
 import pytest
 from connexion.exceptions import BadRequestProblem
-from connexion.lifecycle import ConnexionRequest
+from connexion.lifecycle import ConnexionRequest, get_cookies
 from connexion.uri_parsing import Swagger2URIParser
-from connexion.validators import AbstractRequestBodyValidator, ParameterValidator
+from connexion.validators import (
+    AbstractRequestBodyValidator,
+    JSONRequestBodyValidator,
+    ParameterValidator,
+)
 from starlette.datastructures import QueryParams
 
 
@@ -161,3 +165,49 @@ async def test_stream_replay():
         ), "Replayed more messages than received, break out of while loop"
 
     assert messages == replay
+
+
+async def test_body_validator_request_encoding():
+    validator = JSONRequestBodyValidator(
+        schema={"type": "string", "maxLength": 2},
+        encoding="utf-8",
+        strict_validation=False,
+    )
+    body = '"é"'.encode("latin-1")
+    scope = {"type": "http", "headers": [(b"content-length", str(len(body)).encode())]}
+
+    async def receive():
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    receive_, _ = await validator.wrap_receive(receive, scope=scope, encoding="latin-1")
+    assert (await receive_())["body"] == body
+    # The shared validator keeps its encoding
+    assert validator._encoding == "utf-8"
+
+
+def test_cookies_parsed_once(monkeypatch):
+    cookie_parser = MagicMock(side_effect=lambda cookies: {"c1": "a", "c2": "b"})
+    monkeypatch.setattr("connexion.lifecycle.cookie_parser", cookie_parser)
+    scope = {"type": "http", "headers": [(b"cookie", b"c1=a; c2=b")]}
+
+    params = [{"name": "c1", "in": "cookie", "type": "string", "enum": ["a", "b"]}]
+    validator = ParameterValidator(params, uri_parser=Swagger2URIParser(params, {}))
+    validator.validate_request(ConnexionRequest(scope))
+    cookies = ConnexionRequest(scope).cookies
+    assert cookies == {"c1": "a", "c2": "b"}
+    assert get_cookies(scope) is cookies
+    assert cookie_parser.call_count == 1
+
+    # Changed headers are parsed again
+    scope["headers"] = [(b"cookie", b"c1=a"), (b"cookie", b"c3=c")]
+    get_cookies(scope)
+    cookie_parser.assert_called_with("c1=a; c3=c")
+
+
+def test_cookies_tolerant():
+    scope = {
+        "type": "http",
+        "headers": [(b"cookie", b'a=1; invalid{cookie}; b="quoted value"')],
+    }
+    assert get_cookies(scope) == {"a": "1", "": "invalid{cookie}", "b": "quoted value"}
+    assert get_cookies({"type": "http", "headers": []}) == {}